@@ -0,0 +1,79 @@
+"""Cold-start benchmark for quiz question banks.
+
+Generates synthetic banks of each size and times how long QuestionManager
+takes to open them and serve the first question, for the legacy JSON
+file, a JSON Lines bank (index already built) and a compiled pack.
+
+    python benchmarks/bench_questions.py --sizes 1000 10000 100000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.question_bank import write_json_lines
+from game.question_index import DIFFICULTIES
+from game.question_pack import compile_pack
+from game.questions import QuestionManager
+
+TOPICS = ('IAM', 'Lambda', 'S3', 'EC2', 'RDS', 'VPC', 'CloudWatch', 'DynamoDB')
+
+
+def synthetic_questions(count, seed=0):
+    rng = random.Random(seed)
+    for i in range(count):
+        topic = rng.choice(TOPICS)
+        options = [f"{topic} option {j}" for j in rng.sample(range(12), 4)]
+        yield {
+            'question': f"Question {i}: which statement about {topic} is correct in scenario {rng.randrange(10**6)}?",
+            'options': options,
+            'answer': options[0],
+            'explanation': f"Explanation for question {i} about {topic}.",
+            'topic': topic,
+            'difficulty': rng.choice(DIFFICULTIES),
+            'language': 'en',
+        }
+
+
+def time_open(path, repeats):
+    """Best time to open a bank and draw one question, in milliseconds"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        manager = QuestionManager(path)
+        manager.get_random_question()
+        best = min(best, (time.perf_counter() - start) * 1000.0)
+        manager.bank.close()
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'questions':>10} {'format':<7} {'bytes':>12} {'open + first question':>22}")
+        for size in args.sizes:
+            questions = list(synthetic_questions(size))
+            paths = {name: os.path.join(directory, f"bank{size}.{name}") for name in ('json', 'jsonl', 'qpack')}
+            with open(paths['json'], 'w') as f:
+                json.dump({'questions': questions}, f)
+            write_json_lines(questions, paths['jsonl'])
+            compile_pack(questions, paths['qpack'])
+            QuestionManager(paths['jsonl']).bank.close()  # build the offset index up front
+
+            for name, path in paths.items():
+                ms = time_open(path, args.repeats)
+                print(f"{size:>10,} {name:<7} {os.path.getsize(path):>12,} {ms:>19.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
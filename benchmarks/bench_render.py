@@ -0,0 +1,63 @@
+"""Frame-time benchmark for SnakeLadderGame rendering.
+
+Runs headless with the SDL dummy video driver and prints the mean and
+p95 time of draw_board and of one full frame.
+
+    python benchmarks/bench_render.py --frames 600
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.simple_game import SnakeLadderGame
+from game.simple_menu import SimpleMenu
+from game.text_cache import text_cache
+
+
+def time_frames(draw, frames):
+    timings = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        draw()
+        timings.append((time.perf_counter() - start) * 1000.0)
+    timings.sort()
+    return sum(timings) / len(timings), timings[int(len(timings) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--players', type=int, default=4)
+    args = parser.parse_args()
+
+    game = SnakeLadderGame(args.players)
+    colors = {'RED': game.RED, 'GOLD': game.GOLD, 'BEIGE': game.BEIGE,
+              'WHITE': game.WHITE, 'BLACK': game.BLACK, 'DARK_RED': game.DARK_RED}
+    menu = SimpleMenu(game.screen, game.font, game.big_font, colors)
+
+    def draw_game_frame():
+        game.invalidate()  # measure full repaints, not skipped idle frames
+        game.draw()
+
+    def draw_menu_frame():
+        menu.clock.tick()
+        menu.update()
+        menu.draw()
+
+    draw_game_frame()  # warm-up frame builds any cached layers
+    for name, draw in (('SnakeLadderGame.draw_board', game.draw_board),
+                       ('SnakeLadderGame.draw', draw_game_frame),
+                       ('SimpleMenu.draw', draw_menu_frame)):
+        mean, p95 = time_frames(draw, args.frames)
+        print(f"{name:<27} mean {mean:6.2f} ms  p95 {p95:6.2f} ms  ({args.frames} frames)")
+
+    stats = text_cache.stats()
+    print(f"Text cache: {stats['hits']} hits, {stats['misses']} misses, {stats['hit_rate']:.1%} hit rate")
+
+
+if __name__ == '__main__':
+    main()
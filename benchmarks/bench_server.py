@@ -0,0 +1,148 @@
+"""Load test for game.server with headless bots.
+
+Starts the server in a subprocess, fills the requested number of rooms
+with Bot connections, lets them play for a while (each bot waits a
+random 0-2x --think seconds before rolling, and rejoins a fresh room
+when a game ends) and reports the time from a ROLL being sent to each
+seat receiving the MOVED result.
+
+    python benchmarks/bench_server.py --rooms 10000 --players 1 --think 1
+    python benchmarks/bench_server.py --rooms 2000 --players 4
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.client import Bot
+from game.server import raise_open_file_limit
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port):
+    server = subprocess.Popen([sys.executable, '-m', 'game.server', '--port', str(port)],
+                              cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              stdout=subprocess.PIPE, text=True)
+    line = server.stdout.readline()
+    if not line.startswith('Serving'):
+        server.kill()
+        raise RuntimeError("game server did not start")
+    return server
+
+
+def cpu_seconds(pid):
+    """User + system CPU time of a process in seconds (Linux), or None"""
+    try:
+        with open(f'/proc/{pid}/stat') as f:
+            fields = f.read().rsplit(')', 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def resident_mb(pid):
+    """Resident memory of a process in MB (Linux), or None"""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    return None
+
+
+async def run_bots(port, rooms, players, think, warmup, duration, batch, server_pid=None):
+    loop = asyncio.get_running_loop()
+    roll_times = {}
+    latencies = []
+    rng = random.Random(0)
+    bots = []
+    start = time.perf_counter()
+    for first in range(0, rooms * players, batch):
+        group = [Bot(players, roll_times, latencies, think, random.Random(rng.random()))
+                 for _ in range(min(batch, rooms * players - first))]
+        await asyncio.gather(*(loop.create_connection(lambda bot=bot: bot, '127.0.0.1', port) for bot in group))
+        bots += group
+    connect_time = time.perf_counter() - start
+
+    await asyncio.sleep(warmup)
+    latencies.clear()
+    moves_before = sum(bot.moves for bot in bots)
+    games_before = sum(bot.games for bot in bots)
+    cpu_before = cpu_seconds(server_pid) if server_pid else None
+    await asyncio.sleep(duration)
+    cpu_after = cpu_seconds(server_pid) if server_pid else None
+    server_cpu = None if cpu_before is None or cpu_after is None else (cpu_after - cpu_before) / duration
+    samples = np.array(latencies) * 1000.0
+    moves = sum(bot.moves for bot in bots) - moves_before
+    games = sum(bot.games for bot in bots) - games_before
+    seated = sum(bot.seat is not None for bot in bots)
+    for bot in bots:
+        if bot.transport is not None:
+            bot.transport.close()
+    return connect_time, samples, moves, games, seated, server_cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rooms', type=int, default=1000)
+    parser.add_argument('--players', type=int, default=2, help="seats per room")
+    parser.add_argument('--think', type=float, default=1.0, help="mean seconds a bot waits before rolling")
+    parser.add_argument('--warmup', type=float, default=3.0)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--batch', type=int, default=500, help="connections opened per event-loop pass")
+    parser.add_argument('--port', type=int, default=None, help="use a server already running on this port")
+    args = parser.parse_args()
+
+    limit = raise_open_file_limit()
+    connections = args.rooms * args.players
+    if connections + 100 > limit:
+        parser.error(f"{connections:,} connections exceed the open file limit of {limit:,}")
+
+    server = None
+    port = args.port
+    if port is None:
+        port = free_port()
+        server = start_server(port)
+    try:
+        connect_time, samples, moves, games, seated, server_cpu = asyncio.run(
+            run_bots(port, args.rooms, args.players, args.think, args.warmup, args.duration, args.batch,
+                     server.pid if server else None))
+        memory = resident_mb(server.pid) if server else None
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    print(f"{args.rooms:,} rooms x {args.players} seats: {connections:,} connections opened in {connect_time:.2f}s, "
+          f"{seated:,} seated at the end")
+    print(f"{moves / args.duration:,.0f} moves/s, {samples.size / args.duration:,.0f} MOVED deliveries/s, "
+          f"{games / args.duration:,.1f} seats finished a game per second")
+    if memory is not None:
+        print(f"server resident memory: {memory:,.0f} MB")
+    if server_cpu is not None:
+        print(f"server CPU: {server_cpu:.0%} of one core (the bots share this machine)")
+    if samples.size:
+        values = np.percentile(samples, PERCENTILES)
+        report = ", ".join(f"p{p:g} {v:.2f}" for p, v in zip(PERCENTILES, values))
+        print(f"ROLL -> MOVED latency (ms): {report}, max {samples.max():.2f}")
+
+
+if __name__ == '__main__':
+    main()
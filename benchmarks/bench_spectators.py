@@ -0,0 +1,150 @@
+"""Spectator broadcast benchmark: one room, many watchers.
+
+Runs a game server in this process with two bots playing one room and
+--spectators watching it, then reports the bytes each spectator
+receives per turn and the server CPU time spent on spectator broadcast.
+It compares the per-tick keyframe/delta stream against the obvious
+approach: a JSON snapshot of the full state encoded and sent to every
+spectator after every move.
+
+    python benchmarks/bench_spectators.py --spectators 1000 --duration 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import protocol
+from game.board_file import DEFAULT_BOARD_FILE, load_board_file
+from game.client import Bot, Spectator
+from game.server import TICK_SECONDS, GameServer, PlayerConnection, raise_open_file_limit
+
+
+def full_state_json(state):
+    """The state as a client-friendly JSON object, the way a naive server would send it"""
+    return json.dumps({'player_positions': list(state.positions), 'current_player': state.current_player,
+                       'dice_value': state.dice_value, 'animation_steps': list(state.path),
+                       'game_over': state.game_over, 'winner': state.winner}).encode('utf-8')
+
+
+async def run(spectator_count, players, think, duration):
+    loop = asyncio.get_running_loop()
+    server = GameServer(load_board_file(DEFAULT_BOARD_FILE), seed=1)
+    connections = []
+
+    def connection():
+        conn = PlayerConnection(server)
+        connections.append(conn)
+        return conn
+
+    listener = await loop.create_server(connection, '127.0.0.1', 0, backlog=4096)
+    port = listener.sockets[0].getsockname()[1]
+    ticks = asyncio.create_task(server.run_ticks())
+
+    roll_times, latencies = {}, []
+    bots = [Bot(players, roll_times, latencies, think) for _ in range(players)]
+    for bot in bots:
+        await loop.create_connection(lambda bot=bot: bot, '127.0.0.1', port)
+    while bots[0].room_id is None:
+        await asyncio.sleep(0.01)
+
+    spectators = [Spectator(bots[0].room_id) for _ in range(spectator_count)]
+    for first in range(0, spectator_count, 500):
+        await asyncio.gather(*(loop.create_connection(lambda s=s: s, '127.0.0.1', port)
+                               for s in spectators[first:first + 500]))
+    await asyncio.sleep(1.0)
+
+    # Batched deltas and keyframes, as the server sends them
+    moves_before = sum(bot.moves for bot in bots)
+    bytes_before = sum(s.bytes for s in spectators)
+    cpu_before = server.broadcast_seconds
+    watched = {}  # room id -> room, kept after the server forgets a finished room
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        await asyncio.sleep(0.05)
+        if spectators[0].closed and bots[0].room_id:
+            # The game ended: follow the bots to their next room (late joiners get a keyframe)
+            for s in spectators:
+                s.watch(bots[0].room_id)
+        room_id = spectators[0].room_id
+        if room_id in server.rooms:
+            watched[room_id] = server.rooms[room_id]
+    elapsed = time.perf_counter() - start
+    turns = sum(bot.moves for bot in bots) - moves_before
+    delta_bytes = sum(s.bytes for s in spectators) - bytes_before
+    delta_cpu = server.broadcast_seconds - cpu_before
+
+    # Settle before comparing: no more rolls, rolls already sent are played,
+    # and one last tick sends spectators the final changes
+    for bot in bots:
+        bot.stop()
+    await asyncio.sleep(0.5)
+    ticks.cancel()
+    for s in spectators:
+        if s.room_id in server.rooms:
+            watched[s.room_id] = server.rooms[s.room_id]
+    server.tick()
+    await asyncio.sleep(1.0)
+    views = [s.view for s in spectators]
+    in_sync = sum(s.room_id in watched and s.view.state == watched[s.room_id].snapshot() for s in spectators)
+
+    # The naive alternative on the same sockets: full JSON state, encoded per spectator, after every move
+    room = watched.get(spectators[0].room_id)
+    state = room.snapshot() if room else protocol.GameState((1,) * players, 0, 1, (2, 3, 4), False, None)
+    watchers = [conn for conn in connections if conn.watching is not None] or connections
+    naive_start = time.perf_counter()
+    for _ in range(turns):
+        for conn in watchers:
+            conn.send(protocol.frame(0, full_state_json(state)))
+    naive_cpu = time.perf_counter() - naive_start
+    naive_bytes = len(protocol.frame(0, full_state_json(state)))
+    await asyncio.sleep(0.5)
+
+    for transport_owner in bots + spectators:
+        if transport_owner.transport is not None:
+            transport_owner.transport.close()
+    listener.close()
+    return {
+        'elapsed': elapsed, 'turns': turns, 'delta_bytes': delta_bytes, 'delta_cpu': delta_cpu,
+        'naive_cpu': naive_cpu, 'naive_bytes': naive_bytes,
+        'keyframe_bytes': len(protocol.keyframe(0, state)),
+        'keyframes': sum(v.keyframes for v in views), 'deltas': sum(v.deltas for v in views),
+        'out_of_sync': sum(v.out_of_sync for v in views),
+        'in_sync': in_sync,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--spectators', type=int, default=1000)
+    parser.add_argument('--players', type=int, default=4)
+    parser.add_argument('--think', type=float, default=0.05, help="mean seconds a bot waits before rolling")
+    parser.add_argument('--duration', type=float, default=10.0)
+    args = parser.parse_args()
+
+    limit = raise_open_file_limit()
+    if 2 * (args.spectators + args.players) + 100 > limit:
+        parser.error(f"{args.spectators:,} spectators exceed the open file limit of {limit:,}")
+
+    r = asyncio.run(run(args.spectators, args.players, args.think, args.duration))
+    turns = max(r['turns'], 1)
+    spectators = args.spectators
+    print(f"{args.spectators:,} spectators, {args.players} players, {r['turns']:,} turns in {r['elapsed']:.1f}s "
+          f"({TICK_SECONDS * 1000:.0f} ms ticks)")
+    print(f"frames received: {r['keyframes']:,} keyframes, {r['deltas']:,} deltas, "
+          f"{r['out_of_sync']} out of sequence")
+    print(f"spectators matching the watched room's state at the end: {r['in_sync']:,}/{spectators:,}")
+    print(f"{'':24}{'bytes/turn/spectator':>22}{'broadcast CPU/turn':>20}{'CPU/s':>10}")
+    print(f"{'keyframes + deltas':24}{r['delta_bytes'] / turns / spectators:>22.1f}"
+          f"{r['delta_cpu'] / turns * 1000:>17.2f} ms{r['delta_cpu'] / r['elapsed']:>10.1%}")
+    print(f"{'full JSON per move':24}{r['naive_bytes']:>22.1f}"
+          f"{r['naive_cpu'] / turns * 1000:>17.2f} ms{r['naive_cpu'] / r['elapsed']:>10.1%}")
+    print(f"keyframe size: {r['keyframe_bytes']} bytes")
+
+
+if __name__ == '__main__':
+    main()
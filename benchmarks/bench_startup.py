@@ -0,0 +1,58 @@
+"""Time from a menu selection to the first game frame on screen.
+
+Builds a GameController headlessly (SDL dummy video driver), then
+repeatedly starts a game the way the menu does and draws and pushes its
+first frame. The first start pays for anything built lazily; the
+following ones show the cost of every later game.
+
+    python benchmarks/bench_startup.py --games 20
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ['SNAKE_LADDER_REPLAYS'] = ''
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from main import GameController
+
+
+def first_frame_ms(controller, players, quiz):
+    start = time.perf_counter()
+    controller.start_game(players, quiz)
+    controller.draw()
+    elapsed = (time.perf_counter() - start) * 1000.0
+    controller.end_game()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=20)
+    parser.add_argument('--players', type=int, default=4)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    controller = GameController()
+    print(f"{'GameController()':<24} {(time.perf_counter() - start) * 1000.0:8.1f} ms")
+
+    for name, quiz in (('SnakeLadderGame', False), ('CloudLadderGame', True)):
+        first = first_frame_ms(controller, args.players, quiz)
+        timings = sorted(first_frame_ms(controller, args.players, quiz) for _ in range(args.games))
+        mean = sum(timings) / len(timings)
+        p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+        print(f"{name:<24} first {first:8.1f} ms  then mean {mean:6.2f} ms  p95 {p95:6.2f} ms  ({args.games} games)")
+
+    if controller.question_future:
+        controller.question_future.result()
+    if controller.question_screen:
+        controller.question_screen.close()
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""Time-based animation: a shared clock, tweens and easing curves.
+
+Every animation measures seconds on an AnimationClock instead of
+counting frames, so a game runs at the same speed at 30, 60 or 144 FPS,
+and a frame that arrives late just shows a later point of the motion.
+GameController ticks one clock at the start of each frame and hands it
+to the menu and the games; anything started during the frame begins at
+that frame's time.
+
+    clock = AnimationClock()
+    hop = PathTween(clock, [4, 5, 6, 14], step_seconds=1 / 3)
+    ...
+    clock.tick()
+    square, next_square, fraction = hop.position()
+"""
+import time
+
+# Slow frames advance animations by the full time they took, so a loaded
+# machine skips frames instead of slowing the game. Only a stall longer
+# than this (a suspended laptop, a debugger pause) is cut short, so
+# nothing ends before it was seen
+MAX_FRAME_SECONDS = 5.0
+
+
+def linear(t):
+    return t
+
+
+def ease_in_out(t):
+    """Smoothstep: starts and ends at rest"""
+    return t * t * (3.0 - 2.0 * t)
+
+
+def ease_out(t):
+    """Cubic: fast start, settles at the end"""
+    return 1.0 - (1.0 - t) ** 3
+
+
+class AnimationClock:
+    """Animation time in seconds, advanced once per frame.
+
+    speed scales playback (replays use it to run faster than real time);
+    source is the monotonic time function, replaceable for headless runs.
+    dt is the real time since the last tick, however long the frame took,
+    up to the MAX_FRAME_SECONDS stall guard.
+    """
+
+    def __init__(self, speed=1.0, source=time.monotonic):
+        self.speed = speed
+        self.source = source
+        self.last = source()
+        self.now = 0.0
+        self.dt = 0.0
+
+    def tick(self):
+        """Advance to the current time; returns the seconds of animation since the last tick"""
+        current = self.source()
+        self.dt = min(current - self.last, MAX_FRAME_SECONDS) * self.speed
+        self.last = current
+        self.now += self.dt
+        return self.dt
+
+
+class Tween:
+    """Progress from 0 to 1 over duration seconds of clock time, from now"""
+
+    def __init__(self, clock, duration, easing=linear):
+        self.clock = clock
+        self.start = clock.now
+        self.duration = duration
+        self.easing = easing
+
+    @property
+    def elapsed(self):
+        return self.clock.now - self.start
+
+    @property
+    def done(self):
+        return self.elapsed >= self.duration
+
+    @property
+    def progress(self):
+        if self.duration <= 0:
+            return 1.0
+        return min(1.0, max(0.0, self.elapsed / self.duration))
+
+    @property
+    def value(self):
+        return self.easing(self.progress)
+
+
+class PathTween(Tween):
+    """Travel along a list of squares, easing each hop over step_seconds"""
+
+    def __init__(self, clock, path, step_seconds, easing=ease_in_out):
+        super().__init__(clock, step_seconds * (len(path) - 1))
+        self.path = list(path)
+        self.step_seconds = step_seconds
+        self.hop_easing = easing
+
+    def position(self):
+        """(square, next square, eased fraction of the hop between them)"""
+        path = self.path
+        if len(path) < 2 or self.done:
+            return path[-1], path[-1], 0.0
+        hops = max(0.0, self.elapsed / self.step_seconds)
+        index = min(int(hops), len(path) - 2)
+        return path[index], path[index + 1], self.hop_easing(min(1.0, hops - index))
+
+    @property
+    def square(self):
+        """The square the traveller is on, or about to land on"""
+        square, next_square, fraction = self.position()
+        return next_square if fraction >= 0.5 else square
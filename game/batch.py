@@ -0,0 +1,195 @@
+"""Vectorized batch simulation of many Snake and Ladder games at once.
+
+Every game in a batch is a column of NumPy arrays: dice rolls, jump
+lookups through the board's transition table, the exact-finish
+overshoot rule and the win bookkeeping are all array operations, so
+millions of games run in seconds on one core.
+
+    python -m game.batch --games 1000000 --players 4
+"""
+import argparse
+import time
+
+import numpy as np
+
+from game.engine import Board
+
+
+class BatchResult:
+    """Aggregated statistics for a batch of simulated games"""
+
+    def __init__(self, board, num_players):
+        self.board = board
+        self.num_players = num_players
+        self.num_games = 0
+        self.unfinished = 0
+        # length_histogram[n] = games that ended on the n-th dice roll (all seats counted)
+        self.length_histogram = np.zeros(1, dtype=np.int64)
+        self.seat_wins = np.zeros(num_players, dtype=np.int64)
+        self.landing_counts = np.zeros(board.last_square + 1, dtype=np.int64)
+
+    def record_wins(self, length, seat, count):
+        if length >= len(self.length_histogram):
+            grown = np.zeros(max(length + 1, 2 * len(self.length_histogram)), dtype=np.int64)
+            grown[:len(self.length_histogram)] = self.length_histogram
+            self.length_histogram = grown
+        self.length_histogram[length] += count
+        self.seat_wins[seat] += count
+
+    def merge(self, other):
+        """Fold another result for the same board and player count into this one"""
+        if other.num_players != self.num_players:
+            raise ValueError("Cannot merge results for different player counts")
+        size = max(len(self.length_histogram), len(other.length_histogram))
+        merged = np.zeros(size, dtype=np.int64)
+        merged[:len(self.length_histogram)] += self.length_histogram
+        merged[:len(other.length_histogram)] += other.length_histogram
+        self.length_histogram = merged
+        self.num_games += other.num_games
+        self.unfinished += other.unfinished
+        self.seat_wins += other.seat_wins
+        self.landing_counts += other.landing_counts
+        return self
+
+    @property
+    def finished(self):
+        return self.num_games - self.unfinished
+
+    @property
+    def win_rates(self):
+        return self.seat_wins / max(self.finished, 1)
+
+    @property
+    def mean_length(self):
+        turns = np.arange(len(self.length_histogram))
+        return float((turns * self.length_histogram).sum() / max(self.finished, 1))
+
+    def length_percentile(self, q):
+        """Dice rolls needed to finish the given fraction (0..1) of the finished games"""
+        cumulative = np.cumsum(self.length_histogram)
+        return int(np.searchsorted(cumulative, q * cumulative[-1]))
+
+    @property
+    def ladder_hits(self):
+        return {start: int(self.landing_counts[start]) for start in sorted(self.board.ladders)}
+
+    @property
+    def snake_hits(self):
+        return {start: int(self.landing_counts[start]) for start in sorted(self.board.snakes)}
+
+    def summary(self):
+        lines = [
+            f"Games: {self.num_games:,} ({self.unfinished:,} unfinished)",
+            f"Dice rolls per game: mean {self.mean_length:.2f}, "
+            f"median {self.length_percentile(0.5)}, p95 {self.length_percentile(0.95)}",
+            "Win rate by seat: " + ", ".join(
+                f"P{seat + 1} {rate:.2%}" for seat, rate in enumerate(self.win_rates)),
+            "Ladder hits: " + ", ".join(f"{start}:{hits:,}" for start, hits in self.ladder_hits.items()),
+            "Snake hits: " + ", ".join(f"{start}:{hits:,}" for start, hits in self.snake_hits.items()),
+        ]
+        return "\n".join(lines)
+
+
+# Each roll is one random byte; bytes at or above ROLL_LIMIT are re-drawn
+# so that every face of the die stays exactly equally likely.
+ROLL_LIMIT = 252
+
+
+def build_step_table(board):
+    """Flat table mapping (square << 8 | random byte) to the next square.
+
+    The table folds the die, the overshoot rule and the ladder/snake jump
+    into a single lookup. Two extra states follow the last square:
+    ``done`` for games that are over and ``reroll`` for rejected bytes.
+    """
+    last = board.last_square
+    done, reroll = last + 1, last + 2
+    dtype = np.uint16 if (reroll + 1) << 8 <= 1 << 16 else np.uint32
+    jumps = np.array(board.jump_table() + [done, reroll], dtype=dtype)
+
+    squares = np.arange(reroll + 1, dtype=np.int64)[:, None]
+    rolls = np.arange(256, dtype=np.int64)[None, :] % 6 + 1
+    target = squares + rolls
+    step = np.where(target <= last, jumps[np.minimum(target, last)], squares)
+    step[:, ROLL_LIMIT:] = reroll
+    step[last:] = done
+    # landing[k] is the square a token lands on before any jump (0 = no landing)
+    landing = np.where(target <= last, target, 0)
+    landing[:, ROLL_LIMIT:] = 0
+    landing[last:] = 0
+    return step.astype(dtype).ravel(), landing.ravel(), dtype, done, reroll
+
+
+def simulate_chunk(num_games, num_players, board, rng, max_rounds, result):
+    """Play num_games games to completion and add them to result"""
+    last = board.last_square
+    step, landing, dtype, done, reroll = build_step_table(board)
+    transitions = np.zeros(step.size, dtype=np.int64)
+
+    # One row per seat; columns are games (finished ones hold ``done``)
+    positions = np.ones((num_players, num_games), dtype=dtype)
+    active = num_games
+
+    for round_index in range(max_rounds):
+        for seat in range(num_players):
+            keys = (positions[seat] << 8) | np.frombuffer(rng.bytes(positions.shape[1]), dtype=np.uint8)
+            moved = step.take(keys)
+            transitions += np.bincount(keys, minlength=step.size)
+
+            rejected = np.flatnonzero(moved == reroll)
+            while rejected.size:
+                retry = (positions[seat, rejected] << 8) | rng.integers(0, ROLL_LIMIT, size=rejected.size, dtype=dtype)
+                moved[rejected] = step.take(retry)
+                transitions += np.bincount(retry, minlength=step.size)
+                rejected = rejected[moved[rejected] == reroll]
+            positions[seat] = moved
+
+            winners = np.flatnonzero(moved == last)
+            if winners.size:
+                result.record_wins(round_index * num_players + seat + 1, seat, winners.size)
+                positions[:, winners] = done
+                active -= winners.size
+
+        if active == 0:
+            break
+        # Drop finished games once they make up most of the arrays
+        if active < positions.shape[1] // 2:
+            positions = positions[:, positions[0] != done]
+
+    result.num_games += num_games
+    result.unfinished += active
+    result.landing_counts += np.bincount(landing, weights=transitions, minlength=last + 1)[:last + 1].astype(np.int64)
+    return result
+
+
+def simulate_games(num_games, num_players=1, board=None, seed=None, max_rounds=10000, chunk_size=1000000):
+    """Simulate num_games independent games and return a BatchResult"""
+    board = board if board is not None else Board()
+    rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+    result = BatchResult(board, num_players)
+
+    remaining = num_games
+    while remaining > 0:
+        chunk = min(chunk_size, remaining)
+        simulate_chunk(chunk, num_players, board, rng, max_rounds, result)
+        remaining -= chunk
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate Snake and Ladder games in bulk")
+    parser.add_argument('--games', type=int, default=1000000)
+    parser.add_argument('--players', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    result = simulate_games(args.games, args.players, seed=args.seed)
+    elapsed = time.perf_counter() - start
+
+    print(result.summary())
+    print(f"Simulated in {elapsed:.2f}s ({args.games / elapsed:,.0f} games/sec)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,298 @@
+"""Boards loaded from JSON files.
+
+A board file describes one board: its size, snakes, ladders and an
+optional color theme that overrides the game's palette::
+
+    {
+      "name": "Classic",
+      "rows": 10, "columns": 10,
+      "ladders": {"4": 14, "9": 31},
+      "snakes": {"16": 6, "47": 26},
+      "theme": {"BEIGE": [245, 245, 220]}
+    }
+
+Loading validates the layout (jumps go the right way, never start on the
+last square, never chain into another jump or loop, and every game can
+still finish) and precomputes the jump table, the tile positions and the
+single-token finish distribution behind the expected game length. Those
+are cached next to the file as ``<board>.cache.npz``, keyed by a hash of
+the file contents, so a board that has been loaded once opens again
+without validating or walking the Markov chain.
+
+    python -m game.board_file check boards/*.json
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from collections import deque
+
+import numpy as np
+
+from game.board_layout import BOARD_AREA, MAX_CELL_SIZE, MIN_CELL_SIZE, BoardLayout
+from game.engine import BOARD_COLUMNS, BOARD_ROWS, Board
+from game.markov import BoardAnalysis, single_token_walk, successor_table
+
+BOARDS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'boards')
+DEFAULT_BOARD_FILE = os.path.join(BOARDS_DIR, 'classic.json')
+CACHE_VERSION = 1
+
+# Palette entries a theme may override, across both games
+THEME_COLORS = ('RED', 'GOLD', 'BEIGE', 'WHITE', 'BLACK', 'DARK_RED', 'GREEN', 'BLUE',
+                'PURPLE', 'SHADOW', 'LIGHT_BLUE', 'ORANGE')
+
+
+class BoardFileError(ValueError):
+    """A board file that cannot be played; problems lists every rule it breaks"""
+
+    def __init__(self, path, problems):
+        self.path = path
+        self.problems = list(problems)
+        super().__init__(f"{path}: " + "; ".join(self.problems))
+
+
+def find_problems(board):
+    """Every layout rule board breaks, as readable messages (empty when playable)"""
+    problems = []
+    last = board.last_square
+    starts = {}
+    for kind, jumps in (('ladder', board.ladders), ('snake', board.snakes)):
+        for start, end in sorted(jumps.items()):
+            if start == last:
+                problems.append(f"{kind} {start} -> {end} starts on the last square")
+            if kind == 'ladder' and end <= start:
+                problems.append(f"ladder {start} -> {end} does not go up")
+            if kind == 'snake' and end >= start:
+                problems.append(f"snake {start} -> {end} does not go down")
+            if start in starts:
+                problems.append(f"square {start} starts both a {starts[start]} and a {kind}")
+            starts[start] = kind
+
+    jumps = {**board.snakes, **board.ladders}
+    reported = set()
+    for start in sorted(jumps):
+        # Follow the jumps from this square; meeting a square twice is a loop
+        path = [start]
+        square = jumps[start]
+        while square in jumps and square not in path:
+            path.append(square)
+            square = jumps[square]
+        if square in path:
+            loop = path[path.index(square):]
+            if frozenset(loop) not in reported:
+                reported.add(frozenset(loop))
+                problems.append("jumps loop forever: " + " -> ".join(map(str, loop + [square])))
+        elif len(path) > 1:
+            problems.append(f"{starts[start]} {start} -> {jumps[start]} lands on the start of another jump")
+
+    if not problems:
+        problems.extend(find_traps(board))
+    return problems
+
+
+def find_traps(board):
+    """Squares a token can reach but never leave for the last square"""
+    successors = successor_table(board)
+    last = board.last_square
+    reachable = np.zeros(last + 1, dtype=bool)
+    reachable[1] = True
+    queue = deque([1])
+    while queue:
+        for square in successors[queue.popleft()].tolist():
+            if not reachable[square]:
+                reachable[square] = True
+                queue.append(square)
+    if not reachable[last]:
+        return ["the last square cannot be reached from square 1"]
+
+    # Walk backwards from the finish over the same moves
+    sources = np.repeat(np.arange(last + 1), successors.shape[1])
+    targets = successors.ravel()
+    order = np.argsort(targets, kind='stable')
+    predecessors = sources[order].tolist()
+    bounds = np.searchsorted(targets[order], np.arange(last + 2)).tolist()
+    finishes = np.zeros(last + 1, dtype=bool)
+    finishes[last] = True
+    queue = deque([last])
+    while queue:
+        square = queue.popleft()
+        for previous in predecessors[bounds[square]:bounds[square + 1]]:
+            if not finishes[previous]:
+                finishes[previous] = True
+                queue.append(previous)
+    trapped = np.flatnonzero(reachable & ~finishes)
+    if trapped.size:
+        shown = ", ".join(map(str, trapped[:10].tolist()))
+        return [f"tokens on squares {shown} can never finish"]
+    return []
+
+
+class BoardFile:
+    """A board with its theme and precomputed data, ready for the games.
+
+    Build one with load_board_file() or open_board(); a BoardFile wrapping
+    a plain Board (no path) computes its finish distribution on first use.
+    """
+
+    def __init__(self, board, name="Custom", theme=None, corners=None, finish=None, path=None, digest=None):
+        self.board = board
+        self.name = name
+        self.theme = dict(theme or {})
+        self.corners = corners
+        self.finish = finish
+        self.path = path
+        self.digest = digest
+
+    def layout(self):
+        """BoardLayout for the default board area, from the cached tile positions when present"""
+        return BoardLayout(self.board.rows, self.board.columns, corners=self.corners)
+
+    def finish_distribution(self):
+        """finish[t]: probability a lone token reaches the last square on exactly roll t"""
+        if self.finish is None:
+            self.finish, _ = single_token_walk(self.board)
+        return self.finish
+
+    @property
+    def expected_rolls(self):
+        """Expected number of rolls for one token to finish alone"""
+        finish = self.finish_distribution()
+        return float(np.dot(np.arange(len(finish)), finish))
+
+    def analysis(self, num_players=1):
+        """BoardAnalysis built from the precomputed finish distribution"""
+        if not 1 <= num_players <= 4:
+            raise ValueError("num_players must be between 1 and 4")
+        return BoardAnalysis(self.board, num_players, self.finish_distribution())
+
+
+def cache_path(path):
+    return path + '.cache.npz'
+
+
+def layout_signature():
+    return np.array([CACHE_VERSION, *BOARD_AREA, MAX_CELL_SIZE, MIN_CELL_SIZE], dtype=np.int64)
+
+
+def board_data(board, name=None, theme=None):
+    """The board-file JSON object describing board (the inverse of parse_board)"""
+    data = {'rows': board.rows, 'columns': board.columns,
+            'ladders': {str(start): end for start, end in sorted(board.ladders.items())},
+            'snakes': {str(start): end for start, end in sorted(board.snakes.items())}}
+    if name is not None:
+        data = {'name': name, **data}
+    if theme:
+        data['theme'] = {color: list(value) for color, value in theme.items()}
+    return data
+
+
+def parse_board(data, path):
+    """(Board, name, theme) from decoded board-file JSON; raises BoardFileError"""
+    if not isinstance(data, dict):
+        raise BoardFileError(path, ["expected a JSON object"])
+    try:
+        rows = int(data.get('rows', BOARD_ROWS))
+        columns = int(data.get('columns', BOARD_COLUMNS))
+        ladders = {int(start): int(end) for start, end in data.get('ladders', {}).items()}
+        snakes = {int(start): int(end) for start, end in data.get('snakes', {}).items()}
+    except (TypeError, ValueError, AttributeError) as error:
+        raise BoardFileError(path, [f"bad size or jump: {error}"])
+
+    theme = {}
+    problems = []
+    for name, color in data.get('theme', {}).items():
+        if name not in THEME_COLORS:
+            problems.append(f"unknown theme color {name}")
+        elif (not isinstance(color, list) or len(color) != 3
+              or not all(isinstance(c, int) and 0 <= c <= 255 for c in color)):
+            problems.append(f"theme color {name} must be [r, g, b] with values 0-255")
+        else:
+            theme[name] = tuple(color)
+    if problems:
+        raise BoardFileError(path, problems)
+
+    try:
+        board = Board(ladders, snakes, rows, columns)
+    except ValueError as error:
+        raise BoardFileError(path, [str(error)])
+    name = str(data.get('name', os.path.splitext(os.path.basename(path))[0]))
+    return board, name, theme
+
+
+def load_board_file(path):
+    """Load, validate and precompute a board file, reusing its cache when the contents match"""
+    with open(path, 'rb') as f:
+        content = f.read()
+    digest = hashlib.sha256(content).hexdigest()
+    try:
+        data = json.loads(content)
+    except ValueError as error:
+        raise BoardFileError(path, [f"not valid JSON: {error}"])
+    board, name, theme = parse_board(data, path)
+
+    try:
+        with np.load(cache_path(path)) as cached:
+            if str(cached['digest']) == digest and np.array_equal(cached['layout'], layout_signature()):
+                # Validated when the cache was written
+                board = Board(board.ladders, board.snakes, board.rows, board.columns, jumps=cached['jumps'].tolist())
+                return BoardFile(board, name, theme, cached['corners'], cached['finish'], path, digest)
+    except (OSError, KeyError, ValueError):
+        pass
+
+    problems = find_problems(board)
+    if problems:
+        raise BoardFileError(path, problems)
+    board_file = BoardFile(board, name, theme, path=path, digest=digest)
+    board_file.corners = board_file.layout().corners
+    board_file.finish_distribution()
+    try:
+        with open(cache_path(path), 'wb') as f:
+            np.savez(f, digest=np.array(digest), layout=layout_signature(),
+                     jumps=np.array(board.jumps, dtype=np.int32),
+                     corners=board_file.corners, finish=board_file.finish)
+    except OSError:
+        pass  # read-only location: precompute again next time
+    return board_file
+
+
+def open_board(board=None):
+    """BoardFile for a Board, a board file path or a BoardFile; None opens the classic board file"""
+    if isinstance(board, BoardFile):
+        return board
+    if isinstance(board, Board):
+        return BoardFile(board)
+    return load_board_file(board if board is not None else DEFAULT_BOARD_FILE)
+
+
+def check_command(args):
+    """Validate board files and warm their caches"""
+    failed = 0
+    for path in args.boards:
+        start = time.perf_counter()
+        try:
+            board_file = load_board_file(path)
+        except (OSError, BoardFileError) as error:
+            print(f"FAIL {error}")
+            failed += 1
+            continue
+        board = board_file.board
+        elapsed = (time.perf_counter() - start) * 1000.0
+        print(f"ok   {path}: {board_file.name}, {board.rows}x{board.columns}, "
+              f"{len(board.ladders)} ladders, {len(board.snakes)} snakes, "
+              f"{board_file.expected_rolls:.1f} rolls expected ({elapsed:.1f} ms)")
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Board file tools")
+    commands = parser.add_subparsers(dest='command', required=True)
+    check_parser = commands.add_parser('check', help="validate board files and build their caches")
+    check_parser.add_argument('boards', nargs='+', help="board .json files")
+    check_parser.set_defaults(run=check_command)
+    args = parser.parse_args()
+    raise SystemExit(args.run(args))
+
+
+if __name__ == '__main__':
+    main()
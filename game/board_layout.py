@@ -0,0 +1,145 @@
+"""Screen layout of a board of any size.
+
+Square positions come from a lookup table built once per board: the
+boustrophedon numbering (left to right on the bottom row, right to left
+on the next) is evaluated with NumPy for every square up front, so
+placing a token is an index instead of row/column arithmetic.
+
+Boards too big for the board area at a readable cell size are shown
+through a scrolling viewport. visible_squares() returns only the cells
+inside it, so drawing costs the same on a 100x100 board as on the
+classic 10x10. The rendered board is kept in world space as view-sized
+chunks; visible_chunks() says which (at most four) cover the view and
+where they go on screen, so scrolling moves cached chunks instead of
+rendering the board again.
+
+The tile corners can be passed in precomputed (board files cache them);
+everything else is derived from them.
+"""
+import numpy as np
+
+# Screen rectangle the board is drawn in: x, y, width, height
+BOARD_AREA = (50, 10, 600, 600)
+MAX_CELL_SIZE = 60
+MIN_CELL_SIZE = 40
+
+
+class BoardLayout:
+    def __init__(self, rows, columns, area=BOARD_AREA, max_cell=MAX_CELL_SIZE, min_cell=MIN_CELL_SIZE, corners=None):
+        self.rows = rows
+        self.columns = columns
+        self.area = area
+        area_x, area_y, area_width, area_height = area
+        self.cell_size = max(min_cell, min(max_cell, area_width // columns, area_height // rows))
+        self.world_width = columns * self.cell_size
+        self.world_height = rows * self.cell_size
+        self.view_width = min(area_width, self.world_width)
+        self.view_height = min(area_height, self.world_height)
+
+        # Tile corner of every square in board ("world") pixels; index 0 is unused
+        if corners is None:
+            squares = np.arange(rows * columns)
+            row = squares // columns
+            col = squares % columns
+            col = np.where(row % 2 == 1, columns - 1 - col, col)
+            corners = np.zeros((rows * columns + 1, 2), dtype=np.int32)
+            corners[1:, 0] = col * self.cell_size
+            corners[1:, 1] = (rows - 1 - row) * self.cell_size
+        self.corners = corners
+        self.centers = corners + self.cell_size // 2
+        self.center_list = self.centers.tolist()
+        self.corner_list = corners.tolist()
+
+        # Square shown in each grid cell, top row first
+        grid_row = corners[1:, 1] // self.cell_size
+        grid_col = corners[1:, 0] // self.cell_size
+        self.grid = np.zeros((rows, columns), dtype=np.int32)
+        self.grid[grid_row, grid_col] = np.arange(1, rows * columns + 1)
+        # Checkerboard color of each tile (0 or 1)
+        self.parity_list = [0] + ((rows - 1 - grid_row + grid_col) % 2).tolist()
+
+        self.camera_x = 0
+        self.camera_y = 0
+
+    @property
+    def last_square(self):
+        return self.rows * self.columns
+
+    @property
+    def scrolls(self):
+        """True when the board is bigger than the view"""
+        return self.world_width > self.view_width or self.world_height > self.view_height
+
+    def scroll(self):
+        """Add to unscrolled screen positions to get where they are drawn now"""
+        return -self.camera_x, -self.camera_y
+
+    def unscrolled_center(self, square):
+        """Screen position of a square's middle with the view scrolled to the origin"""
+        x, y = self.center_list[square]
+        return x + self.area[0], y + self.area[1]
+
+    def view_rect(self):
+        """(x, y, width, height) of the visible part of the board on screen"""
+        return self.area[0], self.area[1], self.view_width, self.view_height
+
+    def center(self, square):
+        """Screen position of the middle of a square"""
+        x, y = self.center_list[square]
+        return x + self.area[0] - self.camera_x, y + self.area[1] - self.camera_y
+
+    def corner(self, square):
+        """Screen position of a square's top-left corner"""
+        x, y = self.corner_list[square]
+        return x + self.area[0] - self.camera_x, y + self.area[1] - self.camera_y
+
+    def follow(self, square):
+        """Scroll so square is centred where possible; returns True if the view moved"""
+        x, y = self.center_list[square]
+        camera_x = min(max(0, x - self.view_width // 2), self.world_width - self.view_width)
+        camera_y = min(max(0, y - self.view_height // 2), self.world_height - self.view_height)
+        moved = (camera_x, camera_y) != (self.camera_x, self.camera_y)
+        self.camera_x, self.camera_y = camera_x, camera_y
+        return moved
+
+    def squares_in(self, left, top, width, height):
+        """Square numbers of every cell at least partly inside a rectangle of board pixels"""
+        first_col = max(0, left // self.cell_size)
+        last_col = min(self.columns - 1, (left + width - 1) // self.cell_size)
+        first_row = max(0, top // self.cell_size)
+        last_row = min(self.rows - 1, (top + height - 1) // self.cell_size)
+        return self.grid[first_row:last_row + 1, first_col:last_col + 1].ravel().tolist()
+
+    def visible_squares(self):
+        """Square numbers of every cell that is at least partly in view"""
+        return self.squares_in(self.camera_x, self.camera_y, self.view_width, self.view_height)
+
+    def board_box(self, left, top, width, height, margin=0):
+        """(left, top, right, bottom) of a rectangle of board pixels in unscrolled screen pixels, grown by margin"""
+        left += self.area[0] - margin
+        top += self.area[1] - margin
+        return left, top, left + width + 2 * margin, top + height + 2 * margin
+
+    def visible_box(self, margin=0):
+        """(left, top, right, bottom) of the view in unscrolled screen pixels, grown by margin"""
+        return self.board_box(self.camera_x, self.camera_y, self.view_width, self.view_height, margin)
+
+    @property
+    def chunk_size(self):
+        """Board chunks are the size of the view, so any view overlaps at most four"""
+        return self.view_width, self.view_height
+
+    def chunk_origin(self, chunk):
+        """Board pixel position of a chunk's top-left corner"""
+        column, row = chunk
+        return column * self.view_width, row * self.view_height
+
+    def visible_chunks(self):
+        """((column, row), screen position) of every board chunk in view"""
+        width, height = self.chunk_size
+        chunks = []
+        for row in range(self.camera_y // height, (self.camera_y + height - 1) // height + 1):
+            for column in range(self.camera_x // width, (self.camera_x + width - 1) // width + 1):
+                chunks.append(((column, row), (self.area[0] + column * width - self.camera_x,
+                                               self.area[1] + row * height - self.camera_y)))
+        return chunks
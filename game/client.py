@@ -0,0 +1,271 @@
+"""Clients for game.server: the game window's connection and load-test bots.
+
+NetworkClient is a plain non-blocking socket that the pygame loop polls
+once per frame. The server's dice reach the local game through
+ServerDice, installed as GameEngine.rng, so play_server_move() has
+SnakeLadderGame animate each move with its usual roll_dice/move_player
+and then settles on the server's result.
+
+Bot is an asyncio.Protocol that joins a room and rolls whenever it is
+its turn, for benchmarks/bench_server.py. Spectator watches a room and
+keeps its SpectatorState in step with the server's keyframes and deltas.
+"""
+import asyncio
+import random
+import socket
+import time
+from collections import deque
+
+from game import protocol
+from game.server import DEFAULT_PORT
+
+
+def parse_address(address):
+    """("host", port) from "host:port" or "host" """
+    host, _, port = address.rpartition(':')
+    if not host:
+        return address, DEFAULT_PORT
+    return host, int(port)
+
+
+class ServerDice:
+    """Stand-in for GameEngine.rng that yields the dice the server rolled"""
+
+    def __init__(self):
+        self.values = deque()
+
+    def randint(self, a, b):
+        return self.values.popleft()
+
+
+def play_server_move(game, moved):
+    """Play one MOVED body on a local game whose engine rolls ServerDice.
+
+    The local engine animates the move with its usual roll/move, but the
+    server's result is what counts: the server's player moves, and ends
+    on the server's square with the server's next player and winner, even
+    where the local board or rules would have played it differently.
+    """
+    player, dice, start, end, jump, next_player, won = moved
+    engine = game.engine
+    engine.current_player = player
+    engine.rng.values.append(dice)
+    game.roll_dice()
+    game.move_player(dice)
+    if engine.player_positions[player] != end:
+        # Different rules or board than the server: trust the server
+        engine.player_positions[player] = end
+        game.invalidate()
+    engine.game_over = bool(won)
+    engine.winner = player if won else None
+    if not won:
+        engine.current_player = next_player
+
+
+class NetworkClient:
+    """Non-blocking connection to a game server; call poll() every frame"""
+
+    def __init__(self, address, timeout=5.0):
+        self.sock = socket.create_connection(parse_address(address), timeout)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.setblocking(False)
+        self.timeout = timeout
+        self.frames = protocol.FrameBuffer()
+        self.connected = True
+        self.room_id = None
+        self.seat = None
+        self.seats = None
+        self.started = False
+
+    def send(self, data):
+        self.sock.setblocking(True)
+        try:
+            self.sock.sendall(data)
+        finally:
+            self.sock.setblocking(False)
+
+    def join(self, seats, room_id=0, name=''):
+        """Ask for a seat and wait for it; returns (rows, columns, ladders, snakes) of the room's board"""
+        self.send(protocol.join(room_id, seats, name))
+        board = None
+        deadline = time.monotonic() + self.timeout
+        while board is None or self.seat is None:
+            if time.monotonic() > deadline or not self.connected:
+                raise ConnectionError("no answer from the game server")
+            for kind, payload in self.poll():
+                if kind == protocol.WELCOME:
+                    self.room_id, self.seat, self.seats = protocol.WELCOME_BODY.unpack(payload)
+                elif kind == protocol.BOARD:
+                    board = protocol.parse_board(payload)
+                elif kind == protocol.START:
+                    # A room that fills with this seat starts straight away
+                    self.started = True
+                elif kind == protocol.ERROR:
+                    raise ConnectionError(payload[protocol.CODE_BODY.size:].decode('utf-8', 'replace'))
+            time.sleep(0.005)
+        return board
+
+    def roll(self):
+        self.send(protocol.frame(protocol.ROLL))
+
+    def poll(self):
+        """Every complete frame received since the last call"""
+        frames = []
+        while self.connected:
+            try:
+                data = self.sock.recv(65536)
+            except BlockingIOError:
+                break
+            except OSError:
+                data = b''
+            if not data:
+                self.connected = False
+                break
+            frames += self.frames.feed(data)
+        return frames
+
+    def close(self):
+        if self.connected:
+            try:
+                self.send(protocol.frame(protocol.LEAVE))
+            except OSError:
+                pass
+        self.connected = False
+        self.sock.close()
+
+
+class Bot(asyncio.Protocol):
+    """Headless player: joins a room, rolls on its turn and rejoins after each game.
+
+    roll_times is shared by every bot in the process and maps a room id
+    to when its last ROLL was sent, so each MOVED delivery can be timed.
+    """
+
+    def __init__(self, seats, roll_times, latencies, think=1.0, rng=None):
+        self.seats = seats
+        self.roll_times = roll_times
+        self.latencies = latencies
+        self.think = think
+        self.rng = rng or random.Random()
+        self.frames = protocol.FrameBuffer()
+        self.transport = None
+        self.room_id = None
+        self.seat = None
+        self.games = 0
+        self.moves = 0
+        self.pending = None
+        self.stopped = False
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.transport.write(protocol.join(0, self.seats, 'bot'))
+
+    def stop(self):
+        """Stop rolling (and rejoining), keeping the connection and the room as they are"""
+        self.stopped = True
+        if self.pending is not None:
+            self.pending.cancel()
+            self.pending = None
+
+    def connection_lost(self, exc):
+        self.transport = None
+        if self.pending is not None:
+            self.pending.cancel()
+
+    def schedule_roll(self):
+        if self.stopped:
+            return
+        delay = self.rng.uniform(0.0, 2.0 * self.think)
+        self.pending = asyncio.get_running_loop().call_later(delay, self.roll)
+
+    def roll(self):
+        self.pending = None
+        if self.transport is not None:
+            self.roll_times[self.room_id] = time.perf_counter()
+            self.transport.write(protocol.frame(protocol.ROLL))
+
+    def rejoin(self):
+        self.room_id = self.seat = None
+        if self.transport is not None and not self.stopped:
+            self.transport.write(protocol.join(0, self.seats, 'bot'))
+
+    def data_received(self, data):
+        for kind, payload in self.frames.feed(data):
+            if kind == protocol.MOVED:
+                player, _, _, _, _, next_player, won = protocol.MOVED_BODY.unpack(payload)
+                sent = self.roll_times.get(self.room_id)
+                if sent is not None:
+                    self.latencies.append(time.perf_counter() - sent)
+                if player == self.seat:
+                    self.moves += 1
+                if won:
+                    self.games += 1
+                    self.rejoin()
+                elif next_player == self.seat:
+                    self.schedule_roll()
+            elif kind == protocol.WELCOME:
+                self.room_id, self.seat, _ = protocol.WELCOME_BODY.unpack(payload)
+            elif kind == protocol.START:
+                if protocol.START_BODY.unpack(payload)[0] == self.seat:
+                    self.schedule_roll()
+            elif kind == protocol.CLOSED:
+                self.rejoin()
+
+
+class SpectatorState:
+    """A room's game state rebuilt from KEYFRAME and DELTA messages"""
+
+    def __init__(self):
+        self.state = None
+        self.sequence = None
+        self.keyframes = 0
+        self.deltas = 0
+        self.out_of_sync = 0
+
+    def apply(self, kind, payload):
+        """Apply a KEYFRAME or DELTA; returns False for a delta that does not follow on"""
+        if kind == protocol.KEYFRAME:
+            self.sequence, self.state = protocol.parse_keyframe(payload)
+            self.keyframes += 1
+            return True
+        sequence = protocol.DELTA_BODY.unpack_from(payload)[0]
+        if self.state is None or sequence != self.sequence + 1:
+            # Missed something: wait for the next keyframe
+            self.out_of_sync += 1
+            return False
+        self.sequence, self.state = protocol.apply_delta(self.state, payload)
+        self.deltas += 1
+        return True
+
+
+class Spectator(asyncio.Protocol):
+    """Headless spectator for one room; counts what it receives"""
+
+    def __init__(self, room_id):
+        self.room_id = room_id
+        self.frames = protocol.FrameBuffer()
+        self.view = SpectatorState()
+        self.transport = None
+        self.bytes = 0
+        self.closed = False
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.watch(self.room_id)
+
+    def watch(self, room_id):
+        self.room_id = room_id
+        self.closed = False
+        if self.transport is not None:
+            self.transport.write(protocol.frame(protocol.WATCH, protocol.WATCH_BODY.pack(room_id)))
+
+    def connection_lost(self, exc):
+        self.transport = None
+
+    def data_received(self, data):
+        self.bytes += len(data)
+        for kind, payload in self.frames.feed(data):
+            if kind in (protocol.KEYFRAME, protocol.DELTA):
+                self.view.apply(kind, payload)
+            elif kind == protocol.CLOSED:
+                self.closed = True
@@ -0,0 +1,158 @@
+"""Headless Snake and Ladder rules.
+
+Board layout, player positions and turn resolution live here with no
+pygame import, so simulations, servers and tools can use the rules
+without opening a display. SnakeLadderGame and CloudLadderGame render
+the state held by a GameEngine.
+"""
+import random
+from collections import namedtuple
+
+BOARD_ROWS = 10
+BOARD_COLUMNS = 10
+LAST_SQUARE = BOARD_ROWS * BOARD_COLUMNS
+MAX_BOARD_SIDE = 100
+
+DEFAULT_LADDERS = {4: 14, 9: 31, 20: 38, 28: 84, 40: 59, 51: 67, 63: 81, 71: 91}
+DEFAULT_SNAKES = {16: 6, 47: 26, 49: 11, 56: 53, 62: 19, 64: 60, 87: 24, 93: 73, 95: 75, 98: 78}
+
+# Outcome of one move. ``path`` lists every square the token passes
+# through, ending with the jump destination when a ladder or snake is hit.
+MoveResult = namedtuple('MoveResult', ['player', 'steps', 'start', 'landing', 'end', 'path', 'jump', 'won'])
+
+
+class Board:
+    """A rows x columns board numbered 1..last_square, with its snakes and ladders.
+
+    Without explicit ladders/snakes the classic 10x10 board gets the
+    default layout and other sizes start empty. The layout is fixed once
+    the board is built: landing squares resolve through a flat jump list,
+    which can be passed in precomputed (see game.board_file).
+    """
+
+    def __init__(self, ladders=None, snakes=None, rows=BOARD_ROWS, columns=BOARD_COLUMNS, jumps=None):
+        if not (1 <= rows <= MAX_BOARD_SIDE and 1 <= columns <= MAX_BOARD_SIDE):
+            raise ValueError(f"board sides must be between 1 and {MAX_BOARD_SIDE}, got {rows}x{columns}")
+        self.rows = rows
+        self.columns = columns
+        self.last_square = rows * columns
+
+        classic = (rows, columns) == (BOARD_ROWS, BOARD_COLUMNS)
+        if ladders is None:
+            ladders = DEFAULT_LADDERS if classic else {}
+        if snakes is None:
+            snakes = DEFAULT_SNAKES if classic else {}
+        self.ladders = dict(ladders)
+        self.snakes = dict(snakes)
+        for start, end in list(self.ladders.items()) + list(self.snakes.items()):
+            if not (1 <= start <= self.last_square and 1 <= end <= self.last_square):
+                raise ValueError(f"jump {start} -> {end} is off the {rows}x{columns} board")
+
+        self.jumps = list(jumps) if jumps is not None else self.jump_table()
+
+    def key(self):
+        """Hashable description of the layout, for caching analysis results"""
+        return (self.rows, self.columns, tuple(sorted(self.ladders.items())), tuple(sorted(self.snakes.items())))
+
+    @classmethod
+    def from_key(cls, key):
+        rows, columns, ladders, snakes = key
+        return cls(dict(ladders), dict(snakes), rows, columns)
+
+    def resolve(self, square):
+        """Return (final square, 'ladder' / 'snake' / None) for a landing square"""
+        final = self.jumps[square]
+        if final > square:
+            return final, 'ladder'
+        if final < square:
+            return final, 'snake'
+        return square, None
+
+    def jump_table(self):
+        """List mapping every square 0..last_square to where a token ends up"""
+        table = list(range(self.last_square + 1))
+        for start, end in self.snakes.items():
+            table[start] = end
+        for start, end in self.ladders.items():
+            table[start] = end
+        return table
+
+
+class GameEngine:
+    """Positions and turn order for one game.
+
+    recorder, when set, is told about every roll, move and turn change
+    (see game.replay.ReplayRecorder).
+    """
+
+    def __init__(self, num_players=1, board=None, rng=None, recorder=None):
+        if num_players < 1:
+            raise ValueError("num_players must be at least 1")
+        self.board = board if board is not None else Board()
+        self.rng = rng if rng is not None else random.Random()
+        self.num_players = num_players
+        self.current_player = 0
+        self.player_positions = [1] * num_players
+        self.dice_value = 1
+        self.game_over = False
+        self.winner = None
+        self.turns = 0
+        self.recorder = recorder
+
+    def roll_dice(self):
+        """Roll the die for the current player"""
+        self.dice_value = self.rng.randint(1, 6)
+        if self.recorder is not None:
+            self.recorder.roll(self.current_player, self.dice_value)
+        return self.dice_value
+
+    def move_player(self, steps):
+        """Move the current player; returns a MoveResult, or None when the roll overshoots the last square"""
+        self.turns += 1
+        current_pos = self.player_positions[self.current_player]
+        landing = current_pos + steps
+
+        if landing > self.board.last_square:
+            if self.recorder is not None:
+                self.recorder.move(self.current_player, steps, current_pos, current_pos, None)
+            return None
+
+        path = list(range(current_pos + 1, landing + 1))
+        final_position, jump = self.board.resolve(landing)
+        if jump:
+            path.append(final_position)
+
+        self.player_positions[self.current_player] = final_position
+
+        won = final_position >= self.board.last_square
+        if won:
+            self.game_over = True
+            self.winner = self.current_player
+
+        if self.recorder is not None:
+            self.recorder.move(self.current_player, steps, current_pos, final_position, jump)
+            if won:
+                self.recorder.win(self.current_player)
+        return MoveResult(self.current_player, steps, current_pos, landing, final_position, path, jump, won)
+
+    def next_turn(self):
+        """Pass the die to the next player"""
+        if self.num_players > 1:
+            self.current_player = (self.current_player + 1) % self.num_players
+        if self.recorder is not None:
+            self.recorder.turn(self.current_player)
+
+    def play_turn(self):
+        """Roll, move and advance the turn; returns the MoveResult (None on overshoot)"""
+        result = self.move_player(self.roll_dice())
+        if not self.game_over:
+            self.next_turn()
+        return result
+
+    def play_game(self, max_turns=None):
+        """Play turns until someone wins; returns the winner (None if max_turns ran out)"""
+        while not self.game_over:
+            if max_turns is not None and self.turns >= max_turns:
+                break
+            self.play_turn()
+        return self.winner
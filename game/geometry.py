@@ -0,0 +1,104 @@
+"""Snake and ladder geometry computed once per board.
+
+Curves and rungs are evaluated with NumPy for all snakes or all ladders
+at once and kept in flat arrays, so drawing a board only walks
+precomputed points instead of re-evaluating Bezier curves and rung
+positions. On boards larger than the screen only the shapes whose
+bounding boxes overlap the viewport are drawn.
+"""
+import numpy as np
+
+
+def bezier_curves(starts, ends, resolution, arch):
+    """Quadratic Bezier points for many snakes at once.
+
+    starts/ends are (n, 2) screen positions; the control point sits
+    halfway across and ``arch`` pixels above the higher end. Returns an
+    (n, resolution + 1, 2) int array.
+    """
+    starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+    controls = np.empty_like(starts)
+    controls[:, 0] = (starts[:, 0] + ends[:, 0]) // 2
+    controls[:, 1] = np.minimum(starts[:, 1], ends[:, 1]) - arch
+
+    t = (np.arange(resolution + 1) / resolution)[None, :, None]
+    points = ((1 - t) ** 2 * starts[:, None, :]
+              + 2 * (1 - t) * t * controls[:, None, :]
+              + t ** 2 * ends[:, None, :])
+    return points.astype(np.int32)
+
+
+def snake_segment_thickness(resolution, widest=12, narrowest=6):
+    """Body thickness for each of the resolution segments, thickest mid-body"""
+    count = resolution + 1
+    index = np.arange(resolution)
+    thickness = widest - (np.abs(index - count // 2) * 4 / count).astype(np.int32)
+    return np.maximum(thickness, narrowest)
+
+
+def ladder_rungs(starts, ends, spacing=None, count=None, min_rungs=3):
+    """Rung centres for many ladders at once.
+
+    Rungs are either ``count`` evenly spaced steps or one every
+    ``spacing`` pixels (at least min_rungs). Returns (points, offsets):
+    the rungs of ladder i are points[offsets[i]:offsets[i + 1]].
+    """
+    starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+    deltas = ends - starts
+    if count is not None:
+        steps = np.full(len(starts), count, dtype=np.int64)
+    else:
+        lengths = np.hypot(deltas[:, 0], deltas[:, 1])
+        steps = np.maximum(min_rungs, (lengths / spacing).astype(np.int64))
+
+    offsets = np.concatenate(([0], np.cumsum(steps + 1)))
+    ladder = np.repeat(np.arange(len(starts)), steps + 1)
+    rung = np.arange(offsets[-1]) - offsets[ladder]
+    t = (rung / steps[ladder])[:, None]
+    points = (starts[ladder] + deltas[ladder] * t).astype(np.int32)
+    return points, offsets
+
+
+class BoardGeometry:
+    """Screen-space shapes of every snake and ladder on a board"""
+
+    def __init__(self, snakes, ladders, snake_resolution=30, snake_arch=40,
+                 rung_spacing=25, rung_count=None):
+        # snakes / ladders: lists of ((start_x, start_y), (end_x, end_y))
+        self.snake_ends = np.array(snakes, dtype=np.int32).reshape(-1, 2, 2)
+        self.ladder_ends = np.array(ladders, dtype=np.int32).reshape(-1, 2, 2)
+        self.snake_points = bezier_curves(self.snake_ends[:, 0], self.snake_ends[:, 1],
+                                          snake_resolution, snake_arch)
+        self.snake_thickness = snake_segment_thickness(snake_resolution)
+        self.rung_points, self.rung_offsets = ladder_rungs(self.ladder_ends[:, 0], self.ladder_ends[:, 1],
+                                                           spacing=rung_spacing, count=rung_count)
+
+        # Bounding boxes (left, top, right, bottom) for culling against a viewport
+        self.snake_boxes = np.concatenate((self.snake_points.min(axis=1), self.snake_points.max(axis=1)), axis=1)
+        self.ladder_boxes = np.concatenate((self.ladder_ends.min(axis=1), self.ladder_ends.max(axis=1)), axis=1)
+
+    @staticmethod
+    def overlapping(boxes, box):
+        """Indexes of boxes that overlap box (all of them when box is None)"""
+        if box is None:
+            return range(len(boxes))
+        left, top, right, bottom = box
+        hits = (boxes[:, 0] <= right) & (boxes[:, 2] >= left) & (boxes[:, 1] <= bottom) & (boxes[:, 3] >= top)
+        return np.flatnonzero(hits).tolist()
+
+    def snakes(self, offset=(0, 0), box=None):
+        """Yield (head, tail, body points) for each snake overlapping box, moved by offset"""
+        shift = np.array(offset, dtype=np.int32)
+        for i in self.overlapping(self.snake_boxes, box):
+            ends = self.snake_ends[i] + shift
+            yield tuple(ends[0].tolist()), tuple(ends[1].tolist()), (self.snake_points[i] + shift).tolist()
+
+    def ladders(self, offset=(0, 0), box=None):
+        """Yield (bottom, top, rung centres) for each ladder overlapping box, moved by offset"""
+        shift = np.array(offset, dtype=np.int32)
+        for i in self.overlapping(self.ladder_boxes, box):
+            ends = self.ladder_ends[i] + shift
+            rungs = self.rung_points[self.rung_offsets[i]:self.rung_offsets[i + 1]] + shift
+            yield tuple(ends[0].tolist()), tuple(ends[1].tolist()), rungs.tolist()
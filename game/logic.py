@@ -1,242 +1,327 @@
 import pygame
 import random
-import math
-import time
+from game.animation import AnimationClock, PathTween, Tween
+from game.board_file import open_board
+from game.engine import GameEngine
+from game.geometry import BoardGeometry
+from game.resources import resources
+from game import sprites
+from game.text_cache import render_text
 
 class CloudLadderGame:
-    def __init__(self, num_players=1):
-        pygame.init()
-        self.BOARD_SIZE = 10
-        self.CELL_SIZE = 60
-        self.WINDOW_WIDTH = 800
-        self.WINDOW_HEIGHT = 700
+    def __init__(self, num_players=1, board=None, seed=None, clock=None):
+        # The window, fonts and Marwadi colors are shared by every game (game/resources.py)
+        self.WINDOW_WIDTH, self.WINDOW_HEIGHT = resources.size
+        for name, color in resources.palette.items():
+            setattr(self, name, color)
         
-        # Marwadi colors
-        self.RED = (220, 20, 60)
-        self.GOLD = (255, 215, 0)
-        self.BEIGE = (245, 245, 220)
-        self.WHITE = (255, 255, 255)
-        self.BLACK = (0, 0, 0)
-        self.DARK_RED = (139, 0, 0)
-        self.GREEN = (34, 139, 34)
-        self.SHADOW = (200, 200, 200)
+        # Board from a file (None means boards/classic.json); its theme recolors the palette
+        self.board_file = open_board(board)
+        for name, color in self.board_file.theme.items():
+            setattr(self, name, color)
         
-        self.screen = pygame.display.set_mode((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-        pygame.display.set_caption("Cloud Ladder - AWS Edition")
-        self.font = pygame.font.Font(None, 24)
-        self.big_font = pygame.font.Font(None, 36)
+        self.screen = resources.screen
+        resources.set_caption("Cloud Ladder - AWS Edition")
+        self.font = resources.font(24)
+        self.big_font = resources.font(36)
         
-        # Game state
-        self.num_players = num_players
-        self.current_player = 0
-        self.player_positions = [1] * num_players
-        self.player_colors = [self.DARK_RED, self.GREEN]
-        self.dice_value = 1
-        self.game_over = False
-        self.winner = None
+        # Game state (rules and positions live in the headless engine)
+        self.engine = GameEngine(num_players, self.board_file.board, random.Random(seed))
+        self.player_colors = [self.DARK_RED, self.GREEN, (30, 90, 200), (255, 140, 0)]
         self.waiting_for_question = False
         self.scores = [0] * num_players
         
-        # Animation state
+        # Animation state, timed in seconds on the clock the controller ticks every frame
+        self.clock = clock or AnimationClock()
         self.animating = False
-        self.animation_start_pos = 1
-        self.animation_target_pos = 1
-        self.animation_current_pos = 1.0
-        self.animation_speed = 3.0
+        self.animating_player = None
+        self.move_tween = None
+        self.animation_speed = 3.0  # squares per second
         
         # Dice animation
         self.dice_rolling = False
-        self.dice_roll_timer = 0
-        self.dice_roll_duration = 30
+        self.dice_tween = None
+        self.dice_roll_duration = 0.5
+        self.dice_face_rate = 20
+        self.dice_faces = list(range(1, 7))
         
-        # Snakes and Ladders positions
-        self.ladders = {4: 14, 9: 31, 20: 38, 28: 84, 40: 59, 51: 67, 63: 81, 71: 91}
-        self.snakes = {16: 6, 47: 26, 49: 11, 56: 53, 62: 19, 64: 60, 87: 24, 93: 73, 95: 75, 98: 78}
+        # Square-to-screen lookup table and the scrolling view of big boards
+        self.layout = self.board_file.layout()
         
+        # Pre-rendered static board layer (tiles, numbers, ladders, snakes),
+        # in view-sized chunks of the whole board
+        self.board_surface = None  # window-sized: the chunks in view over the background
+        self.board_view = None
+        self.board_geometry = None
+        self.geometry_key = None
+        self.tile_sprites = None
+        self.tile_sprites_key = None
+        self.sprites = None
+        self.sprites_key = None
+        self.snake_resolution = 20
+        
+        # Dirty-region tracking: what each changing screen area showed last frame
+        self.dice_face = 1
+        self.drawn_regions = {}
+        self.needs_full_redraw = True
+        
+    @property
+    def num_players(self):
+        return self.engine.num_players
+    
+    @property
+    def current_player(self):
+        return self.engine.current_player
+    
+    @property
+    def player_positions(self):
+        return self.engine.player_positions
+    
+    @property
+    def dice_value(self):
+        return self.engine.dice_value
+    
+    @property
+    def game_over(self):
+        return self.engine.game_over
+    
+    @property
+    def winner(self):
+        return self.engine.winner
+    
+    @property
+    def busy(self):
+        """True while the dice or a token is animating"""
+        return self.animating or self.dice_rolling
+    
+    @property
+    def ladders(self):
+        return self.engine.board.ladders
+    
+    @property
+    def snakes(self):
+        return self.engine.board.snakes
+    
     def get_board_position(self, number):
         """Convert board number to screen coordinates"""
-        if number < 1 or number > 100:
+        if number < 1 or number > self.engine.board.last_square:
             return 50, 50
-            
-        row = (number - 1) // self.BOARD_SIZE
-        col = (number - 1) % self.BOARD_SIZE
-        
-        # Reverse direction for odd rows (snake pattern)
-        if row % 2 == 1:
-            col = self.BOARD_SIZE - 1 - col
-            
-        x = 50 + col * self.CELL_SIZE + self.CELL_SIZE // 2
-        y = 550 - row * self.CELL_SIZE + self.CELL_SIZE // 2
-        return x, y
+        return self.layout.center(number)
     
     def draw_rounded_rect(self, surface, color, rect, radius):
         """Draw a rounded rectangle"""
         pygame.draw.rect(surface, color, rect, border_radius=radius)
     
-    def draw_snake(self, start_pos, end_pos):
-        """Draw a curved snake between two positions"""
-        start_x, start_y = start_pos
-        end_x, end_y = end_pos
-        
-        # Calculate control points for bezier curve
-        mid_x = (start_x + end_x) // 2
-        mid_y = min(start_y, end_y) - 30
-        
-        # Draw snake body with multiple segments
-        points = []
-        for t in range(21):
-            t = t / 20.0
-            # Quadratic bezier curve
-            x = (1-t)**2 * start_x + 2*(1-t)*t * mid_x + t**2 * end_x
-            y = (1-t)**2 * start_y + 2*(1-t)*t * mid_y + t**2 * end_y
-            points.append((int(x), int(y)))
+    def build_board_geometry(self):
+        """Compute snake curves and ladder rungs once per board layout, unscrolled"""
+        position = self.layout.unscrolled_center
+        return BoardGeometry([(position(start), position(end)) for start, end in self.snakes.items()],
+                             [(position(start), position(end)) for start, end in self.ladders.items()],
+                             snake_resolution=self.snake_resolution, snake_arch=30, rung_count=5)
+    
+    def draw_snake(self, start_pos, end_pos, points, surface=None):
+        """Draw a curved snake along precomputed points"""
+        if surface is None:
+            surface = self.screen
         
         # Draw snake segments
-        for i in range(len(points)-1):
-            pygame.draw.line(self.screen, self.RED, points[i], points[i+1], 8)
+        pygame.draw.lines(surface, self.RED, False, points, 8)
         
         # Draw snake head and tail
-        pygame.draw.circle(self.screen, self.DARK_RED, start_pos, 12)
-        pygame.draw.circle(self.screen, self.RED, end_pos, 8)
+        pygame.draw.circle(surface, self.DARK_RED, start_pos, 12)
+        pygame.draw.circle(surface, self.RED, end_pos, 8)
     
-    def draw_ladder(self, start_pos, end_pos):
+    def draw_ladder(self, start_pos, end_pos, rungs, surface=None):
         """Draw a ladder between two positions"""
+        if surface is None:
+            surface = self.screen
         start_x, start_y = start_pos
         end_x, end_y = end_pos
         
         # Draw ladder sides
-        pygame.draw.line(self.screen, (139, 69, 19), (start_x-8, start_y), (end_x-8, end_y), 6)
-        pygame.draw.line(self.screen, (139, 69, 19), (start_x+8, start_y), (end_x+8, end_y), 6)
+        pygame.draw.line(surface, (139, 69, 19), (start_x-8, start_y), (end_x-8, end_y), 6)
+        pygame.draw.line(surface, (139, 69, 19), (start_x+8, start_y), (end_x+8, end_y), 6)
         
         # Draw ladder rungs
-        steps = 5
-        for i in range(steps + 1):
-            t = i / steps
-            rung_x = int(start_x + (end_x - start_x) * t)
-            rung_y = int(start_y + (end_y - start_y) * t)
-            pygame.draw.line(self.screen, (139, 69, 19), 
+        for rung_x, rung_y in rungs:
+            pygame.draw.line(surface, (139, 69, 19), 
                            (rung_x-8, rung_y), (rung_x+8, rung_y), 4)
     
-    def draw_board(self):
-        """Draw the game board with enhanced UI"""
-        self.screen.fill(self.BEIGE)
+    def get_board_cache_key(self):
+        """Everything the static board layer depends on"""
+        theme = (self.BEIGE, self.WHITE, self.GOLD, self.BLACK, self.SHADOW, self.RED, self.DARK_RED)
+        return (tuple(sorted(self.ladders.items())), tuple(sorted(self.snakes.items())),
+                self.snake_resolution, theme, self.layout.cell_size, self.layout.chunk_size)
+    
+    def get_tile_sprites(self):
+        """One pre-drawn tile per checkerboard color, on the board background"""
+        cell = self.layout.cell_size
+        key = (cell, self.BEIGE, self.WHITE, self.GOLD, self.BLACK, self.SHADOW)
+        if self.tile_sprites_key != key:
+            self.tile_sprites = resources.surface(('tiles', type(self).__name__) + key, self.build_tile_sprites)
+            self.tile_sprites_key = key
+        return self.tile_sprites
+    
+    def build_tile_sprites(self):
+        """Draw the two checkerboard tiles"""
+        cell = self.layout.cell_size
+        tiles = []
+        for color in (self.WHITE, self.GOLD):
+            tile = pygame.Surface((cell, cell)).convert()
+            tile.fill(self.BEIGE)
+            self.draw_rounded_rect(tile, self.SHADOW, pygame.Rect(2, 2, cell - 4, cell - 4), 8)
+            tile_rect = pygame.Rect(0, 0, cell - 4, cell - 4)
+            self.draw_rounded_rect(tile, color, tile_rect, 8)
+            pygame.draw.rect(tile, self.BLACK, tile_rect, 2, border_radius=8)
+            tiles.append(tile)
+        return tiles
+    
+    def get_sprites(self):
+        """Token and die-face sprites for the current colors, shared between games"""
+        key = (self.WHITE, self.BLACK, self.SHADOW, self.GOLD, tuple(self.player_colors))
+        if self.sprites_key != key:
+            self.sprites = resources.surface(('sprites', type(self).__name__) + key, self.build_sprites)
+            self.sprites_key = key
+        return self.sprites
+    
+    def build_sprites(self):
+        """Draw every token and die face into one atlas"""
+        atlas = {}
+        for player_id, color in enumerate(self.player_colors):
+            atlas['token', player_id] = sprites.token(18, color, self.WHITE, 4, self.SHADOW, self.GOLD, 8)
+        for value in range(1, 7):
+            atlas['die', value] = sprites.die_face(value, self.WHITE, self.BLACK, self.BLACK, self.SHADOW)
+        return sprites.SpriteAtlas(atlas)
+    
+    def get_board_geometry(self):
+        """Snake and ladder shapes, rebuilt only when the layout changes"""
+        key = (tuple(sorted(self.ladders.items())), tuple(sorted(self.snakes.items())),
+               self.snake_resolution, self.layout.cell_size)
+        if self.geometry_key != key:
+            self.board_geometry = self.build_board_geometry()
+            self.geometry_key = key
+        return self.board_geometry
+    
+    def render_board(self, surface, origin):
+        """Render the tiles, ladders and snakes of the part of the board at origin (board pixels) onto surface"""
+        surface.fill(self.BEIGE)
+        layout = self.layout
+        cell = layout.cell_size
+        left, top = origin
+        width, height = surface.get_size()
         
-        # Draw board squares with shadows and rounded corners
-        for i in range(100):
-            row = i // self.BOARD_SIZE
-            col = i % self.BOARD_SIZE
-            
-            if row % 2 == 1:
-                col = self.BOARD_SIZE - 1 - col
-                
-            x = 50 + col * self.CELL_SIZE
-            y = 550 - row * self.CELL_SIZE
-            
-            # Draw shadow
-            shadow_rect = pygame.Rect(x + 2, y + 2, self.CELL_SIZE - 4, self.CELL_SIZE - 4)
-            self.draw_rounded_rect(self.screen, self.SHADOW, shadow_rect, 8)
-            
-            # Draw main tile
-            tile_rect = pygame.Rect(x, y, self.CELL_SIZE - 4, self.CELL_SIZE - 4)
-            color = self.WHITE if (row + col) % 2 == 0 else self.GOLD
-            self.draw_rounded_rect(self.screen, color, tile_rect, 8)
-            
-            # Draw enhanced border
-            pygame.draw.rect(self.screen, self.BLACK, tile_rect, 2, border_radius=8)
+        tiles = self.get_tile_sprites()
+        for number in layout.squares_in(left, top, width, height):
+            x, y = layout.corner_list[number]
+            x, y = x - left, y - top
+            surface.blit(tiles[layout.parity_list[number]], (x, y))
             
             # Draw number (centered)
-            number = i + 1
-            text = self.font.render(str(number), True, self.BLACK)
-            text_rect = text.get_rect(center=(x + self.CELL_SIZE//2, y + self.CELL_SIZE//2))
-            self.screen.blit(text, text_rect)
+            text = render_text(self.font, str(number), True, self.BLACK)
+            text_rect = text.get_rect(center=(x + cell//2, y + cell//2))
+            surface.blit(text, text_rect)
+        
+        geometry = self.get_board_geometry()
+        offset = (-layout.area[0] - left, -layout.area[1] - top)
+        box = layout.board_box(left, top, width, height, margin=20)
         
         # Draw ladders with enhanced graphics
-        for start, end in self.ladders.items():
-            start_pos = self.get_board_position(start)
-            end_pos = self.get_board_position(end)
-            self.draw_ladder(start_pos, end_pos)
+        for start_pos, end_pos, rungs in geometry.ladders(offset, box):
+            self.draw_ladder(start_pos, end_pos, rungs, surface)
             
         # Draw snakes with enhanced graphics
-        for start, end in self.snakes.items():
-            start_pos = self.get_board_position(start)
-            end_pos = self.get_board_position(end)
-            self.draw_snake(start_pos, end_pos)
+        for start_pos, end_pos, points in geometry.snakes(offset, box):
+            self.draw_snake(start_pos, end_pos, points, surface)
+    
+    def draw_board(self):
+        """Blit the board layer, recomposing it from cached chunks when the view scrolls"""
+        cache_key = self.get_board_cache_key()
+        size = self.screen.get_size()
+        view = (cache_key, size, self.layout.camera_x, self.layout.camera_y)
+        if view != self.board_view:
+            if self.layout.scrolls:
+                # One layer per camera position would flood the shared cache: reuse this game's
+                self.board_surface = self.compose_board(cache_key, self.board_surface)
+            else:
+                # A board that fits the view has a single layer, shared between games
+                self.board_surface = resources.surface(('board', type(self).__name__) + cache_key + (size,),
+                                                       lambda: self.compose_board(cache_key))
+            self.board_view = view
+        self.screen.blit(self.board_surface, (0, 0))
+    
+    def compose_board(self, cache_key, surface=None):
+        """The window-sized board layer: the chunks in view over the background, rendering any not cached yet"""
+        if surface is None or surface.get_size() != self.screen.get_size():
+            surface = pygame.Surface(self.screen.get_size()).convert()
+        surface.fill(self.BEIGE)
+        surface.set_clip(self.layout.view_rect())
+        for chunk, position in self.layout.visible_chunks():
+            # Shared between games, so a new game on the same board starts drawn
+            chunk_surface = resources.surface(('board chunk', type(self).__name__) + cache_key + (chunk,),
+                                              lambda: self.build_board_chunk(chunk))
+            surface.blit(chunk_surface, position)
+        surface.set_clip(None)
+        return surface
+    
+    def build_board_chunk(self, chunk):
+        """A new view-sized surface holding one chunk of the rendered board"""
+        surface = pygame.Surface(self.layout.chunk_size).convert()
+        self.render_board(surface, self.layout.chunk_origin(chunk))
+        return surface
+    
+    def get_token_center(self, player_id):
+        """Screen position of a token, including animation and shared-tile offset"""
+        if self.animating and player_id == self.animating_player:
+            # Between two squares of the move's path
+            pos, next_pos, fraction = self.move_tween.position()
+            x, y = self.get_board_position(pos)
+            if fraction:
+                next_x, next_y = self.get_board_position(next_pos)
+                x = x + (next_x - x) * fraction
+                y = y + (next_y - y) * fraction
+        else:
+            pos = self.player_positions[player_id]
+            x, y = self.get_board_position(pos)
+        
+        # Offset players if on same tile
+        offset = 0
+        for other_id in range(player_id):
+            if self.player_positions[other_id] == pos:
+                offset += 15
+        return int(x + offset), int(y)
+    
+    def get_focus_square(self):
+        """The square the view follows: the moving token, else the player to move"""
+        if self.animating:
+            return self.move_tween.square
+        return self.player_positions[self.current_player]
     
     def draw_players(self):
-        """Draw all player tokens"""
+        """Draw all player tokens, clipped to the viewport"""
+        atlas = self.get_sprites()
+        self.screen.set_clip(self.layout.view_rect())
         for player_id in range(self.num_players):
-            if self.animating and player_id == self.current_player:
-                pos = self.animation_current_pos
-            else:
-                pos = self.player_positions[player_id]
-                
-            x, y = self.get_board_position(int(pos))
-            
-            # If animating between positions, interpolate coordinates
-            if self.animating and player_id == self.current_player and pos != int(pos):
-                next_pos = int(pos) + 1
-                if next_pos <= 100:
-                    next_x, next_y = self.get_board_position(next_pos)
-                    fraction = pos - int(pos)
-                    x = x + (next_x - x) * fraction
-                    y = y + (next_y - y) * fraction
-            
-            # Offset players if on same tile
-            offset = 0
-            if self.num_players == 2:
-                for other_id in range(player_id):
-                    if int(self.player_positions[other_id]) == int(pos):
-                        offset = 15
-            
-            color = self.player_colors[player_id]
-            
-            # Draw player shadow
-            pygame.draw.circle(self.screen, self.SHADOW, (int(x + 2 + offset), int(y + 2)), 18)
-            # Draw player token
-            pygame.draw.circle(self.screen, color, (int(x + offset), int(y)), 18)
-            pygame.draw.circle(self.screen, self.WHITE, (int(x + offset), int(y)), 18, 4)
-            # Draw inner circle
-            pygame.draw.circle(self.screen, self.GOLD, (int(x + offset), int(y)), 8)
+            x, y = self.get_token_center(player_id)
+            atlas.draw(self.screen, ('token', player_id), (x - 18, y - 18))
+        self.screen.set_clip(None)
     
     def draw_dice(self):
-        """Draw animated dice"""
-        dice_x, dice_y = 650, 100
-        
-        # Draw dice shadow
-        pygame.draw.rect(self.screen, self.SHADOW, (dice_x + 3, dice_y + 3, 80, 80), border_radius=10)
-        # Draw dice
-        self.draw_rounded_rect(self.screen, self.WHITE, pygame.Rect(dice_x, dice_y, 80, 80), 10)
-        pygame.draw.rect(self.screen, self.BLACK, (dice_x, dice_y, 80, 80), 3, border_radius=10)
-        
-        # Show random value if rolling, otherwise show actual value
-        display_value = random.randint(1, 6) if self.dice_rolling else self.dice_value
-        
-        # Draw dice dots
-        dot_positions = {
-            1: [(40, 40)],
-            2: [(20, 20), (60, 60)],
-            3: [(20, 20), (40, 40), (60, 60)],
-            4: [(20, 20), (60, 20), (20, 60), (60, 60)],
-            5: [(20, 20), (60, 20), (40, 40), (20, 60), (60, 60)],
-            6: [(20, 20), (60, 20), (20, 40), (60, 40), (20, 60), (60, 60)]
-        }
-        
-        for dot_x, dot_y in dot_positions[display_value]:
-            pygame.draw.circle(self.screen, self.BLACK, (dice_x + dot_x, dice_y + dot_y), 6)
+        """Draw the die showing its current face"""
+        self.get_sprites().draw(self.screen, ('die', self.dice_face), (650, 100))
     
     def draw_ui(self):
         """Draw enhanced game UI"""
         # Title with shadow
-        title_shadow = self.big_font.render("Cloud Ladder - AWS Edition", True, self.SHADOW)
+        title_shadow = render_text(self.big_font, "Cloud Ladder - AWS Edition", True, self.SHADOW)
         self.screen.blit(title_shadow, (52, 12))
-        title = self.big_font.render("Cloud Ladder - AWS Edition", True, self.DARK_RED)
+        title = render_text(self.big_font, "Cloud Ladder - AWS Edition", True, self.DARK_RED)
         self.screen.blit(title, (50, 10))
         
         # Current player turn
         if self.num_players > 1 and not self.game_over:
             turn_text = f"Player {self.current_player + 1}'s Turn"
             turn_color = self.player_colors[self.current_player]
-            turn = self.font.render(turn_text, True, turn_color)
+            turn = render_text(self.font, turn_text, True, turn_color)
             self.screen.blit(turn, (650, 180))
         
         # Player positions and scores
@@ -246,8 +331,8 @@ class CloudLadderGame:
             score_text = f"Score: {self.scores[i]}"
             color = self.player_colors[i]
             
-            pos_surface = self.font.render(player_text, True, color)
-            score_surface = self.font.render(score_text, True, color)
+            pos_surface = render_text(self.font, player_text, True, color)
+            score_surface = render_text(self.font, score_text, True, color)
             
             self.screen.blit(pos_surface, (650, y_offset))
             self.screen.blit(score_surface, (650, y_offset + 20))
@@ -255,17 +340,17 @@ class CloudLadderGame:
         
         # Instructions
         if not self.waiting_for_question and not self.animating and not self.game_over:
-            instruction = self.font.render("Press SPACE to roll dice", True, self.BLACK)
+            instruction = render_text(self.font, "Press SPACE to roll dice", True, self.BLACK)
             self.screen.blit(instruction, (650, y_offset + 20))
         elif self.animating:
-            instruction = self.font.render("Moving...", True, self.GOLD)
+            instruction = render_text(self.font, "Moving...", True, self.GOLD)
             self.screen.blit(instruction, (650, y_offset + 20))
         
         if self.game_over:
-            # Game over screen with winner and final scores
-            overlay = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-            overlay.set_alpha(128)
-            overlay.fill(self.BLACK)
+            # Game over screen with winner and final scores, over a wash made once and kept
+            size = (self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
+            overlay = resources.surface(('overlay', size, self.BLACK, 128),
+                                        lambda: sprites.overlay(size, self.BLACK, 128))
             self.screen.blit(overlay, (0, 0))
             
             if self.winner is not None:
@@ -275,90 +360,126 @@ class CloudLadderGame:
                 win_text = "Congratulations! 🎉"
                 win_color = self.GOLD
                 
-            win_surface = self.big_font.render(win_text, True, win_color)
+            win_surface = render_text(self.big_font, win_text, True, win_color)
             win_rect = win_surface.get_rect(center=(self.WINDOW_WIDTH//2, 300))
             self.screen.blit(win_surface, win_rect)
             
             # Show final scores
             for i in range(self.num_players):
-                final_score = self.font.render(f"Player {i+1} Score: {self.scores[i]}", True, self.WHITE)
+                final_score = render_text(self.font, f"Player {i+1} Score: {self.scores[i]}", True, self.WHITE)
                 score_rect = final_score.get_rect(center=(self.WINDOW_WIDTH//2, 350 + i * 30))
                 self.screen.blit(final_score, score_rect)
     
     def roll_dice(self):
         """Start dice roll animation"""
         self.dice_rolling = True
-        self.dice_roll_timer = 0
-        self.dice_value = random.randint(1, 6)
-        return self.dice_value
+        self.dice_tween = Tween(self.clock, self.dice_roll_duration)
+        random.shuffle(self.dice_faces)  # the faces shown while it rolls
+        return self.engine.roll_dice()
     
     def update_dice_animation(self):
-        """Update dice roll animation"""
-        if self.dice_rolling:
-            self.dice_roll_timer += 1
-            if self.dice_roll_timer >= self.dice_roll_duration:
-                self.dice_rolling = False
+        """End the dice roll animation once its time is up"""
+        if self.dice_rolling and self.dice_tween.done:
+            self.dice_rolling = False
     
-    def start_player_animation(self, target_position):
-        """Start smooth player movement animation"""
+    def start_player_animation(self, player, path):
+        """Start smooth movement of player's token along path (squares, start first)"""
         self.animating = True
-        self.animation_start_pos = self.player_positions[self.current_player]
-        self.animation_target_pos = target_position
-        self.animation_current_pos = float(self.player_positions[self.current_player])
+        self.animating_player = player
+        self.move_tween = PathTween(self.clock, path, 1.0 / self.animation_speed)
     
     def update_player_animation(self):
-        """Update player movement animation"""
-        if self.animating:
-            # Move towards target
-            if self.animation_current_pos < self.animation_target_pos:
-                self.animation_current_pos += self.animation_speed / 60.0
-                if self.animation_current_pos >= self.animation_target_pos:
-                    self.animation_current_pos = self.animation_target_pos
-                    self.animating = False
-                    self.player_positions[self.current_player] = self.animation_target_pos
+        """End the token animation once it reaches the end of its path"""
+        if self.animating and self.move_tween.done:
+            self.animating = False
     
     def move_player(self, steps):
         """Move current player with animation"""
-        new_position = self.player_positions[self.current_player] + steps
-        
-        if new_position > 100:
+        result = self.engine.move_player(steps)
+        if result is None:
             return False
             
-        # Start animation to new position
-        self.start_player_animation(new_position)
-        
-        # Handle snakes/ladders after animation completes
-        final_position = new_position
-        if final_position in self.ladders:
-            final_position = self.ladders[final_position]
-        elif final_position in self.snakes:
-            final_position = self.snakes[final_position]
-            
-        # Update target if there's a snake or ladder
-        if final_position != new_position:
-            self.animation_target_pos = final_position
-            
-        # Check win condition
-        if final_position >= 100:
-            self.game_over = True
-            self.winner = self.current_player
-            
+        # Animate to the final square, following any snake or ladder
+        self.start_player_animation(result.player, [result.start] + result.path)
         return True
     
     def next_turn(self):
         """Switch to next player"""
-        if self.num_players > 1:
-            self.current_player = (self.current_player + 1) % self.num_players
+        self.engine.next_turn()
+    
+    def take_turn(self):
+        """Roll, move the current player and pass the turn on"""
+        self.move_player(self.roll_dice())
+        if not self.game_over:
+            self.next_turn()
+    
+    def answer_question(self, correct):
+        """Finish a quiz question: a right answer scores and moves, a wrong one passes"""
+        self.score_answer(correct)
+        if correct:
+            self.take_turn()
+        else:
+            self.next_turn()
+    
+    def score_answer(self, correct):
+        """Count a quiz answer towards the current player's score"""
+        self.waiting_for_question = False
+        if correct:
+            self.scores[self.current_player] += 1
     
     def update(self):
         """Update game animations"""
         self.update_dice_animation()
         self.update_player_animation()
     
+    def get_screen_regions(self):
+        """Every screen area that changes during play, with the state it shows"""
+        regions = {}
+        for player_id in range(self.num_players):
+            x, y = self.get_token_center(player_id)
+            regions['token', player_id] = (pygame.Rect(x - 18, y - 18, 39, 39), None)
+        regions['dice'] = (pygame.Rect(650, 100, 83, 83), self.dice_face)
+        regions['status'] = (pygame.Rect(650, 175, 150, 75 + 50 * self.num_players),
+                             (self.current_player, tuple(self.player_positions), tuple(self.scores),
+                              self.waiting_for_question, self.animating, self.game_over))
+        regions['game_over'] = (self.screen.get_rect(), (self.game_over, self.winner))
+        return regions
+    
+    def invalidate(self):
+        """Force the next draw to repaint and push the whole window"""
+        self.needs_full_redraw = True
+    
     def draw(self):
-        """Main draw function"""
+        """Main draw function; returns the changed screen rectangles (empty when idle)"""
+        if self.dice_rolling:
+            # A new face dice_face_rate times a second, whatever the frame rate
+            slot = int(self.dice_tween.elapsed * self.dice_face_rate)
+            self.dice_face = self.dice_faces[slot % 6]
+        else:
+            self.dice_face = self.dice_value
+        if self.layout.follow(self.get_focus_square()):
+            self.needs_full_redraw = True  # the board scrolled
+        regions = self.get_screen_regions()
+        
+        if self.needs_full_redraw:
+            dirty = [self.screen.get_rect()]
+        else:
+            dirty = []
+            for name, region in regions.items():
+                previous = self.drawn_regions.get(name)
+                if previous != region:
+                    dirty.append(region[0])
+                    if previous:
+                        dirty.append(previous[0])
+        
+        if not dirty:
+            return []
+        
         self.draw_board()
         self.draw_players()
         self.draw_dice()
         self.draw_ui()
-        pygame.display.flip()
\ No newline at end of file
+        
+        self.drawn_regions = regions
+        self.needs_full_redraw = False
+        return dirty
@@ -0,0 +1,156 @@
+"""Exact Markov-chain analysis of a board layout.
+
+A single token is a Markov chain over squares 0..last: each roll moves it
+to ``jump[square + roll]``, or leaves it in place when the roll would
+overshoot the last square, which is absorbing. The chain is stored
+sparsely as a (squares x 6) successor table, so boards up to 50x50 cost
+only a few array passes per turn.
+
+Players move independently, so the multi-player results follow from the
+single-token distribution of turns to finish.
+
+    python -m game.markov --players 4
+"""
+import argparse
+from functools import lru_cache
+
+import numpy as np
+
+from game.engine import Board
+
+# Stop iterating once the probability of still being in play is below this
+TAIL_TOLERANCE = 1e-12
+MAX_TURNS = 1000000
+
+
+def successor_table(board):
+    """(last + 1, 6) array: the square reached from each square on each roll"""
+    last = board.last_square
+    jumps = np.array(board.jump_table(), dtype=np.int64)
+    squares = np.arange(last + 1)[:, None]
+    target = squares + np.arange(1, 7)[None, :]
+    successors = np.where(target <= last, jumps[np.minimum(target, last)], squares)
+    successors[last] = last
+    return successors
+
+
+def single_token_walk(board, weights=None, tolerance=TAIL_TOLERANCE, max_turns=MAX_TURNS):
+    """Walk one token's distribution over the squares roll by roll.
+
+    Returns (finish, visits): finish[t] is the probability of reaching the
+    last square on exactly the t-th roll. When weights is given (one row
+    per seat, one column per roll), visits[i] sums weights[i][t] times the
+    distribution over squares before roll t + 1.
+    """
+    last = board.last_square
+    successors = successor_table(board).ravel()
+
+    distribution = np.zeros(last + 1)
+    distribution[1] = 1.0
+    finish = [0.0]
+    visits = None if weights is None else np.zeros((len(weights), last + 1))
+    for turn in range(max_turns):
+        if visits is not None:
+            if turn >= weights.shape[1]:
+                break
+            visits += np.outer(weights[:, turn], distribution)
+        moved = np.bincount(successors, weights=np.repeat(distribution / 6.0, 6), minlength=last + 1)
+        finish.append(moved[last])
+        moved[last] = 0.0
+        distribution = moved
+        if distribution.sum() < tolerance:
+            break
+    return np.array(finish), visits
+
+
+class BoardAnalysis:
+    """Exact game statistics for one board and player count.
+
+    length_distribution[n] is the probability the game ends on the n-th
+    dice roll (all seats counted); win_probabilities[i] is the chance seat
+    i wins; square_visits[i][s] is the expected number of turns seat i
+    starts on square s.
+    """
+
+    def __init__(self, board, num_players, finish):
+        self.board = board
+        self.num_players = num_players
+        self.turn_distribution = finish
+        self.expected_turns = float(np.arange(len(finish)) @ finish)
+
+        rounds = len(finish)
+        # survival[t] = P(a single token has not finished after t rolls)
+        survival = np.clip(1.0 - np.cumsum(finish), 0.0, 1.0)
+        survival_next = np.append(survival[1:], 0.0)
+
+        length = np.zeros(rounds * num_players + 1)
+        wins = np.zeros(num_players)
+        still_playing = np.zeros((num_players, rounds))
+        for seat in range(num_players):
+            # Seat wins on its r-th roll: seats before it have rolled r times,
+            # seats after it r - 1 times, and none of them finished yet.
+            previous = np.append(1.0, survival[:-1])
+            won = finish * survival ** seat * previous ** (num_players - 1 - seat)
+            won[0] = 0.0
+            length[(np.arange(1, rounds) - 1) * num_players + seat + 1] += won[1:]
+            wins[seat] = won.sum()
+
+            # Before its (r + 1)-th roll, earlier seats have rolled r + 1
+            # times and later seats r times.
+            still_playing[seat] = survival_next ** seat * survival ** (num_players - 1 - seat)
+        _, visits = single_token_walk(board, still_playing)
+
+        self.length_distribution = length
+        self.expected_length = float(np.arange(len(length)) @ length)
+        self.win_probabilities = wins
+        self.square_visits = visits
+        for array in (self.turn_distribution, self.length_distribution, self.win_probabilities, self.square_visits):
+            array.flags.writeable = False
+
+    def length_percentile(self, q):
+        """Dice rolls within which the game has ended with probability q"""
+        return int(np.searchsorted(np.cumsum(self.length_distribution), q))
+
+    def summary(self):
+        visits = self.square_visits.sum(axis=0)
+        busiest = np.argsort(visits)[::-1][:5]
+        lines = [
+            f"Players: {self.num_players}",
+            f"Expected dice rolls per game: {self.expected_length:.3f} "
+            f"(median {self.length_percentile(0.5)}, p95 {self.length_percentile(0.95)})",
+            f"Expected rolls for one token to finish alone: {self.expected_turns:.3f}",
+            "Win probability by seat: " + ", ".join(
+                f"P{seat + 1} {p:.2%}" for seat, p in enumerate(self.win_probabilities)),
+            "Most visited squares: " + ", ".join(f"{square} ({visits[square]:.2f})" for square in busiest),
+        ]
+        return "\n".join(lines)
+
+
+@lru_cache(maxsize=256)
+def _turns_to_finish(board_key):
+    finish, _ = single_token_walk(Board.from_key(board_key))
+    return finish
+
+
+@lru_cache(maxsize=256)
+def _analyze(board_key, num_players):
+    return BoardAnalysis(Board.from_key(board_key), num_players, _turns_to_finish(board_key))
+
+
+def analyze_board(board=None, num_players=1):
+    """Return the (cached) BoardAnalysis for a board and player count"""
+    if not 1 <= num_players <= 4:
+        raise ValueError("num_players must be between 1 and 4")
+    board = board if board is not None else Board()
+    return _analyze(board.key(), num_players)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exact statistics for a Snake and Ladder board")
+    parser.add_argument('--players', type=int, default=1)
+    args = parser.parse_args()
+    print(analyze_board(num_players=args.players).summary())
+
+
+if __name__ == '__main__':
+    main()
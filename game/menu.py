@@ -1,4 +1,5 @@
 import pygame
+from game.text_cache import render_text
 
 class StartMenu:
     def __init__(self, screen, font, big_font, colors):
@@ -18,15 +19,15 @@ class StartMenu:
         self.screen.fill(self.colors['BEIGE'])
         
         # Title with shadow
-        title_shadow = self.big_font.render("Cloud Ladder", True, (150, 150, 150))
+        title_shadow = render_text(self.big_font, "Cloud Ladder", True, (150, 150, 150))
         title_rect_shadow = title_shadow.get_rect(center=(402, 152))
         self.screen.blit(title_shadow, title_rect_shadow)
         
-        title = self.big_font.render("Cloud Ladder", True, self.colors['DARK_RED'])
+        title = render_text(self.big_font, "Cloud Ladder", True, self.colors['DARK_RED'])
         title_rect = title.get_rect(center=(400, 150))
         self.screen.blit(title, title_rect)
         
-        subtitle = self.font.render("AWS Edition", True, self.colors['GOLD'])
+        subtitle = render_text(self.font, "AWS Edition", True, self.colors['GOLD'])
         subtitle_rect = subtitle.get_rect(center=(400, 190))
         self.screen.blit(subtitle, subtitle_rect)
         
@@ -55,12 +56,12 @@ class StartMenu:
             pygame.draw.rect(self.screen, border_color, option_rect, border_width, border_radius=15)
             
             # Option text
-            option_text = self.font.render(option, True, text_color)
+            option_text = render_text(self.font, option, True, text_color)
             text_rect = option_text.get_rect(center=option_rect.center)
             self.screen.blit(option_text, text_rect)
         
         # Instructions
-        instruction = self.font.render("Use ↑↓ arrows to select, ENTER to start", True, self.colors['BLACK'])
+        instruction = render_text(self.font, "Use ↑↓ arrows to select, ENTER to start", True, self.colors['BLACK'])
         instruction_rect = instruction.get_rect(center=(400, 500))
         self.screen.blit(instruction, instruction_rect)
         
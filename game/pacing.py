@@ -0,0 +1,107 @@
+"""Adaptive frame pacing for the main loop.
+
+GameController tells the FrameScheduler each frame how busy the screen
+is, and the scheduler picks the frame rate:
+
+    active   something is animating (dice, tokens, messages): 60 FPS
+    ambient  only decoration moves (the menu's sparkles): AMBIENT_FPS,
+             falling back to idle AMBIENT_SECONDS after the last input
+    idle     nothing moves: block in pygame.event.wait until input
+             arrives or the timeout passes
+
+Animations are timed on game.animation.AnimationClock, so a lower
+frame rate shows fewer frames of the same motion, not slower motion. The
+scheduler records wall time, process CPU time and, where Linux exposes
+RAPL counters, package energy for every mode; report() summarises them.
+"""
+import time
+
+import pygame
+
+FULL_FPS = 60
+AMBIENT_FPS = 20
+IDLE_TIMEOUT_MS = 1000
+AMBIENT_SECONDS = 60.0
+
+ACTIVE = 'active'
+AMBIENT = 'ambient'
+IDLE = 'idle'
+MODES = (ACTIVE, AMBIENT, IDLE)
+
+RAPL_ENERGY = '/sys/class/powercap/intel-rapl:0/energy_uj'
+
+
+def energy_joules():
+    """CPU package energy counter in joules (Linux RAPL), or None"""
+    try:
+        with open(RAPL_ENERGY) as f:
+            return int(f.read()) / 1e6
+    except (OSError, ValueError):
+        return None
+
+
+class FrameScheduler:
+    def __init__(self, full_fps=FULL_FPS, ambient_fps=AMBIENT_FPS, ambient_seconds=AMBIENT_SECONDS):
+        self.clock = pygame.time.Clock()
+        self.rates = {ACTIVE: full_fps, AMBIENT: ambient_fps}
+        self.ambient_seconds = ambient_seconds
+        self.mode = ACTIVE
+        self.last_input = time.monotonic()
+        self.frames = dict.fromkeys(MODES, 0)
+        self.wall_seconds = dict.fromkeys(MODES, 0.0)
+        self.cpu_seconds = dict.fromkeys(MODES, 0.0)
+        self.energy = dict.fromkeys(MODES, 0.0)
+        self.has_energy = energy_joules() is not None
+        self.mark = self.sample()
+
+    def sample(self):
+        return time.perf_counter(), time.process_time(), energy_joules() or 0.0
+
+    def account(self):
+        """Charge the time since the last frame to the mode it ran in"""
+        now = self.sample()
+        wall, cpu, energy = (b - a for a, b in zip(self.mark, now))
+        self.wall_seconds[self.mode] += wall
+        self.cpu_seconds[self.mode] += cpu
+        # The counter wraps around; drop that interval
+        self.energy[self.mode] += max(0.0, energy)
+        self.frames[self.mode] += 1
+        self.mark = now
+
+    def next_frame(self, mode, idle_timeout=IDLE_TIMEOUT_MS):
+        """Wait for the next frame in mode; returns the events that arrived meanwhile.
+
+        The mode actually used is left in self.mode: an unattended ambient
+        screen runs as idle.
+        """
+        self.account()
+        if mode == AMBIENT and time.monotonic() - self.last_input > self.ambient_seconds:
+            mode = IDLE
+        self.mode = mode
+        if mode == IDLE:
+            event = pygame.event.wait(idle_timeout)
+            events = [] if event.type == pygame.NOEVENT else [event]
+            # Whatever arrived with it, and restart the clock so the next
+            # active frame does not count the wait
+            events += pygame.event.get()
+            self.clock.tick()
+        else:
+            self.clock.tick(self.rates[mode])
+            events = pygame.event.get()
+        if events:
+            self.last_input = time.monotonic()
+        return events
+
+    def report(self):
+        """One line per mode that ran: frames, frame rate and CPU (and power where measurable)"""
+        lines = []
+        for mode in MODES:
+            wall = self.wall_seconds[mode]
+            if not self.frames[mode] or wall <= 0:
+                continue
+            line = (f"{mode:<8}{wall:8.1f}s {self.frames[mode]:7d} frames {self.frames[mode] / wall:6.1f} FPS "
+                    f"CPU {self.cpu_seconds[mode] / wall:6.1%}")
+            if self.has_energy:
+                line += f"  package {self.energy[mode] / wall:5.1f} W"
+            lines.append(line)
+        return lines
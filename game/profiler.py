@@ -0,0 +1,169 @@
+"""Per-phase frame timing with an on-screen overlay.
+
+GameController times event handling, update, display updates and, via
+instrument(), every draw_* method of the game and menu objects. The
+overlay (F3, or SNAKE_LADDER_PROFILE=1 at startup) shows rolling
+p50/p95/p99 per phase and a frame-time graph. Setting
+SNAKE_LADDER_PROFILE_LOG to a .csv or .jsonl path also writes every
+frame's timings to that file.
+"""
+import json
+import os
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+import pygame
+
+from game.text_cache import render_text, text_cache
+
+FRAME_BUDGET_MS = 1000.0 / 60
+OVERLAY_ROWS = 16
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+class FrameProfiler:
+    def __init__(self, show_overlay=False, log_path=None, window=300):
+        self.show_overlay = show_overlay
+        self.window = window
+        self.frame_times = deque(maxlen=window)
+        self.phase_times = defaultdict(lambda: deque(maxlen=window))
+        self.frame_phases = defaultdict(float)
+        self.frame_number = 0
+        self.frame_start = None
+
+        self.log_file = None
+        self.log_format = None
+        if log_path:
+            self.log_format = 'csv' if log_path.endswith('.csv') else 'jsonl'
+            self.log_file = open(log_path, 'w')
+            if self.log_format == 'csv':
+                self.log_file.write("frame,phase,ms\n")
+
+    @classmethod
+    def from_environment(cls):
+        return cls(show_overlay=bool(os.environ.get('SNAKE_LADDER_PROFILE')),
+                   log_path=os.environ.get('SNAKE_LADDER_PROFILE_LOG'))
+
+    @property
+    def enabled(self):
+        # Timing runs while the overlay is shown or timings are being logged
+        return self.show_overlay or self.log_file is not None
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+
+    def begin_frame(self):
+        if self.enabled:
+            self.frame_start = time.perf_counter()
+            self.frame_phases.clear()
+
+    def end_frame(self):
+        if not self.enabled or self.frame_start is None:
+            return
+        total = (time.perf_counter() - self.frame_start) * 1000.0
+        self.frame_times.append(total)
+        for name, ms in self.frame_phases.items():
+            self.phase_times[name].append(ms)
+        self.frame_number += 1
+        if self.log_file:
+            self.write_log(total)
+
+    def write_log(self, total):
+        if self.log_format == 'csv':
+            for name, ms in self.frame_phases.items():
+                self.log_file.write(f"{self.frame_number},{name},{ms:.4f}\n")
+            self.log_file.write(f"{self.frame_number},frame,{total:.4f}\n")
+        else:
+            record = {'frame': self.frame_number, 'frame_ms': round(total, 4)}
+            record.update((name, round(ms, 4)) for name, ms in self.frame_phases.items())
+            self.log_file.write(json.dumps(record) + "\n")
+
+    @contextmanager
+    def phase(self, name):
+        """Time the body of a with-block as one phase of the current frame"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.frame_phases[name] += (time.perf_counter() - start) * 1000.0
+
+    def instrument(self, obj):
+        """Time every draw_* method of obj as its own phase"""
+        prefix = type(obj).__name__
+        for name in dir(type(obj)):
+            if name.startswith('draw_') and callable(getattr(obj, name)):
+                setattr(obj, name, self.timed(f"{prefix}.{name}", getattr(obj, name)))
+        return obj
+
+    def timed(self, phase_name, method):
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return method(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.frame_phases[phase_name] += (time.perf_counter() - start) * 1000.0
+        return wrapper
+
+    def stats(self):
+        """{phase: (p50, p95, p99)} in milliseconds over the rolling window"""
+        stats = {'frame': self.percentiles(self.frame_times)}
+        for name, times in self.phase_times.items():
+            stats[name] = self.percentiles(times)
+        return stats
+
+    def percentiles(self, values):
+        ordered = sorted(values)
+        return percentile(ordered, 0.50), percentile(ordered, 0.95), percentile(ordered, 0.99)
+
+    def draw_overlay(self, surface, font):
+        """Draw the timing table and frame graph; returns the rectangle covered"""
+        stats = self.stats()
+        rows = [("phase", "p50", "p95", "p99"), ("frame",) + stats.pop('frame')]
+        slowest = sorted(stats, key=lambda name: -stats[name][1])[:OVERLAY_ROWS - len(rows)]
+        rows.extend((name,) + stats[name] for name in slowest)
+
+        # Fixed size, so a shrinking table never leaves stale pixels behind
+        line_height = 16
+        graph_height = 50
+        rect = pygame.Rect(8, 8, 300, OVERLAY_ROWS * line_height + graph_height + 16)
+        pygame.draw.rect(surface, (20, 20, 30), rect)
+
+        y = rect.y + 4
+        for row in rows:
+            label = row[0] if len(row[0]) <= 30 else "..." + row[0][-27:]
+            surface.blit(render_text(font, label, True, (230, 230, 230)), (rect.x + 4, y))
+            for column, value in enumerate(row[1:]):
+                # Timings change every frame, so they bypass the shared text cache,
+                # but not its lock: fonts are not safe to use from two threads at once
+                text = value if isinstance(value, str) else f"{value:.2f}"
+                with text_cache.lock:
+                    rendered = font.render(text, True, (230, 230, 230))
+                surface.blit(rendered, (rect.x + 190 + column * 36, y))
+            y += line_height
+
+        # Frame-time graph, one pixel column per frame; the line marks 60 FPS
+        graph = pygame.Rect(rect.x + 4, rect.bottom - graph_height - 6, rect.width - 8, graph_height)
+        scale = graph_height / (2 * FRAME_BUDGET_MS)
+        for x, ms in enumerate(list(self.frame_times)[-graph.width:]):
+            height = min(graph_height, int(ms * scale))
+            color = (80, 200, 80) if ms <= FRAME_BUDGET_MS else (230, 70, 70)
+            pygame.draw.line(surface, color, (graph.x + x, graph.bottom), (graph.x + x, graph.bottom - height))
+        budget_y = graph.bottom - int(FRAME_BUDGET_MS * scale)
+        pygame.draw.line(surface, (255, 215, 0), (graph.x, budget_y), (graph.right, budget_y))
+        return rect
+
+    def close(self):
+        if self.log_file:
+            self.log_file.close()
+            self.log_file = None
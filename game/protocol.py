@@ -0,0 +1,257 @@
+"""Binary wire protocol between the game server and its clients.
+
+Every message is a frame: a 3-byte header (uint16 payload length, uint8
+message type) followed by the payload. All integers are little-endian.
+A dice roll and its outcome travel as 3 + 9 bytes, so one server core
+spends its time on game rules rather than on parsing.
+
+Client to server:
+    JOIN   <IB  room id (0: any open room), seats; then the player name in UTF-8
+    ROLL        roll the dice (only on your turn)
+    LEAVE       give up the seat (or stop watching)
+    PING   <d   client timestamp, echoed back in PONG
+    WATCH  <I   spectate a room
+
+Server to client:
+    WELCOME <IBB room id, your seat (255 when watching), seats
+    BOARD   <BBHH rows, columns, ladder count, snake count; then <HH start/end pairs
+    START   <B   player to move first
+    MOVED   <BBHHBBB player, dice, start, end, jump (0 none, 1 ladder, 2 snake), next player, won
+    PONG    <d   the PING timestamp
+    ERROR   <B   error code; then a UTF-8 message
+    CLOSED  <B   reason the room ended (a player left, or the game is over for spectators)
+    KEYFRAME     the full game state (see below)
+    DELTA        what changed since the previous KEYFRAME/DELTA
+
+Spectators get game state rather than moves: a KEYFRAME as soon as they
+start watching, then one DELTA per server tick holding only the fields
+that changed, and a fresh KEYFRAME every few seconds. Both start with a
+uint32 sequence number; a DELTA applies only to the state numbered one
+less. The animation path of the last move is always a run of consecutive
+squares plus an optional jump, so it travels as (first, length, jump end)
+instead of one square per step.
+
+    KEYFRAME <IBBBBB sequence, seats, current player, dice, game over, winner (255: none);
+             then <H position per seat and a path
+    DELTA    <IB sequence, changed fields (DELTA_* bits); then, in bit order:
+             <B current player, <B dice, <B changed-seat mask followed by
+             <H per changed seat, a path, <BB game over and winner
+    path     <HBH first square, squares in the run, jump end (0: none)
+"""
+import struct
+from collections import namedtuple
+
+HEADER = struct.Struct('<HB')
+MAX_PAYLOAD = 0xFFFF
+
+# Client to server
+JOIN = 1
+ROLL = 2
+LEAVE = 3
+PING = 4
+WATCH = 5
+
+# Server to client
+WELCOME = 16
+BOARD = 17
+START = 18
+MOVED = 19
+PONG = 20
+ERROR = 21
+CLOSED = 22
+KEYFRAME = 23
+DELTA = 24
+
+JOIN_BODY = struct.Struct('<IB')
+WELCOME_BODY = struct.Struct('<IBB')
+BOARD_BODY = struct.Struct('<BBHH')
+JUMP_PAIR = struct.Struct('<HH')
+START_BODY = struct.Struct('<B')
+MOVED_BODY = struct.Struct('<BBHHBBB')
+PING_BODY = struct.Struct('<d')
+CODE_BODY = struct.Struct('<B')
+WATCH_BODY = struct.Struct('<I')
+KEYFRAME_BODY = struct.Struct('<IBBBBB')
+DELTA_BODY = struct.Struct('<IB')
+PATH_BODY = struct.Struct('<HBH')
+SQUARE = struct.Struct('<H')
+BYTE = struct.Struct('<B')
+OVER_BODY = struct.Struct('<BB')
+
+JUMP_CODES = {None: 0, 'ladder': 1, 'snake': 2}
+JUMP_NAMES = {code: name for name, code in JUMP_CODES.items()}
+
+# ERROR codes
+NOT_YOUR_TURN = 1
+NOT_IN_GAME = 2
+BAD_MESSAGE = 3
+ROOM_FULL = 4
+
+# CLOSED reasons
+PLAYER_LEFT = 1
+GAME_OVER = 2
+
+SPECTATOR_SEAT = 255
+
+# DELTA field bits
+DELTA_TURN = 1
+DELTA_DICE = 2
+DELTA_POSITIONS = 4
+DELTA_PATH = 8
+DELTA_OVER = 16
+NO_WINNER = 255
+
+# What spectators see of a game; path is the last move's animation steps
+GameState = namedtuple('GameState', ['positions', 'current_player', 'dice_value', 'path', 'game_over', 'winner'])
+
+
+def frame(kind, payload=b''):
+    if len(payload) > MAX_PAYLOAD:
+        raise ValueError(f"payload of {len(payload)} bytes is too large")
+    return HEADER.pack(len(payload), kind) + payload
+
+
+def join(room_id, seats, name=''):
+    return frame(JOIN, JOIN_BODY.pack(room_id, seats) + name.encode('utf-8'))
+
+
+def welcome(room_id, seat, seats):
+    return frame(WELCOME, WELCOME_BODY.pack(room_id, seat, seats))
+
+
+def board_message(board):
+    ladders = sorted(board.ladders.items())
+    snakes = sorted(board.snakes.items())
+    pairs = b''.join(JUMP_PAIR.pack(start, end) for start, end in ladders + snakes)
+    return frame(BOARD, BOARD_BODY.pack(board.rows, board.columns, len(ladders), len(snakes)) + pairs)
+
+
+def parse_board(payload):
+    """(rows, columns, ladders, snakes) from a BOARD payload"""
+    rows, columns, ladder_count, snake_count = BOARD_BODY.unpack_from(payload)
+    pairs = [JUMP_PAIR.unpack_from(payload, BOARD_BODY.size + i * JUMP_PAIR.size)
+             for i in range(ladder_count + snake_count)]
+    return rows, columns, dict(pairs[:ladder_count]), dict(pairs[ladder_count:])
+
+
+def moved(player, dice, start, end, jump, next_player, won):
+    return frame(MOVED, MOVED_BODY.pack(player, dice, start, end, JUMP_CODES[jump], next_player, won))
+
+
+def error(code, text=''):
+    return frame(ERROR, CODE_BODY.pack(code) + text.encode('utf-8'))
+
+
+def pack_path(path):
+    if not path:
+        return PATH_BODY.pack(0, 0, 0)
+    run = len(path)
+    jump_end = 0
+    if run > 1 and path[-1] != path[-2] + 1:
+        run -= 1
+        jump_end = path[-1]
+    return PATH_BODY.pack(path[0], run, jump_end)
+
+
+def unpack_path(payload, offset):
+    first, run, jump_end = PATH_BODY.unpack_from(payload, offset)
+    path = tuple(range(first, first + run))
+    return path + (jump_end,) if jump_end else path
+
+
+def keyframe(sequence, state):
+    winner = NO_WINNER if state.winner is None else state.winner
+    body = KEYFRAME_BODY.pack(sequence, len(state.positions), state.current_player, state.dice_value,
+                              state.game_over, winner)
+    positions = struct.pack(f'<{len(state.positions)}H', *state.positions)
+    return frame(KEYFRAME, body + positions + pack_path(state.path))
+
+
+def parse_keyframe(payload):
+    """(sequence, GameState) from a KEYFRAME payload"""
+    sequence, seats, current_player, dice_value, game_over, winner = KEYFRAME_BODY.unpack_from(payload)
+    offset = KEYFRAME_BODY.size
+    positions = struct.unpack_from(f'<{seats}H', payload, offset)
+    path = unpack_path(payload, offset + 2 * seats)
+    return sequence, GameState(positions, current_player, dice_value, path, bool(game_over),
+                               None if winner == NO_WINNER else winner)
+
+
+def delta(sequence, old, new):
+    """DELTA frame turning state old into new"""
+    fields = 0
+    parts = []
+    if new.current_player != old.current_player:
+        fields |= DELTA_TURN
+        parts.append(BYTE.pack(new.current_player))
+    if new.dice_value != old.dice_value:
+        fields |= DELTA_DICE
+        parts.append(BYTE.pack(new.dice_value))
+    if new.positions != old.positions:
+        fields |= DELTA_POSITIONS
+        changed = [seat for seat, (a, b) in enumerate(zip(old.positions, new.positions)) if a != b]
+        parts.append(BYTE.pack(sum(1 << seat for seat in changed)))
+        parts.extend(SQUARE.pack(new.positions[seat]) for seat in changed)
+    if new.path != old.path:
+        fields |= DELTA_PATH
+        parts.append(pack_path(new.path))
+    if new.game_over != old.game_over or new.winner != old.winner:
+        fields |= DELTA_OVER
+        parts.append(OVER_BODY.pack(new.game_over, NO_WINNER if new.winner is None else new.winner))
+    return frame(DELTA, DELTA_BODY.pack(sequence, fields) + b''.join(parts))
+
+
+def apply_delta(state, payload):
+    """(sequence, GameState) after applying a DELTA payload to state"""
+    sequence, fields = DELTA_BODY.unpack_from(payload)
+    offset = DELTA_BODY.size
+    current_player, dice_value, positions = state.current_player, state.dice_value, state.positions
+    path, game_over, winner = state.path, state.game_over, state.winner
+    if fields & DELTA_TURN:
+        current_player = payload[offset]
+        offset += 1
+    if fields & DELTA_DICE:
+        dice_value = payload[offset]
+        offset += 1
+    if fields & DELTA_POSITIONS:
+        mask = payload[offset]
+        offset += 1
+        positions = list(positions)
+        for seat in range(len(positions)):
+            if mask & (1 << seat):
+                positions[seat] = SQUARE.unpack_from(payload, offset)[0]
+                offset += SQUARE.size
+        positions = tuple(positions)
+    if fields & DELTA_PATH:
+        path = unpack_path(payload, offset)
+        offset += PATH_BODY.size
+    if fields & DELTA_OVER:
+        game_over, winner = OVER_BODY.unpack_from(payload, offset)
+        game_over = bool(game_over)
+        winner = None if winner == NO_WINNER else winner
+    return sequence, GameState(positions, current_player, dice_value, path, game_over, winner)
+
+
+class FrameBuffer:
+    """Reassembles frames from a byte stream that arrives in arbitrary pieces"""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        """Add received bytes and return every complete (kind, payload) frame"""
+        buffer = self.buffer
+        buffer += data
+        frames = []
+        offset = 0
+        end = len(buffer)
+        while end - offset >= HEADER.size:
+            length, kind = HEADER.unpack_from(buffer, offset)
+            start = offset + HEADER.size
+            if end - start < length:
+                break
+            frames.append((kind, bytes(buffer[start:start + length])))
+            offset = start + length
+        if offset:
+            del buffer[:offset]
+        return frames
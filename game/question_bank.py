@@ -0,0 +1,153 @@
+"""Question storage that scales to large certification banks.
+
+A JSON Lines bank (one question object per line) is never loaded as a
+whole: the file is memory-mapped and a binary index of line offsets,
+kept next to it as ``<file>.idx``, locates each question. Only the
+question that is actually drawn gets decoded. The small legacy
+``{"questions": [...]}`` JSON files are still read into memory, and
+compiled ``.qpack`` files are handled by game.question_pack.
+
+RandomDraw hands out indexes without replacement in constant time per
+draw, without building or shuffling a list of the whole bank.
+"""
+import json
+import mmap
+import os
+import random
+import struct
+from array import array
+
+from game.question_pack import QuestionPackBank
+
+INDEX_MAGIC = b'SLQI'
+INDEX_VERSION = 1
+# magic, version, source size, source mtime (ns), question count
+INDEX_HEADER = struct.Struct('<4sIQQQ')
+
+
+class InMemoryQuestionBank:
+    """Questions from a legacy JSON file, held as a list"""
+
+    def __init__(self, questions):
+        self.questions = questions
+
+    def __len__(self):
+        return len(self.questions)
+
+    def load(self, index):
+        return self.questions[index]
+
+    def close(self):
+        pass
+
+
+class JsonLinesQuestionBank:
+    """Memory-mapped JSON Lines file with a persistent offset index"""
+
+    def __init__(self, path):
+        self.path = path
+        self.index_path = path + '.idx'
+        self.file = open(path, 'rb')
+        size = os.fstat(self.file.fileno()).st_size
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self.offsets = self.open_index()
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def load(self, index):
+        """Decode question number index"""
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return json.loads(self.data[start:end])
+
+    def source_signature(self):
+        stat = os.stat(self.path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def open_index(self):
+        """Map the offset index, rebuilding it if it is missing or stale"""
+        size, mtime = self.source_signature()
+        try:
+            with open(self.index_path, 'rb') as f:
+                header = f.read(INDEX_HEADER.size)
+                magic, version, indexed_size, indexed_mtime, count = INDEX_HEADER.unpack(header)
+                if (magic, version, indexed_size, indexed_mtime) == (INDEX_MAGIC, INDEX_VERSION, size, mtime):
+                    index_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    return memoryview(index_map)[INDEX_HEADER.size:].cast('Q')[:count + 1]
+        except (OSError, struct.error):
+            pass
+        return self.build_index(size, mtime)
+
+    def build_index(self, size, mtime):
+        """Scan the file once for line starts and save them next to it"""
+        offsets = array('Q')
+        position = 0
+        end = len(self.data)
+        while position < end:
+            newline = self.data.find(b'\n', position)
+            if newline == -1:
+                newline = end
+            if self.data[position:newline].strip():
+                offsets.append(position)
+                # The entry after the last question marks where it ends
+                last_end = newline
+            position = newline + 1
+        count = len(offsets)
+        offsets.append(last_end if count else 0)
+
+        try:
+            with open(self.index_path, 'wb') as f:
+                f.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, size, mtime, count))
+                offsets.tofile(f)
+        except OSError:
+            pass  # read-only location: keep the index in memory only
+        return memoryview(offsets)
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.file.close()
+
+
+def open_question_bank(path):
+    """Open a .qpack or .jsonl bank lazily, or read a legacy JSON question file"""
+    if path.endswith('.qpack'):
+        return QuestionPackBank(path)
+    if path.endswith('.jsonl'):
+        return JsonLinesQuestionBank(path)
+    with open(path, 'r') as f:
+        return InMemoryQuestionBank(json.load(f)['questions'])
+
+
+def write_json_lines(questions, path):
+    """Write questions as a JSON Lines bank"""
+    with open(path, 'w') as f:
+        for question in questions:
+            f.write(json.dumps(question, ensure_ascii=False) + "\n")
+
+
+class RandomDraw:
+    """Draw 0..size-1 in random order without replacement.
+
+    An incremental Fisher-Yates shuffle that only remembers the swapped
+    slots, so starting a draw is O(1) and so is every draw.
+    """
+
+    def __init__(self, size, rng=None):
+        self.rng = rng if rng is not None else random.Random()
+        self.remaining = size
+        self.swapped = {}
+
+    def __len__(self):
+        return self.remaining
+
+    def next(self):
+        """Next index, or None once every index has been drawn"""
+        if self.remaining == 0:
+            return None
+        pick = self.rng.randrange(self.remaining)
+        last = self.remaining - 1
+        chosen = self.swapped.get(pick, pick)
+        self.swapped[pick] = self.swapped.pop(last, last)
+        self.remaining = last
+        return chosen
@@ -0,0 +1,209 @@
+"""Inverted indexes over a question bank for filtered selection.
+
+Every question is tagged with a topic, a difficulty and a language.
+QuestionIndex keeps one small integer code per question and field, plus
+a posting list (the sorted question numbers) for every tag value, so a
+query like "medium Lambda questions this player hasn't seen" only looks
+at the shortest matching posting list instead of the whole bank.
+
+Compiled packs store the tags as record columns already; for JSON Lines
+banks the codes are cached next to the bank as ``<bank>.tags.npz`` so
+large banks are only scanned once.
+"""
+from collections import deque
+
+import numpy as np
+
+FIELDS = ('topic', 'difficulty', 'language')
+DIFFICULTIES = ('easy', 'medium', 'hard')
+DEFAULT_TAGS = {'topic': 'General', 'difficulty': 'medium', 'language': 'en'}
+
+# Random picks tried before falling back to filtering the whole posting list
+MAX_SAMPLE_TRIES = 32
+
+
+class QuestionIndex:
+    def __init__(self, values, codes):
+        # values: {field: [tag value for each code]}
+        # codes: {field: per-question code array}
+        self.values = values
+        self.codes = codes
+        self.size = len(codes[FIELDS[0]])
+        self.lookup = {field: {value: code for code, value in enumerate(values[field])} for field in FIELDS}
+        self.postings = {field: self.build_postings(codes[field], len(values[field])) for field in FIELDS}
+
+        # One more posting list per (topic, difficulty, language) combination,
+        # so fully specified queries never have to skip non-matches
+        self.strides = {}
+        combos = np.zeros(self.size, dtype=np.int64)
+        stride = 1
+        for field in FIELDS:
+            self.strides[field] = stride
+            combos += codes[field].astype(np.int64) * stride
+            stride *= max(1, len(values[field]))
+        order = np.argsort(combos, kind='stable').astype(np.uint32)
+        keys, starts = np.unique(combos[order], return_index=True)
+        self.combo_postings = dict(zip(keys.tolist(), np.split(order, starts[1:])))
+
+    @staticmethod
+    def build_postings(codes, num_values):
+        """Split the question numbers into one sorted array per code"""
+        order = np.argsort(codes, kind='stable').astype(np.uint32)
+        bounds = np.cumsum(np.bincount(codes, minlength=num_values))
+        return np.split(order, bounds[:-1])
+
+    @classmethod
+    def from_questions(cls, questions):
+        """Index an iterable of question dicts"""
+        values = {field: [] for field in FIELDS}
+        lookup = {field: {} for field in FIELDS}
+        codes = {field: [] for field in FIELDS}
+        for question in questions:
+            for field in FIELDS:
+                value = question.get(field, DEFAULT_TAGS[field])
+                code = lookup[field].get(value)
+                if code is None:
+                    code = lookup[field][value] = len(values[field])
+                    values[field].append(value)
+                codes[field].append(code)
+        return cls(values, {field: np.array(codes[field], dtype=np.uint16) for field in FIELDS})
+
+    @classmethod
+    def from_bank(cls, bank):
+        """Index a question bank, reusing the sidecar cache when there is one"""
+        if hasattr(bank, 'tag_codes'):
+            # Compiled packs already store the tags as columns
+            values, codes = {}, {}
+            for field in FIELDS:
+                values[field], codes[field] = bank.tag_codes(field, DEFAULT_TAGS[field])
+            return cls(values, codes)
+
+        path = getattr(bank, 'path', None)
+        if path is None:
+            return cls.from_questions(bank.load(i) for i in range(len(bank)))
+
+        cache_path = path + '.tags.npz'
+        signature = np.array(bank.source_signature(), dtype=np.int64)
+        try:
+            with np.load(cache_path) as cached:
+                if np.array_equal(cached['signature'], signature):
+                    return cls({field: cached[field + '_values'].tolist() for field in FIELDS},
+                               {field: cached[field] for field in FIELDS})
+        except (OSError, KeyError, ValueError):
+            pass
+
+        index = cls.from_questions(bank.load(i) for i in range(len(bank)))
+        arrays = {'signature': signature}
+        for field in FIELDS:
+            arrays[field] = index.codes[field]
+            arrays[field + '_values'] = np.array(index.values[field], dtype=str)
+        try:
+            with open(cache_path, 'wb') as f:
+                np.savez(f, **arrays)
+        except OSError:
+            pass  # read-only location: index again next time
+        return index
+
+    def wanted_codes(self, filters):
+        """Map {field: value} filters to codes; None if a value never occurs"""
+        wanted = {}
+        for field, value in filters.items():
+            if value is None:
+                continue
+            code = self.lookup[field].get(value)
+            if code is None:
+                return None
+            wanted[field] = code
+        return wanted
+
+    def shortest_posting(self, wanted):
+        """(posting list, fields still to check) for the given codes"""
+        if len(wanted) == len(FIELDS):
+            combo = sum(code * self.strides[field] for field, code in wanted.items())
+            return self.combo_postings.get(combo, np.empty(0, dtype=np.uint32)), {}
+        field = min(wanted, key=lambda f: len(self.postings[f][wanted[f]]))
+        return self.postings[field][wanted[field]], {f: c for f, c in wanted.items() if f != field}
+
+    def candidates(self, **filters):
+        """All question numbers matching the filters, as an array"""
+        wanted = self.wanted_codes(filters)
+        if wanted is None:
+            return np.empty(0, dtype=np.uint32)
+        if not wanted:
+            return np.arange(self.size, dtype=np.uint32)
+        pool, checks = self.shortest_posting(wanted)
+        mask = np.ones(len(pool), dtype=bool)
+        for field, code in checks.items():
+            mask &= self.codes[field][pool] == code
+        return pool[mask]
+
+    def count(self, **filters):
+        return len(self.candidates(**filters))
+
+    def select(self, rng, exclude=(), **filters):
+        """Random question number matching the filters and not in exclude, or None"""
+        wanted = self.wanted_codes(filters)
+        if wanted is None or self.size == 0:
+            return None
+
+        if wanted:
+            pool, checks = self.shortest_posting(wanted)
+        else:
+            pool, checks = None, {}
+        pool_size = self.size if pool is None else len(pool)
+        if pool_size == 0:
+            return None
+
+        # Usually a few random picks from the shortest posting list find a match
+        for _ in range(MAX_SAMPLE_TRIES):
+            pick = rng.randrange(pool_size)
+            number = pick if pool is None else int(pool[pick])
+            if number not in exclude and all(self.codes[f][number] == c for f, c in checks.items()):
+                return number
+
+        # Sparse matches or a mostly-seen pool: filter exactly instead
+        matches = self.candidates(**filters)
+        if exclude:
+            matches = matches[~np.isin(matches, np.fromiter(exclude, dtype=np.int64, count=len(exclude)))]
+        if len(matches) == 0:
+            return None
+        return int(matches[rng.randrange(len(matches))])
+
+
+class PlayerProgress:
+    """Questions a player has seen and a difficulty that follows their accuracy"""
+
+    def __init__(self, difficulty='medium', window=5, promote_at=0.8, demote_at=0.4):
+        self.seen = set()
+        self.answered = 0
+        self.correct = 0
+        self.difficulty = difficulty
+        self.recent = deque(maxlen=window)
+        self.promote_at = promote_at
+        self.demote_at = demote_at
+
+    @property
+    def accuracy(self):
+        return self.correct / self.answered if self.answered else 0.0
+
+    def record(self, correct):
+        """Count an answer and move the difficulty once a full window agrees"""
+        self.answered += 1
+        self.correct += bool(correct)
+        self.recent.append(bool(correct))
+        if len(self.recent) < self.recent.maxlen:
+            return
+
+        recent_accuracy = sum(self.recent) / len(self.recent)
+        level = DIFFICULTIES.index(self.difficulty)
+        if recent_accuracy >= self.promote_at and level < len(DIFFICULTIES) - 1:
+            self.difficulty = DIFFICULTIES[level + 1]
+            self.recent.clear()
+        elif recent_accuracy <= self.demote_at and level > 0:
+            self.difficulty = DIFFICULTIES[level - 1]
+            self.recent.clear()
+
+    def difficulty_preference(self):
+        """The player's difficulty first, then the others nearest to it"""
+        level = DIFFICULTIES.index(self.difficulty)
+        return sorted(DIFFICULTIES, key=lambda d: abs(DIFFICULTIES.index(d) - level))
@@ -0,0 +1,140 @@
+"""Compiled binary question packs.
+
+A pack holds a whole question bank in one file that is opened with mmap
+and read in place, so opening it costs the same for 5 questions or
+500k. Layout (all integers little-endian):
+
+    header        magic, version and the size of every section
+    string table  uint32 end offset per string, then the UTF-8 bytes
+    option lists  uint32 end offset per list, then uint32 string ids
+    records       RECORD_FIELDS uint32 ids per question
+
+Every string (questions, options, answers, explanations and tags) is
+interned, and identical option lists are stored once.
+
+    python -m game.questions compile aws_questions.json
+"""
+import mmap
+import struct
+
+import numpy as np
+
+PACK_MAGIC = b'SLQP'
+PACK_VERSION = 1
+# magic, version, strings, string bytes, option lists, option entries, questions
+PACK_HEADER = struct.Struct('<4s6I')
+RECORD_FIELDS = ('question', 'options', 'answer', 'explanation', 'topic', 'difficulty', 'language')
+NO_STRING = 0xFFFFFFFF
+
+
+def compile_pack(questions, path):
+    """Write an iterable of question dicts as a pack; returns the question count"""
+    strings = {}
+    option_lists = {}
+    records = []
+
+    def intern(text):
+        if text is None:
+            return NO_STRING
+        if text not in strings:
+            strings[text] = len(strings)
+        return strings[text]
+
+    for question in questions:
+        options = tuple(intern(option) for option in question['options'])
+        if options not in option_lists:
+            option_lists[options] = len(option_lists)
+        records.append((intern(question['question']), option_lists[options], intern(question['answer']),
+                        intern(question.get('explanation')), intern(question.get('topic')),
+                        intern(question.get('difficulty')), intern(question.get('language'))))
+
+    encoded = [text.encode('utf-8') for text in strings]
+    string_ends = np.cumsum([len(data) for data in encoded], dtype=np.uint32)
+    option_ends = np.cumsum([len(options) for options in option_lists], dtype=np.uint32)
+    option_ids = np.fromiter((i for options in option_lists for i in options), dtype=np.uint32)
+    blob = b''.join(encoded)
+
+    with open(path, 'wb') as f:
+        f.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(encoded), len(blob),
+                                 len(option_lists), len(option_ids), len(records)))
+        f.write(string_ends.tobytes())
+        f.write(blob)
+        # Pad so the uint32 sections after the text stay aligned
+        f.write(b'\0' * (-len(blob) % 4))
+        f.write(option_ends.tobytes())
+        f.write(option_ids.tobytes())
+        f.write(np.array(records, dtype=np.uint32).reshape(-1, len(RECORD_FIELDS)).tobytes())
+    return len(records)
+
+
+class QuestionPackBank:
+    """Read-only question bank backed by a memory-mapped pack"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, num_strings, blob_size, num_lists, num_option_ids, num_questions = \
+            PACK_HEADER.unpack_from(self.data)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError(f"{path} is not a version {PACK_VERSION} question pack")
+
+        # Views straight onto the mapping; nothing is copied or decoded here
+        offset = PACK_HEADER.size
+        self.string_ends = self.section(offset, num_strings)
+        offset += 4 * num_strings
+        self.blob_start = offset
+        offset += blob_size + (-blob_size % 4)
+        self.option_ends = self.section(offset, num_lists)
+        offset += 4 * num_lists
+        self.option_ids = self.section(offset, num_option_ids)
+        offset += 4 * num_option_ids
+        self.records = self.section(offset, num_questions * len(RECORD_FIELDS)).reshape(-1, len(RECORD_FIELDS))
+
+    def section(self, offset, count):
+        return np.frombuffer(self.data, dtype='<u4', count=count, offset=offset)
+
+    def __len__(self):
+        return len(self.records)
+
+    def string(self, string_id):
+        if string_id == NO_STRING:
+            return None
+        start = int(self.string_ends[string_id - 1]) if string_id else 0
+        end = int(self.string_ends[string_id])
+        return self.data[self.blob_start + start:self.blob_start + end].decode('utf-8')
+
+    def load(self, index):
+        """Decode question number index into the usual question dict"""
+        question, options, answer, explanation, topic, difficulty, language = self.records[index].tolist()
+        start = int(self.option_ends[options - 1]) if options else 0
+        question_data = {
+            'question': self.string(question),
+            'options': [self.string(i) for i in self.option_ids[start:self.option_ends[options]].tolist()],
+            'answer': self.string(answer),
+        }
+        for field, string_id in (('explanation', explanation), ('topic', topic),
+                                 ('difficulty', difficulty), ('language', language)):
+            if string_id != NO_STRING:
+                question_data[field] = self.string(string_id)
+        return question_data
+
+    def tag_codes(self, field, default):
+        """(values, per-question codes) for a tag column, read from the records"""
+        column = self.records[:, RECORD_FIELDS.index(field)]
+        string_ids, inverse = np.unique(column, return_inverse=True)
+        values = []
+        remap = np.empty(len(string_ids), dtype=np.uint16)
+        for i, string_id in enumerate(string_ids.tolist()):
+            # Untagged questions share a code with ones tagged with the default
+            value = default if string_id == NO_STRING else self.string(string_id)
+            if value not in values:
+                values.append(value)
+            remap[i] = values.index(value)
+        return values, remap[inverse]
+
+    def close(self):
+        # Drop the views before unmapping
+        self.string_ends = self.option_ends = self.option_ids = self.records = None
+        self.data.close()
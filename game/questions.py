@@ -1,50 +1,138 @@
-import json
+import argparse
+import os
 import random
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 import pygame
+from game.question_bank import InMemoryQuestionBank, RandomDraw, open_question_bank
+from game.question_index import PlayerProgress, QuestionIndex
+from game.question_pack import compile_pack
+from game.text_cache import render_text, text_size
+
+# Laid-out question cards kept by QuestionScreen
+CARD_CACHE_SIZE = 8
 
 class QuestionManager:
-    def __init__(self, questions_file):
-        self.all_questions = []
-        self.unused_questions = []
-        self.used_questions = []
+    def __init__(self, questions_file, rng=None):
+        self.rng = rng if rng is not None else random.Random()
+        self.bank = InMemoryQuestionBank([])
+        self.index = None
+        self.draw = None
+        self.upcoming = deque()
+        self.players = {}
         self.current_question = None
+        self.current_player = None
         self.load_questions(questions_file)
         self.shuffle_questions()
         
     def load_questions(self, filename):
-        """Load questions from JSON file"""
+        """Open a question bank (.jsonl banks are read lazily, .json loaded whole)"""
         try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
-                self.all_questions = data['questions']
+            self.bank = open_question_bank(filename)
         except FileNotFoundError:
             print(f"Questions file {filename} not found!")
-            self.all_questions = []
+            self.bank = InMemoryQuestionBank([])
+        self.index = None
     
     def shuffle_questions(self):
-        """Shuffle questions at game start"""
-        self.unused_questions = self.all_questions.copy()
-        random.shuffle(self.unused_questions)
-        self.used_questions = []
-    
-    def get_random_question(self):
-        """Get next unused question"""
-        if not self.unused_questions:
+        """Start a fresh random order at game start"""
+        self.draw = RandomDraw(len(self.bank), self.rng)
+        self.upcoming.clear()
+        self.players = {}
+    
+    def question_index(self):
+        """Topic/difficulty/language index, built on first use"""
+        if self.index is None:
+            self.index = QuestionIndex.from_bank(self.bank)
+        return self.index
+    
+    def progress(self, player):
+        """Seen questions and adaptive difficulty for one player"""
+        if player not in self.players:
+            self.players[player] = PlayerProgress()
+        return self.players[player]
+    
+    def get_random_question(self, player=None, topic=None, difficulty=None, language=None):
+        """Get next unused question.
+
+        Without arguments questions come from one shared shuffled order.
+        Given a player, the question is one that player hasn't seen yet;
+        if no difficulty is asked for, the player's adaptive difficulty
+        is preferred. topic, difficulty and language filter the choice.
+        """
+        if player is not None or topic or difficulty or language:
+            return self.select_question(player, topic, difficulty, language)
+
+        self.current_player = None
+        if self.upcoming:
+            self.current_question = self.upcoming.popleft()
+            return self.current_question
+        index = self.draw.next()
+        if index is None:
             return None  # All questions exhausted
             
-        self.current_question = self.unused_questions.pop()
-        self.used_questions.append(self.current_question)
+        # Only the drawn question is decoded
+        self.current_question = self.bank.load(index)
+        return self.current_question
+    
+    def peek_questions(self, count):
+        """The next count questions of the shared order, without using them up"""
+        while len(self.upcoming) < count:
+            index = self.draw.next()
+            if index is None:
+                break
+            self.upcoming.append(self.bank.load(index))
+        return list(self.upcoming)[:count]
+    
+    def select_question(self, player, topic, difficulty, language):
+        """Pick a question through the tag indexes"""
+        index = self.question_index()
+        progress = self.progress(player) if player is not None else None
+        seen = progress.seen if progress else ()
+
+        if difficulty or progress is None:
+            difficulties = [difficulty]
+        else:
+            # Nearest difficulty with anything left, then any difficulty
+            difficulties = progress.difficulty_preference() + [None]
+
+        for wanted in difficulties:
+            number = index.select(self.rng, seen, topic=topic, difficulty=wanted, language=language)
+            if number is not None:
+                break
+        else:
+            return None
+
+        if progress:
+            progress.seen.add(number)
+        self.current_player = player
+        self.current_question = self.bank.load(number)
         return self.current_question
     
     def has_more_questions(self):
         """Check if there are more unused questions"""
-        return len(self.unused_questions) > 0
+        return bool(self.upcoming) or self.draw.remaining > 0
     
     def check_answer(self, selected_option):
         """Check if the selected answer is correct"""
         if not self.current_question:
             return False
-        return selected_option == self.current_question['answer']
+        correct = selected_option == self.current_question['answer']
+        if self.current_player is not None:
+            self.progress(self.current_player).record(correct)
+        return correct
+
+class QuestionCard:
+    """A question laid out and rendered once; only the highlight and banner change"""
+    def __init__(self, question_data):
+        self.question_data = question_data
+        self.surface = None
+        self.option_rects = []
+        self.option_texts = []
+        self.bottom = 0
+        self.banners = {}
+        self.ready = False
 
 class QuestionScreen:
     def __init__(self, screen, font, big_font, colors):
@@ -57,6 +145,11 @@ class QuestionScreen:
         self.result_correct = False
         self.result_timer = 0
         
+        # Laid-out cards by question text, most recently used last
+        self.cards = OrderedDict()
+        self.pending = {}
+        self.executor = None
+        
     def draw_rounded_rect(self, surface, color, rect, radius):
         """Draw a rounded rectangle"""
         pygame.draw.rect(surface, color, rect, border_radius=radius)
@@ -67,120 +160,186 @@ class QuestionScreen:
             # Show "all questions exhausted" message
             self.screen.fill(self.colors['BEIGE'])
             
-            title = self.big_font.render("🎉 AWS Master! 🎉", True, self.colors['GOLD'])
+            title = render_text(self.big_font, "🎉 AWS Master! 🎉", True, self.colors['GOLD'])
             title_rect = title.get_rect(center=(400, 200))
             self.screen.blit(title, title_rect)
             
-            message = self.font.render("You've mastered all AWS questions!", True, self.colors['DARK_RED'])
+            message = render_text(self.font, "You've mastered all AWS questions!", True, self.colors['DARK_RED'])
             message_rect = message.get_rect(center=(400, 250))
             self.screen.blit(message, message_rect)
             
-            continue_text = self.font.render("Press SPACE to continue playing", True, self.colors['BLACK'])
+            continue_text = render_text(self.font, "Press SPACE to continue playing", True, self.colors['BLACK'])
             continue_rect = continue_text.get_rect(center=(400, 300))
             self.screen.blit(continue_text, continue_rect)
             return
             
-        self.screen.fill(self.colors['BEIGE'])
+        card = self.get_card(question_data)
+        self.screen.blit(card.surface, (0, 0))
+        
+        # Selection highlight over the pre-rendered option box
+        selected = self.selected_option
+        self.draw_option(self.screen, card.option_rects[selected], card.option_texts[selected], True)
+        
+        # Instructions
+        if not self.show_result:
+            instruction = render_text(self.font, "Use ↑↓ arrows to select, ENTER to confirm", True, self.colors['DARK_RED'])
+            instruction_rect = instruction.get_rect(center=(400, card.bottom + 20))
+            self.screen.blit(instruction, instruction_rect)
+        
+        # Result banner with the explanation, rendered with the card
+        if self.show_result:
+            self.screen.blit(card.banners[self.result_correct], (100, card.bottom + 10))
+            
+            continue_text = render_text(self.font, "Press SPACE to continue", True, self.colors['BLACK'])
+            continue_rect = continue_text.get_rect(center=(400, 580))
+            self.screen.blit(continue_text, continue_rect)
+    
+    def draw_option(self, surface, option_rect, option_text, selected):
+        """Draw one option box and its label"""
+        if selected:
+            bg_color = self.colors['GOLD']
+            border_color = self.colors['DARK_RED']
+            border_width = 3
+        else:
+            bg_color = self.colors['WHITE']
+            border_color = self.colors['BLACK']
+            border_width = 2
+        
+        self.draw_rounded_rect(surface, bg_color, option_rect, 10)
+        pygame.draw.rect(surface, border_color, option_rect, border_width, border_radius=10)
+        surface.blit(option_text, option_text.get_rect(center=option_rect.center))
+    
+    def layout_question(self, question_data):
+        """Wrap and render everything about a question that doesn't change while it's shown"""
+        card = QuestionCard(question_data)
+        card.surface = pygame.Surface(self.screen.get_size())
+        surface = card.surface
+        surface.fill(self.colors['BEIGE'])
         
         # Question container with shadow and rounded corners
         container_rect = pygame.Rect(50, 80, 700, 500)
         shadow_rect = pygame.Rect(53, 83, 700, 500)
-        self.draw_rounded_rect(self.screen, (200, 200, 200), shadow_rect, 15)
-        self.draw_rounded_rect(self.screen, self.colors['WHITE'], container_rect, 15)
-        pygame.draw.rect(self.screen, self.colors['DARK_RED'], container_rect, 3, border_radius=15)
+        self.draw_rounded_rect(surface, (200, 200, 200), shadow_rect, 15)
+        self.draw_rounded_rect(surface, self.colors['WHITE'], container_rect, 15)
+        pygame.draw.rect(surface, self.colors['DARK_RED'], container_rect, 3, border_radius=15)
         
         # Title
-        title = self.big_font.render("AWS Quiz Question", True, self.colors['DARK_RED'])
-        title_rect = title.get_rect(center=(400, 120))
-        self.screen.blit(title, title_rect)
+        title = render_text(self.big_font, "AWS Quiz Question", True, self.colors['DARK_RED'])
+        surface.blit(title, title.get_rect(center=(400, 120)))
         
-        # Question text with better formatting
-        question_lines = self.wrap_text(question_data['question'], 70)
+        # Question text, wrapped to the container width
         y_offset = 170
-        for line in question_lines:
-            text = self.font.render(line, True, self.colors['BLACK'])
-            text_rect = text.get_rect(center=(400, y_offset))
-            self.screen.blit(text, text_rect)
+        for line in self.wrap_text(question_data['question'], self.font, 640):
+            text = render_text(self.font, line, True, self.colors['BLACK'])
+            surface.blit(text, text.get_rect(center=(400, y_offset)))
             y_offset += 30
         
-        # Options with enhanced styling
+        # Options, all unselected; draw_question highlights the chosen one
         y_offset += 20
         for i, option in enumerate(question_data['options']):
-            # Option container
             option_rect = pygame.Rect(80, y_offset, 640, 45)
             shadow_rect = pygame.Rect(82, y_offset + 2, 640, 45)
-            
-            # Colors based on selection
-            if i == self.selected_option:
-                bg_color = self.colors['GOLD']
-                border_color = self.colors['DARK_RED']
-                border_width = 3
-            else:
-                bg_color = self.colors['WHITE']
-                border_color = self.colors['BLACK']
-                border_width = 2
-            
-            # Draw shadow and option box
-            self.draw_rounded_rect(self.screen, (220, 220, 220), shadow_rect, 10)
-            self.draw_rounded_rect(self.screen, bg_color, option_rect, 10)
-            pygame.draw.rect(self.screen, border_color, option_rect, border_width, border_radius=10)
-            
-            # Option text
-            option_text = self.font.render(f"{chr(65+i)}. {option}", True, self.colors['BLACK'])
-            text_rect = option_text.get_rect(center=option_rect.center)
-            self.screen.blit(option_text, text_rect)
-            
+            option_text = render_text(self.font, f"{chr(65+i)}. {option}", True, self.colors['BLACK'])
+            self.draw_rounded_rect(surface, (220, 220, 220), shadow_rect, 10)
+            self.draw_option(surface, option_rect, option_text, False)
+            card.option_rects.append(option_rect)
+            card.option_texts.append(option_text)
             y_offset += 55
+        card.bottom = y_offset
         
-        # Instructions
-        if not self.show_result:
-            instruction = self.font.render("Use ↑↓ arrows to select, ENTER to confirm", True, self.colors['DARK_RED'])
-            instruction_rect = instruction.get_rect(center=(400, y_offset + 20))
-            self.screen.blit(instruction, instruction_rect)
+        explanation = self.wrap_text(question_data.get('explanation') or "", self.font, 560)
+        for correct in (True, False):
+            card.banners[correct] = self.render_banner(correct, explanation)
+        return card
+    
+    def render_banner(self, correct, explanation_lines):
+        """Result box plus explanation, on a transparent surface 600 pixels wide"""
+        banner = pygame.Surface((600, max(120, 60 + 20 * len(explanation_lines))), pygame.SRCALPHA)
+        result_rect = pygame.Rect(0, 0, 600, 120)
+        result_color = self.colors['GOLD'] if correct else self.colors['RED']
+        self.draw_rounded_rect(banner, result_color, result_rect, 10)
+        pygame.draw.rect(banner, self.colors['BLACK'], result_rect, 2, border_radius=10)
         
-        # Show result with enhanced styling
-        if self.show_result:
-            result_rect = pygame.Rect(100, y_offset + 10, 600, 120)
-            result_color = self.colors['GOLD'] if self.result_correct else self.colors['RED']
-            
-            self.draw_rounded_rect(self.screen, result_color, result_rect, 10)
-            pygame.draw.rect(self.screen, self.colors['BLACK'], result_rect, 2, border_radius=10)
-            
-            result_text = "✓ Correct! You can move." if self.result_correct else "✗ Wrong! Try again next turn."
-            result = self.big_font.render(result_text, True, self.colors['WHITE'])
-            result_rect_center = result.get_rect(center=(400, y_offset + 40))
-            self.screen.blit(result, result_rect_center)
-            
-            # Show explanation
-            if question_data.get('explanation'):
-                exp_lines = self.wrap_text(question_data['explanation'], 80)
-                exp_y = y_offset + 70
-                for line in exp_lines:
-                    exp_text = self.font.render(line, True, self.colors['WHITE'])
-                    exp_rect = exp_text.get_rect(center=(400, exp_y))
-                    self.screen.blit(exp_text, exp_rect)
-                    exp_y += 20
-            
-            continue_text = self.font.render("Press SPACE to continue", True, self.colors['BLACK'])
-            continue_rect = continue_text.get_rect(center=(400, 580))
-            self.screen.blit(continue_text, continue_rect)
+        result_text = "✓ Correct! You can move." if correct else "✗ Wrong! Try again next turn."
+        result = render_text(self.big_font, result_text, True, self.colors['WHITE'])
+        banner.blit(result, result.get_rect(center=(300, 30)))
+        
+        exp_y = 60
+        for line in explanation_lines:
+            exp_text = render_text(self.font, line, True, self.colors['WHITE'])
+            banner.blit(exp_text, exp_text.get_rect(center=(300, exp_y)))
+            exp_y += 20
+        return banner
     
-    def wrap_text(self, text, max_chars):
-        """Wrap text to fit within specified character limit"""
-        words = text.split()
+    def get_card(self, question_data):
+        """Laid-out card for a question, from the cache, a prefetch, or laid out now"""
+        key = question_data['question']
+        card = self.cards.get(key)
+        if card is None:
+            future = self.pending.pop(key, None)
+            card = future.result() if future else self.layout_question(question_data)
+            self.cards[key] = card
+            while len(self.cards) > CARD_CACHE_SIZE:
+                self.cards.popitem(last=False)
+        else:
+            self.cards.move_to_end(key)
+        
+        if not card.ready and pygame.display.get_surface() is not None:
+            # Pixel-format conversion has to happen on the main thread
+            card.surface = card.surface.convert()
+            card.banners = {correct: banner.convert_alpha() for correct, banner in card.banners.items()}
+            card.ready = True
+        return card
+    
+    def prefetch(self, questions):
+        """Lay out upcoming questions in a background thread"""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='question-layout')
+        for question_data in questions:
+            key = question_data['question']
+            if key not in self.cards and key not in self.pending:
+                self.pending[key] = self.executor.submit(self.layout_question, question_data)
+    
+    def request_question(self, manager, **selection):
+        """Draw the next question from manager and lay it out, both on the layout thread.
+
+        Returns a future for the question (None once the bank is used up);
+        pass it to take_question. manager must not be used elsewhere until
+        the future is done.
+        """
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='question-layout')
+        
+        def load():
+            question_data = manager.get_random_question(**selection)
+            card = self.layout_question(question_data) if question_data else None
+            return question_data, card
+        return self.executor.submit(load)
+    
+    def take_question(self, future):
+        """Question from request_question, waiting only if it isn't ready yet"""
+        question_data, card = future.result()
+        if card is not None:
+            self.cards[question_data['question']] = card
+            while len(self.cards) > CARD_CACHE_SIZE:
+                self.cards.popitem(last=False)
+        return question_data
+    
+    def wrap_text(self, text, font, max_width):
+        """Wrap text into lines no wider than max_width pixels"""
         lines = []
         current_line = ""
         
-        for word in words:
-            if len(current_line + word) <= max_chars:
-                current_line += word + " "
+        for word in text.split():
+            candidate = f"{current_line} {word}" if current_line else word
+            if current_line and text_size(font, candidate)[0] > max_width:
+                lines.append(current_line)
+                current_line = word
             else:
-                if current_line:
-                    lines.append(current_line.strip())
-                current_line = word + " "
+                current_line = candidate
         
         if current_line:
-            lines.append(current_line.strip())
+            lines.append(current_line)
         
         return lines
     
@@ -214,4 +373,38 @@ class QuestionScreen:
         """Reset question screen state"""
         self.selected_option = 0
         self.show_result = False
-        self.result_correct = False
\ No newline at end of file
+        self.result_correct = False
+    
+    def close(self):
+        """Stop the layout thread"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        self.pending.clear()
+
+
+def compile_command(args):
+    """Convert a .json or .jsonl question bank into a binary .qpack"""
+    output = args.output or os.path.splitext(args.source)[0] + '.qpack'
+    start = time.perf_counter()
+    bank = open_question_bank(args.source)
+    count = compile_pack((bank.load(i) for i in range(len(bank))), output)
+    bank.close()
+    elapsed = time.perf_counter() - start
+    print(f"Compiled {count:,} questions into {output} "
+          f"({os.path.getsize(output):,} bytes from {os.path.getsize(args.source):,}) in {elapsed:.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quiz question bank tools")
+    commands = parser.add_subparsers(dest='command', required=True)
+    compile_parser = commands.add_parser('compile', help="build a binary question pack")
+    compile_parser.add_argument('source', help="aws_questions.json or a .jsonl bank")
+    compile_parser.add_argument('-o', '--output', help="pack path (default: source name with .qpack)")
+    compile_parser.set_defaults(run=compile_command)
+    args = parser.parse_args()
+    args.run(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,288 @@
+"""Replay logs: record games as they are played and re-execute them.
+
+Every game started by GameController appends its events to a JSON Lines
+file in ``replays/``. The first line is a header with the seed, player
+count, quiz flag and the full board; each following line is one compact
+event array:
+
+    ["r", player, value]                      dice roll
+    ["m", player, steps, start, end, jump]    move; jump is "ladder", "snake" or null
+    ["t", player]                             the turn passes to player
+    ["a", player, correct]                    quiz answer
+    ["w", player]                             player won
+
+Replays re-run through GameEngine.move_player and next_turn with the
+recorded seed, checking every event against what the current rules do,
+either headlessly (thousands of games a second) or on screen:
+
+    python -m game.replay check replays/
+    python -m game.replay play replays/20261018-101500-1a2b3c4d.jsonl --speed 2
+"""
+import argparse
+import json
+import os
+import random
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
+from game.board_file import BoardFile, board_data, parse_board
+from game.engine import GameEngine
+
+REPLAY_VERSION = 1
+REPLAYS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'replays')
+
+# Outcome of re-executing one replay; divergence is None when every event matched
+ReplayCheck = namedtuple('ReplayCheck', ['path', 'events', 'turns', 'winner', 'divergence'])
+
+
+class ReplayRecorder:
+    """Append-only event log for one game; attach it as GameEngine.recorder"""
+
+    def __init__(self, path, seed, num_players, board_file, quiz=False):
+        self.path = path
+        # Line buffered, so a crash still leaves every finished event on disk
+        self.file = open(path, 'a', buffering=1, encoding='utf-8')
+        self.write({'replay': REPLAY_VERSION, 'seed': seed, 'players': num_players, 'quiz': quiz,
+                    'board': board_data(board_file.board, board_file.name, board_file.theme),
+                    'board_digest': board_file.digest,
+                    'started': time.strftime('%Y-%m-%dT%H:%M:%S')})
+
+    def write(self, event):
+        if self.file is not None:
+            self.file.write(json.dumps(event, separators=(',', ':')) + '\n')
+
+    def roll(self, player, value):
+        self.write(['r', player, value])
+
+    def move(self, player, steps, start, end, jump):
+        self.write(['m', player, steps, start, end, jump])
+
+    def turn(self, player):
+        self.write(['t', player])
+
+    def answer(self, player, correct):
+        self.write(['a', player, correct])
+
+    def win(self, player):
+        self.write(['w', player])
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def start_recording(directory, seed, num_players, board_file, quiz=False):
+    """New ReplayRecorder writing <directory>/<time>-<seed>.jsonl"""
+    os.makedirs(directory, exist_ok=True)
+    name = f"{time.strftime('%Y%m%d-%H%M%S')}-{seed:08x}.jsonl"
+    return ReplayRecorder(os.path.join(directory, name), seed, num_players, board_file, quiz)
+
+
+class Replay:
+    """A recorded game: its header fields and event list"""
+
+    def __init__(self, header, events, path=None):
+        if header.get('replay') != REPLAY_VERSION:
+            raise ValueError(f"{path}: not a version {REPLAY_VERSION} replay log")
+        self.header = header
+        self.events = events
+        self.path = path
+        self.seed = header['seed']
+        self.num_players = header['players']
+        self.quiz = header.get('quiz', False)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        if not lines:
+            raise ValueError(f"{path}: empty replay log")
+        header = json.loads(lines[0])
+        try:
+            # One parse for the whole log instead of one per line
+            events = json.loads('[' + ','.join(lines[1:]) + ']')
+        except ValueError:
+            # Cut short mid-line (the game crashed): keep every complete event
+            events = []
+            for line in lines[1:]:
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    break
+        return cls(header, events, path)
+
+    def board_file(self):
+        """BoardFile for the recorded board, name and theme"""
+        board, name, theme = parse_board(self.header['board'], self.path)
+        return BoardFile(board, name, theme, digest=self.header.get('board_digest'))
+
+
+def replay_events(replay, engine, actions=None):
+    """Apply each recorded event in turn, yielding (index, divergence or None).
+
+    actions supplies roll_dice, move_player, next_turn and optionally
+    score_answer; it defaults to the engine itself, and a game object can
+    be passed to replay on screen. The engine is checked after each event.
+    """
+    actions = actions if actions is not None else engine
+    for index, event in enumerate(replay.events):
+        kind = event[0]
+        player = engine.current_player
+        if kind == 'r':
+            actual = ['r', player, actions.roll_dice()]
+        elif kind == 'm':
+            steps = event[2]
+            start = engine.player_positions[player]
+            actions.move_player(steps)
+            landing = start + steps
+            jump = engine.board.resolve(landing)[1] if landing <= engine.board.last_square else None
+            end = engine.player_positions[player]
+            actual = ['m', player, steps, start, end, jump]
+        elif kind == 't':
+            actions.next_turn()
+            actual = ['t', engine.current_player]
+        elif kind == 'a':
+            if hasattr(actions, 'score_answer'):
+                actions.score_answer(event[2])
+            actual = ['a', player, event[2]]
+        elif kind == 'w':
+            actual = ['w', engine.winner]
+        else:
+            yield index, f"event {index}: unknown event {event!r}"
+            return
+        if actual != event:
+            yield index, f"event {index}: recorded {event!r}, replayed {actual!r}"
+            return
+        yield index, None
+
+
+def fast_forward(replay, board=None):
+    """Re-execute a replay headlessly and return a ReplayCheck"""
+    board = board if board is not None else replay.board_file().board
+    engine = GameEngine(replay.num_players, board, random.Random(replay.seed))
+    for index, divergence in replay_events(replay, engine):
+        if divergence:
+            return ReplayCheck(replay.path, index + 1, engine.turns, engine.winner, divergence)
+    return ReplayCheck(replay.path, len(replay.events), engine.turns, engine.winner, None)
+
+
+def play_realtime(replay, speed=1.0, pause=0.5):
+    """Replay a game on screen at speed x real time; returns the divergence, if any"""
+    import pygame
+
+    from game.animation import AnimationClock
+    from game.logic import CloudLadderGame
+    from game.simple_game import SnakeLadderGame
+
+    game_class = CloudLadderGame if replay.quiz else SnakeLadderGame
+    # Animations and pauses run on a clock sped up by speed
+    clock = AnimationClock(speed)
+    game = game_class(replay.num_players, replay.board_file(), replay.seed, clock)
+    frame_clock = pygame.time.Clock()
+    events = replay_events(replay, game.engine, game)
+    resume_at = 0.0
+    divergence = None
+    finished = False
+
+    running = True
+    while running:
+        clock.tick()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+
+        idle = not game.animating and not game.dice_rolling
+        if idle and clock.now >= resume_at:
+            if finished:
+                # The final position has been held for a moment: close
+                running = False
+            else:
+                # Everything up to and including the next move, then let it animate
+                for index, divergence in events:
+                    if divergence or replay.events[index][0] == 'm':
+                        break
+                else:
+                    finished = True
+                finished = finished or divergence is not None
+            resume_at = clock.now + pause
+        elif not idle:
+            # Pause once the animation is over
+            resume_at = clock.now + pause
+
+        game.update()
+        dirty_rects = game.draw()
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+        frame_clock.tick(60)
+
+    pygame.quit()
+    return divergence
+
+
+def replay_paths(paths):
+    """Expand directories into the .jsonl logs inside them"""
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith('.jsonl'):
+                    yield os.path.join(path, name)
+        else:
+            yield path
+
+
+def check_path(path):
+    """Worker entry point: load and fast-forward one replay log"""
+    return fast_forward(Replay.load(path))
+
+
+def check_command(args):
+    """Fast-forward every replay and report the ones the current rules no longer reproduce"""
+    start = time.perf_counter()
+    paths = list(replay_paths(args.replays))
+    workers = args.workers or os.cpu_count() or 1
+    games = events = diverged = 0
+    with ProcessPoolExecutor(workers) if workers > 1 else nullcontext() as executor:
+        if executor is None:
+            checks = map(check_path, paths)
+        else:
+            checks = executor.map(check_path, paths, chunksize=max(1, min(256, len(paths) // (4 * workers))))
+        for path, check in zip(paths, checks):
+            games += 1
+            events += check.events
+            if check.divergence:
+                diverged += 1
+                print(f"DIVERGED {path}: {check.divergence}")
+    elapsed = time.perf_counter() - start
+    rate = games / elapsed if elapsed > 0 else 0.0
+    print(f"{games:,} replays, {events:,} events in {elapsed:.2f}s ({rate:,.0f} games/s); {diverged} diverged")
+    return 1 if diverged else 0
+
+
+def play_command(args):
+    divergence = play_realtime(Replay.load(args.replay), args.speed)
+    if divergence:
+        print(f"DIVERGED {args.replay}: {divergence}")
+        return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded games")
+    commands = parser.add_subparsers(dest='command', required=True)
+    check_parser = commands.add_parser('check', help="re-execute replays headlessly and report divergences")
+    check_parser.add_argument('replays', nargs='+', help="replay .jsonl files or directories of them")
+    check_parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    check_parser.set_defaults(run=check_command)
+    play_parser = commands.add_parser('play', help="watch a replay in the game window")
+    play_parser.add_argument('replay', help="replay .jsonl file")
+    play_parser.add_argument('--speed', type=float, default=1.0, help="playback speed multiplier")
+    play_parser.set_defaults(run=play_command)
+    args = parser.parse_args()
+    raise SystemExit(args.run(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""The game window and everything drawn with it, shared by every screen.
+
+pygame is initialised and the window created once, on first use; fonts
+are loaded once per size; and surfaces that take real work to draw (the
+static board layer, tile sprites) are kept by content key, so starting
+another game on the same board reuses them instead of drawing them
+again. Fonts being the same objects from game to game also keeps the
+shared text cache warm, since it is keyed on the font.
+
+Like the text cache's surfaces, cached surfaces are shared and must not
+be drawn on; render into a fresh surface and hand it to surface().
+"""
+from collections import OrderedDict
+
+import pygame
+
+WINDOW_SIZE = (800, 700)
+DEFAULT_MAX_BYTES = 48 * 1024 * 1024
+
+# Colors every screen draws with; board themes override some per game
+PALETTE = {
+    'RED': (220, 20, 60),
+    'GOLD': (255, 215, 0),
+    'BEIGE': (245, 245, 220),
+    'WHITE': (255, 255, 255),
+    'BLACK': (0, 0, 0),
+    'DARK_RED': (139, 0, 0),
+    'GREEN': (34, 139, 34),
+    'BLUE': (30, 144, 255),
+    'PURPLE': (128, 0, 128),
+    'SHADOW': (200, 200, 200),
+    'LIGHT_BLUE': (173, 216, 230),
+    'ORANGE': (255, 165, 0),
+}
+
+
+def surface_bytes(value):
+    """Pixel memory of a surface, a sprite atlas or a sequence of surfaces"""
+    if isinstance(value, pygame.Surface):
+        return value.get_pitch() * value.get_height()
+    if hasattr(value, 'sheet'):
+        return surface_bytes(value.sheet)
+    return sum(surface_bytes(item) for item in value)
+
+
+class Resources:
+    def __init__(self, size=WINDOW_SIZE, max_bytes=DEFAULT_MAX_BYTES):
+        self.size = size
+        self.palette = dict(PALETTE)
+        self.max_bytes = max_bytes
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.caption = None
+        self._screen = None
+
+    @property
+    def screen(self):
+        """The window surface, created on first use"""
+        if self._screen is None or pygame.display.get_surface() is None:
+            if self._screen is not None:
+                # pygame.quit() closed the window: nothing made for it is valid
+                self.fonts.clear()
+                self.clear()
+                self.caption = None
+            pygame.init()
+            self._screen = pygame.display.set_mode(self.size)
+        return self._screen
+
+    def set_caption(self, caption):
+        if caption != self.caption:
+            pygame.display.set_caption(caption)
+            self.caption = caption
+
+    def font(self, size, name=None):
+        """pygame Font for (name, size), loaded once"""
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None or not pygame.font.get_init():
+            if not pygame.font.get_init():
+                pygame.font.init()
+                self.fonts.clear()
+            font = self.fonts[key] = pygame.font.Font(name, size)
+        return font
+
+    def surface(self, key, build):
+        """The surface (or sprite atlas, or list of surfaces) cached under key, made by build() on a miss"""
+        value = self.surfaces.get(key)
+        if value is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = build()
+        self.surfaces[key] = value
+        self.size_bytes += surface_bytes(value)
+        while self.size_bytes > self.max_bytes and len(self.surfaces) > 1:
+            _, evicted = self.surfaces.popitem(last=False)
+            self.size_bytes -= surface_bytes(evicted)
+        return value
+
+    def clear(self):
+        """Forget cached surfaces (fonts and the window stay)"""
+        self.surfaces.clear()
+        self.size_bytes = 0
+
+    def stats(self):
+        return {'fonts': len(self.fonts), 'surfaces': len(self.surfaces), 'bytes': self.size_bytes,
+                'hits': self.hits, 'misses': self.misses}
+
+
+# Shared by every screen in the game
+resources = Resources()
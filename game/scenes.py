@@ -0,0 +1,248 @@
+"""Scene stack for the game window.
+
+Each screen (menu, game, quiz question, game over) is a Scene, and the
+controller keeps them on a SceneStack. Only the scene on top handles
+input, updates and draws; the ones beneath are suspended and cost
+nothing, but keep their state and cached render layers. Pausing a game
+pushes the menu over it, and ESC pops the menu to resume the game
+exactly where it was.
+
+    [menu]                   start
+    [game]                   a game is being played
+    [game, question]         quiz mode, answering before a move
+    [game, menu]             paused; ESC resumes
+    [game, game over]        finished; any of ESC/ENTER/SPACE returns to the menu
+"""
+import pygame
+
+from game.pacing import ACTIVE, AMBIENT, IDLE
+
+
+class Scene:
+    """One screen; subclasses override what they need"""
+
+    def __init__(self, controller):
+        self.controller = controller
+
+    def enter(self):
+        """The scene is on top again, pushed or uncovered"""
+        self.invalidate()
+
+    def invalidate(self):
+        """Repaint the whole window on the next draw"""
+
+    def handle_event(self, event):
+        """React to one event; returns False to quit the game"""
+        return True
+
+    def update(self):
+        pass
+
+    def draw(self):
+        """Draw the frame; returns the changed screen rectangles"""
+        return []
+
+    def pace(self):
+        """How busy the scene is: a game.pacing mode"""
+        return IDLE
+
+
+class SceneStack:
+    def __init__(self):
+        self.scenes = []
+
+    @property
+    def top(self):
+        return self.scenes[-1] if self.scenes else None
+
+    def __len__(self):
+        return len(self.scenes)
+
+    def __contains__(self, scene):
+        return scene in self.scenes
+
+    def push(self, scene):
+        self.scenes.append(scene)
+        scene.enter()
+
+    def pop(self):
+        """Remove the top scene and resume the one beneath"""
+        scene = self.scenes.pop()
+        if self.scenes:
+            self.scenes[-1].enter()
+        return scene
+
+    def switch(self, *scenes):
+        """Replace the whole stack"""
+        self.scenes = []
+        for scene in scenes:
+            self.push(scene)
+
+    def handle_event(self, event):
+        return self.top.handle_event(event)
+
+    def update(self):
+        self.top.update()
+
+    def draw(self):
+        return self.top.draw()
+
+    def pace(self):
+        return self.top.pace()
+
+
+class MenuScene(Scene):
+    """The start menu, also shown over a paused game"""
+
+    def __init__(self, controller, menu):
+        super().__init__(controller)
+        self.menu = menu
+        self.dirty = True
+
+    def enter(self):
+        # Over a paused game, ESC resumes it instead of quitting
+        self.menu.can_resume = len(self.controller.scenes) > 1
+        self.dirty = True
+
+    def invalidate(self):
+        self.dirty = True
+
+    def handle_event(self, event):
+        controller = self.controller
+        self.dirty = True
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            if not self.menu.can_resume:
+                return False
+            controller.scenes.pop()
+            return True
+        result = self.menu.handle_input(event)
+        if result == 'exit':
+            return False
+        if result:
+            controller.start_game(result, quiz=self.menu.quiz_mode)
+        return True
+
+    def update(self):
+        if self.controller.scheduler.mode != IDLE:
+            self.menu.update()
+
+    def draw(self):
+        # The menu animates continuously, so every frame is a full frame,
+        # except when it has been left alone long enough to idle
+        if self.controller.scheduler.mode == IDLE and not self.dirty:
+            return []
+        self.menu.draw()
+        self.dirty = False
+        return [self.controller.screen.get_rect()]
+
+    def pace(self):
+        return AMBIENT
+
+
+class GameScene(Scene):
+    """A game in progress, local or networked"""
+
+    def __init__(self, controller, game):
+        super().__init__(controller)
+        self.game = game
+
+    def invalidate(self):
+        self.game.invalidate()
+
+    def handle_event(self, event):
+        controller = self.controller
+        game = self.game
+        if event.type != pygame.KEYDOWN:
+            return True
+        if event.key == pygame.K_SPACE and not game.animating and not game.game_over:
+            network = controller.network
+            if network:
+                # The server rolls; ask only when it is our turn
+                if (controller.network_started and not controller.network_moves
+                        and game.current_player == network.seat):
+                    network.roll()
+            elif controller.question_future:
+                controller.ask_question()
+            else:
+                dice_roll = game.roll_dice()
+                game.move_player(dice_roll)
+                if not game.game_over:
+                    game.next_turn()
+        elif event.key == pygame.K_ESCAPE:
+            controller.scenes.push(controller.menu_scene)
+        return True
+
+    def update(self):
+        controller = self.controller
+        if controller.network:
+            controller.poll_network()
+            if controller.scenes.top is not self:
+                return  # the connection closed and the menu took over
+        self.game.update()
+        if self.game.game_over and not self.game.busy and not controller.network_moves:
+            controller.scenes.push(GameOverScene(controller, self.game))
+
+    def draw(self):
+        return self.game.draw()
+
+    def pace(self):
+        if self.game.busy or self.controller.network_moves:
+            return ACTIVE
+        return IDLE
+
+
+class QuestionScene(Scene):
+    """A quiz question the current player answers before moving"""
+
+    def __init__(self, controller, question_screen, question):
+        super().__init__(controller)
+        self.question_screen = question_screen
+        self.question = question
+        self.dirty = True
+
+    def invalidate(self):
+        self.dirty = True
+
+    def handle_event(self, event):
+        controller = self.controller
+        if event.type == pygame.KEYDOWN:
+            self.dirty = True
+            if event.key == pygame.K_ESCAPE:
+                controller.scenes.push(controller.menu_scene)
+                return True
+        result = self.question_screen.handle_input(event, self.question)
+        if result == 'answered':
+            # Records the answer towards this player's adaptive difficulty
+            controller.questions.check_answer(self.question['options'][self.question_screen.selected_option])
+        elif result == 'continue':
+            controller.scenes.pop()
+            controller.finish_question()
+        return True
+
+    def draw(self):
+        # The question screen only changes on key presses
+        if not self.dirty:
+            return []
+        with self.controller.profiler.phase('QuestionScreen.draw_question'):
+            self.question_screen.draw_question(self.question)
+        self.dirty = False
+        return [self.controller.screen.get_rect()]
+
+
+class GameOverScene(Scene):
+    """The finished game's last frame, held until a key returns to the menu"""
+
+    def __init__(self, controller, game):
+        super().__init__(controller)
+        self.game = game
+
+    def invalidate(self):
+        self.game.invalidate()
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_ESCAPE, pygame.K_RETURN, pygame.K_SPACE):
+            self.controller.end_game()
+        return True
+
+    def draw(self):
+        return self.game.draw()
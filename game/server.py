@@ -0,0 +1,351 @@
+"""Asyncio game server hosting many concurrent rooms over TCP.
+
+Each room runs a GameEngine, so the server owns the dice: clients only
+ask to roll, and every seat is sent the same authoritative MOVED result
+resolved by move_player. Connections are asyncio.Protocol objects fed
+through protocol.FrameBuffer, without a coroutine per client, which is
+what keeps ten thousand rooms in one process cheap.
+
+    python -m game.server --port 7878 --board boards/classic.json
+
+Clients join a specific room id, or room 0 to be matched into the first
+open room with the same number of seats. After a game ends the players
+may JOIN again on the same connection.
+
+Spectators WATCH a room instead. Players get each MOVED at once; the
+spectators of a room share one DELTA per tick (TICK_SECONDS), encoded
+once and written to every spectator, with a KEYFRAME every
+KEYFRAME_TICKS so nobody drifts and late joiners sync immediately.
+"""
+import argparse
+import asyncio
+import random
+import resource
+import time
+
+from game import protocol
+from game.board_file import DEFAULT_BOARD_FILE, load_board_file
+from game.engine import GameEngine
+from game.replay import start_recording
+
+DEFAULT_PORT = 7878
+MAX_SEATS = 4
+TICK_SECONDS = 0.05
+KEYFRAME_TICKS = 100  # a keyframe every 5 seconds
+
+
+class Room:
+    """One game: its engine and the connection in each seat"""
+
+    def __init__(self, room_id, seats, board_file, rng, recorder=None):
+        self.room_id = room_id
+        self.seats = seats
+        self.engine = GameEngine(seats, board_file.board, rng, recorder)
+        self.recorder = recorder
+        self.players = []
+        self.path = ()
+
+        # Spectator state: the last state they were sent and its sequence number
+        self.spectators = set()
+        self.sequence = 0
+        self.sent_state = None
+        self.keyframe_message = None
+        self.ticks_since_keyframe = 0
+
+    @property
+    def full(self):
+        return len(self.players) == self.seats
+
+    def broadcast(self, data):
+        for player in self.players:
+            player.send(data)
+
+    def roll(self, seat):
+        """Roll and move for seat; returns the MOVED message sent to every player"""
+        engine = self.engine
+        dice = engine.roll_dice()
+        start = engine.player_positions[seat]
+        result = engine.move_player(dice)
+        end, jump = (result.end, result.jump) if result is not None else (start, None)
+        self.path = tuple(result.path) if result is not None else ()
+        if not engine.game_over:
+            engine.next_turn()
+        message = protocol.moved(seat, dice, start, end, jump, engine.current_player, engine.game_over)
+        self.broadcast(message)
+        return message
+
+    def snapshot(self):
+        engine = self.engine
+        return protocol.GameState(tuple(engine.player_positions), engine.current_player, engine.dice_value,
+                                  self.path, engine.game_over, engine.winner)
+
+    def keyframe(self):
+        """KEYFRAME of the state spectators were last sent, built once per sequence number"""
+        if self.sent_state is None:
+            self.sent_state = self.snapshot()
+        if self.keyframe_message is None:
+            self.keyframe_message = protocol.keyframe(self.sequence, self.sent_state)
+        return self.keyframe_message
+
+    def tick(self):
+        """Send spectators what changed since the last tick; returns the bytes written"""
+        self.ticks_since_keyframe += 1
+        state = self.snapshot()
+        if self.ticks_since_keyframe >= KEYFRAME_TICKS:
+            self.sequence += 1
+            self.sent_state = state
+            self.keyframe_message = None
+            message = self.keyframe()
+            self.ticks_since_keyframe = 0
+        elif state != self.sent_state:
+            self.sequence += 1
+            message = protocol.delta(self.sequence, self.sent_state, state)
+            self.sent_state = state
+            self.keyframe_message = None
+        else:
+            return 0
+        for spectator in self.spectators:
+            spectator.send(message)
+        return len(message) * len(self.spectators)
+
+    def close(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+
+class GameServer:
+    """Room bookkeeping shared by every connection"""
+
+    def __init__(self, board_file, seed=None, replays_dir=None):
+        self.board_file = board_file
+        self.board_message = protocol.board_message(board_file.board)
+        self.rng = random.Random(seed)
+        self.replays_dir = replays_dir
+        self.rooms = {}
+        self.open_rooms = {}  # seats -> room still waiting for players
+        self.next_room_id = 1
+        self.connections = 0
+        self.watched_rooms = set()
+        # Spectator broadcast totals, for benchmarks
+        self.broadcast_seconds = 0.0
+        self.broadcast_bytes = 0
+
+    def create_room(self, room_id, seats):
+        seed = self.rng.randrange(1 << 32)
+        recorder = None
+        if self.replays_dir:
+            recorder = start_recording(self.replays_dir, seed, seats, self.board_file)
+        room = Room(room_id, seats, self.board_file, random.Random(seed), recorder)
+        self.rooms[room_id] = room
+        return room
+
+    def join(self, connection, room_id, seats):
+        """Seat connection in a room; returns the room, or None when it is full"""
+        if room_id == 0:
+            room = self.open_rooms.get(seats)
+            if room is None:
+                while self.next_room_id in self.rooms:
+                    self.next_room_id += 1
+                room = self.create_room(self.next_room_id, seats)
+                self.open_rooms[seats] = room
+        else:
+            room = self.rooms.get(room_id) or self.create_room(room_id, seats)
+            if room.full:
+                return None
+
+        seat = len(room.players)
+        room.players.append(connection)
+        connection.room, connection.seat = room, seat
+        connection.send(protocol.welcome(room.room_id, seat, room.seats) + self.board_message)
+        if room.full:
+            if self.open_rooms.get(room.seats) is room:
+                del self.open_rooms[room.seats]
+            room.broadcast(protocol.frame(protocol.START, protocol.START_BODY.pack(room.engine.current_player)))
+        return room
+
+    def finish(self, room):
+        """Forget a room whose game ended or was abandoned"""
+        if self.rooms.get(room.room_id) is room:
+            del self.rooms[room.room_id]
+        if self.open_rooms.get(room.seats) is room:
+            del self.open_rooms[room.seats]
+        for player in room.players:
+            player.room = None
+        if room.spectators:
+            # Spectators see the final state before the room goes away
+            self.broadcast_bytes += room.tick()
+            reason = protocol.GAME_OVER if room.engine.game_over else protocol.PLAYER_LEFT
+            closed = protocol.frame(protocol.CLOSED, protocol.CODE_BODY.pack(reason))
+            for spectator in room.spectators:
+                spectator.send(closed)
+                spectator.watching = None
+            room.spectators.clear()
+            self.watched_rooms.discard(room)
+        room.close()
+
+    def watch(self, connection, room_id):
+        """Add a spectator to a room and send it the current keyframe; False if there is no such room"""
+        room = self.rooms.get(room_id)
+        if room is None:
+            return False
+        self.unwatch(connection)
+        room.spectators.add(connection)
+        self.watched_rooms.add(room)
+        connection.watching = room
+        connection.send(protocol.welcome(room.room_id, protocol.SPECTATOR_SEAT, room.seats) + self.board_message
+                        + room.keyframe())
+        return True
+
+    def unwatch(self, connection):
+        room = connection.watching
+        if room is None:
+            return
+        room.spectators.discard(connection)
+        if not room.spectators:
+            self.watched_rooms.discard(room)
+        connection.watching = None
+
+    def tick(self):
+        """Send every watched room's changes to its spectators"""
+        start = time.perf_counter()
+        for room in self.watched_rooms:
+            self.broadcast_bytes += room.tick()
+        self.broadcast_seconds += time.perf_counter() - start
+
+    async def run_ticks(self):
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while True:
+            next_tick += TICK_SECONDS
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            self.tick()
+
+    def leave(self, connection):
+        room = connection.room
+        if room is None:
+            return
+        others = [player for player in room.players if player is not connection]
+        self.finish(room)
+        if not room.engine.game_over:
+            closed = protocol.frame(protocol.CLOSED, protocol.CODE_BODY.pack(protocol.PLAYER_LEFT))
+            for player in others:
+                player.send(closed)
+
+
+class PlayerConnection(asyncio.Protocol):
+    """One client socket: decodes frames and applies them to the server"""
+
+    def __init__(self, server):
+        self.server = server
+        self.frames = protocol.FrameBuffer()
+        self.transport = None
+        self.room = None
+        self.seat = None
+        self.watching = None
+        self.name = ''
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.server.connections += 1
+
+    def connection_lost(self, exc):
+        self.server.connections -= 1
+        self.server.leave(self)
+        self.server.unwatch(self)
+        self.transport = None
+
+    def send(self, data):
+        if self.transport is not None:
+            self.transport.write(data)
+
+    def data_received(self, data):
+        for kind, payload in self.frames.feed(data):
+            self.handle(kind, payload)
+
+    def handle(self, kind, payload):
+        server = self.server
+        if kind == protocol.ROLL:
+            room = self.room
+            if room is None or not room.full or room.engine.game_over:
+                self.send(protocol.error(protocol.NOT_IN_GAME, "no game in progress"))
+            elif room.engine.current_player != self.seat:
+                self.send(protocol.error(protocol.NOT_YOUR_TURN, "not your turn"))
+            else:
+                room.roll(self.seat)
+                if room.engine.game_over:
+                    server.finish(room)
+        elif kind == protocol.PING and len(payload) == protocol.PING_BODY.size:
+            self.send(protocol.frame(protocol.PONG, payload))
+        elif kind == protocol.JOIN and len(payload) >= protocol.JOIN_BODY.size:
+            room_id, seats = protocol.JOIN_BODY.unpack_from(payload)
+            if not 1 <= seats <= MAX_SEATS:
+                self.send(protocol.error(protocol.BAD_MESSAGE, f"seats must be between 1 and {MAX_SEATS}"))
+                return
+            server.leave(self)
+            server.unwatch(self)
+            self.name = payload[protocol.JOIN_BODY.size:].decode('utf-8', 'replace')
+            if server.join(self, room_id, seats) is None:
+                self.send(protocol.error(protocol.ROOM_FULL, f"room {room_id} is full"))
+        elif kind == protocol.WATCH and len(payload) == protocol.WATCH_BODY.size:
+            room_id, = protocol.WATCH_BODY.unpack(payload)
+            server.leave(self)
+            if not server.watch(self, room_id):
+                self.send(protocol.error(protocol.NOT_IN_GAME, f"no room {room_id}"))
+        elif kind == protocol.LEAVE:
+            server.leave(self)
+            server.unwatch(self)
+        else:
+            self.send(protocol.error(protocol.BAD_MESSAGE, f"unexpected message type {kind}"))
+
+
+def raise_open_file_limit():
+    """Allow as many sockets as the hard limit permits; returns the new soft limit"""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+            soft = hard
+        except (ValueError, OSError):
+            pass
+    return soft
+
+
+async def serve(host='127.0.0.1', port=DEFAULT_PORT, board_file=None, seed=None, replays_dir=None, ready=None):
+    """Run a GameServer until cancelled; ready, if given, is called with the bound port"""
+    server = GameServer(board_file or load_board_file(DEFAULT_BOARD_FILE), seed, replays_dir)
+    loop = asyncio.get_running_loop()
+    listener = await loop.create_server(lambda: PlayerConnection(server), host, port, backlog=4096)
+    if ready is not None:
+        ready(listener.sockets[0].getsockname()[1])
+    ticks = asyncio.create_task(server.run_ticks())
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        ticks.cancel()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Host networked Snake and Ladder games")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--board', default=DEFAULT_BOARD_FILE, help="board file every room plays on")
+    parser.add_argument('--seed', type=int, default=None, help="seed for reproducible room dice")
+    parser.add_argument('--replays', default=None, help="directory to record every room's replay log in")
+    args = parser.parse_args()
+
+    limit = raise_open_file_limit()
+    board_file = load_board_file(args.board)
+
+    def ready(port):
+        print(f"Serving {board_file.name} on {args.host}:{port} (up to ~{limit:,} connections)", flush=True)
+
+    try:
+        asyncio.run(serve(args.host, args.port, board_file, args.seed, args.replays, ready))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -1,61 +1,56 @@
 import pygame
 import random
-import math
+from game.animation import AnimationClock, PathTween, Tween
+from game.board_file import open_board
+from game.engine import GameEngine
+from game.geometry import BoardGeometry
+from game.resources import resources
+from game import sprites
+from game.text_cache import render_text
 
 class SnakeLadderGame:
-    def __init__(self, num_players=1):
-        pygame.init()
-        self.BOARD_SIZE = 10
-        self.CELL_SIZE = 60
-        self.WINDOW_WIDTH = 800
-        self.WINDOW_HEIGHT = 700
-        
-        # Colors
-        self.RED = (220, 20, 60)
-        self.GOLD = (255, 215, 0)
-        self.BEIGE = (245, 245, 220)
-        self.WHITE = (255, 255, 255)
-        self.BLACK = (0, 0, 0)
-        self.DARK_RED = (139, 0, 0)
-        self.GREEN = (34, 139, 34)
-        self.BLUE = (30, 144, 255)
-        self.PURPLE = (128, 0, 128)
-        self.SHADOW = (200, 200, 200)
-        self.LIGHT_BLUE = (173, 216, 230)
-        self.ORANGE = (255, 165, 0)
-        
-        self.screen = pygame.display.set_mode((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-        pygame.display.set_caption("Snake and Ladder Game")
-        self.font = pygame.font.Font(None, 24)
-        self.big_font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 20)
-        
-        # Game state
-        self.num_players = num_players
-        self.current_player = 0
-        self.player_positions = [1] * num_players
+    def __init__(self, num_players=1, board=None, seed=None, clock=None):
+        # The window, fonts and colors are shared by every game (game/resources.py)
+        self.WINDOW_WIDTH, self.WINDOW_HEIGHT = resources.size
+        for name, color in resources.palette.items():
+            setattr(self, name, color)
+        
+        # Board from a file (None means boards/classic.json); its theme recolors the palette
+        self.board_file = open_board(board)
+        for name, color in self.board_file.theme.items():
+            setattr(self, name, color)
+        
+        self.screen = resources.screen
+        resources.set_caption("Snake and Ladder Game")
+        self.font = resources.font(24)
+        self.big_font = resources.font(36)
+        self.small_font = resources.font(20)
+        
+        # Game state (rules and positions live in the headless engine)
+        self.engine = GameEngine(num_players, self.board_file.board, random.Random(seed))
         self.player_colors = [self.DARK_RED, self.GREEN, self.BLUE, self.PURPLE]
         self.player_names = ["Red", "Green", "Blue", "Purple"]
-        self.dice_value = 1
-        self.game_over = False
-        self.winner = None
         
-        # Animation
+        # Animation, timed in seconds on the clock the controller ticks every frame
+        self.clock = clock or AnimationClock()
         self.animating = False
-        self.animation_steps = []
-        self.animation_current_step = 0
-        self.animation_timer = 0
-        self.animation_delay = 20
+        self.animating_player = None
+        self.move_tween = None
+        self.step_seconds = 1 / 3
         
         # Message system
         self.show_message = False
         self.message_text = ""
-        self.message_timer = 0
+        self.message_tween = None
+        self.message_seconds = 3.0
         self.message_color = self.BLACK
         
         # Dice animation
         self.dice_rolling = False
-        self.dice_roll_timer = 0
+        self.dice_tween = None
+        self.dice_roll_seconds = 0.5
+        self.dice_face_rate = 20  # faces shown per second while rolling
+        self.dice_faces = list(range(1, 7))
         
         # Social awareness messages for snakes
         self.snake_messages = [
@@ -79,254 +74,346 @@ class SnakeLadderGame:
             "Helping others helps you! 🤝"
         ]
         
-        # Snakes and Ladders
-        self.ladders = {4: 14, 9: 31, 20: 38, 28: 84, 40: 59, 51: 67, 63: 81, 71: 91}
-        self.snakes = {16: 6, 47: 26, 49: 11, 56: 53, 62: 19, 64: 60, 87: 24, 93: 73, 95: 75, 98: 78}
-        
+        # Square-to-screen lookup table and the scrolling view of big boards
+        self.layout = self.board_file.layout()
+        
+        # Pre-rendered static board layer (tiles, numbers, ladders, snakes),
+        # in view-sized chunks of the whole board
+        self.board_surface = None  # window-sized: the chunks in view over the background
+        self.board_view = None
+        self.board_geometry = None
+        self.geometry_key = None
+        self.tile_sprites = None
+        self.tile_sprites_key = None
+        self.snake_resolution = 30
+        
+        # Tokens, die faces and panels, pre-rendered per theme (game/sprites.py)
+        self.sprites = None
+        self.sprites_key = None
+        
+        # Dirty-rectangle tracking: what each screen region showed last frame
+        self.dice_face = self.dice_value
+        self.drawn_regions = {}
+        self.needs_full_redraw = True
+        
+    @property
+    def num_players(self):
+        return self.engine.num_players
+    
+    @property
+    def current_player(self):
+        return self.engine.current_player
+    
+    @property
+    def player_positions(self):
+        return self.engine.player_positions
+    
+    @property
+    def dice_value(self):
+        return self.engine.dice_value
+    
+    @property
+    def game_over(self):
+        return self.engine.game_over
+    
+    @property
+    def winner(self):
+        return self.engine.winner
+    
+    @property
+    def busy(self):
+        # Anything on screen still moving or counting down
+        return self.animating or self.dice_rolling or self.show_message
+    
+    @property
+    def ladders(self):
+        return self.engine.board.ladders
+    
+    @property
+    def snakes(self):
+        return self.engine.board.snakes
+    
     def get_board_position(self, number):
-        if number < 1 or number > 100:
+        if number < 1 or number > self.engine.board.last_square:
             return 50, 50
-            
-        row = (number - 1) // self.BOARD_SIZE
-        col = (number - 1) % self.BOARD_SIZE
-        
-        if row % 2 == 1:
-            col = self.BOARD_SIZE - 1 - col
-            
-        x = 50 + col * self.CELL_SIZE + self.CELL_SIZE // 2
-        y = 550 - row * self.CELL_SIZE + self.CELL_SIZE // 2
-        return x, y
+        return self.layout.center(number)
     
     def draw_rounded_rect(self, surface, color, rect, radius):
         pygame.draw.rect(surface, color, rect, border_radius=radius)
     
-    def draw_snake(self, start_pos, end_pos):
+    def build_board_geometry(self):
+        # Snake curves and ladder rungs are computed once per board layout,
+        # unscrolled; drawing shifts them by the current scroll position
+        position = self.layout.unscrolled_center
+        return BoardGeometry([(position(start), position(end)) for start, end in self.snakes.items()],
+                             [(position(start), position(end)) for start, end in self.ladders.items()],
+                             snake_resolution=self.snake_resolution, snake_arch=40, rung_spacing=25)
+    
+    def draw_snake(self, start_pos, end_pos, points, thickness, surface=None):
+        if surface is None:
+            surface = self.screen
         start_x, start_y = start_pos
-        end_x, end_y = end_pos
-        
-        # Curved snake body with multiple control points
-        mid_x = (start_x + end_x) // 2
-        mid_y = min(start_y, end_y) - 40
-        
-        points = []
-        for t in range(31):
-            t = t / 30.0
-            x = (1-t)**2 * start_x + 2*(1-t)*t * mid_x + t**2 * end_x
-            y = (1-t)**2 * start_y + 2*(1-t)*t * mid_y + t**2 * end_y
-            points.append((int(x), int(y)))
         
         # Draw snake body with pattern
+        pattern = (self.RED, self.DARK_RED, (180, 30, 70))
         for i in range(len(points)-1):
-            # Varying thickness
-            thickness = 12 - int(abs(i - len(points)//2) * 4 / len(points))
-            thickness = max(thickness, 6)
-            
-            # Alternating colors for pattern
-            if i % 3 == 0:
-                color = self.RED
-            elif i % 3 == 1:
-                color = self.DARK_RED
-            else:
-                color = (180, 30, 70)
-            
-            pygame.draw.line(self.screen, color, points[i], points[i+1], thickness)
+            pygame.draw.line(surface, pattern[i % 3], points[i], points[i+1], thickness[i])
         
         # Enhanced snake head
-        pygame.draw.circle(self.screen, self.DARK_RED, start_pos, 15)
-        pygame.draw.circle(self.screen, (100, 0, 0), start_pos, 15, 3)
+        pygame.draw.circle(surface, self.DARK_RED, start_pos, 15)
+        pygame.draw.circle(surface, (100, 0, 0), start_pos, 15, 3)
         # Snake eyes
         eye1_pos = (start_x - 5, start_y - 3)
         eye2_pos = (start_x + 5, start_y - 3)
-        pygame.draw.circle(self.screen, self.WHITE, eye1_pos, 3)
-        pygame.draw.circle(self.screen, self.WHITE, eye2_pos, 3)
-        pygame.draw.circle(self.screen, self.BLACK, eye1_pos, 2)
-        pygame.draw.circle(self.screen, self.BLACK, eye2_pos, 2)
+        pygame.draw.circle(surface, self.WHITE, eye1_pos, 3)
+        pygame.draw.circle(surface, self.WHITE, eye2_pos, 3)
+        pygame.draw.circle(surface, self.BLACK, eye1_pos, 2)
+        pygame.draw.circle(surface, self.BLACK, eye2_pos, 2)
         
         # Snake tail
-        pygame.draw.circle(self.screen, self.RED, end_pos, 10)
-        pygame.draw.circle(self.screen, self.DARK_RED, end_pos, 10, 2)
+        pygame.draw.circle(surface, self.RED, end_pos, 10)
+        pygame.draw.circle(surface, self.DARK_RED, end_pos, 10, 2)
     
-    def draw_ladder(self, start_pos, end_pos):
+    def draw_ladder(self, start_pos, end_pos, rungs, surface=None):
+        if surface is None:
+            surface = self.screen
         start_x, start_y = start_pos
         end_x, end_y = end_pos
         
-        # Calculate ladder angle and length
-        dx = end_x - start_x
-        dy = end_y - start_y
-        length = math.sqrt(dx*dx + dy*dy)
-        
         # Ladder sides with better positioning
         side_offset = 10
-        pygame.draw.line(self.screen, (139, 69, 19), 
+        pygame.draw.line(surface, (139, 69, 19), 
                         (start_x - side_offset, start_y), 
                         (end_x - side_offset, end_y), 8)
-        pygame.draw.line(self.screen, (139, 69, 19), 
+        pygame.draw.line(surface, (139, 69, 19), 
                         (start_x + side_offset, start_y), 
                         (end_x + side_offset, end_y), 8)
         
-        # Enhanced ladder rungs with proper spacing
-        num_rungs = max(3, int(length / 25))
-        for i in range(num_rungs + 1):
-            t = i / num_rungs if num_rungs > 0 else 0
-            rung_x = int(start_x + dx * t)
-            rung_y = int(start_y + dy * t)
-            
+        for rung_x, rung_y in rungs:
             # Rung with shadow effect
-            pygame.draw.line(self.screen, (100, 50, 10), 
+            pygame.draw.line(surface, (100, 50, 10), 
                            (rung_x - side_offset + 1, rung_y + 1), 
                            (rung_x + side_offset + 1, rung_y + 1), 5)
-            pygame.draw.line(self.screen, (160, 82, 45), 
+            pygame.draw.line(surface, (160, 82, 45), 
                            (rung_x - side_offset, rung_y), 
                            (rung_x + side_offset, rung_y), 5)
     
-    def draw_board(self):
-        self.screen.fill(self.BEIGE)
-        
-        # Draw tiles
-        for i in range(100):
-            row = i // self.BOARD_SIZE
-            col = i % self.BOARD_SIZE
-            
-            if row % 2 == 1:
-                col = self.BOARD_SIZE - 1 - col
-                
-            x = 50 + col * self.CELL_SIZE
-            y = 550 - row * self.CELL_SIZE
-            
-            # Shadow
-            shadow_rect = pygame.Rect(x + 2, y + 2, self.CELL_SIZE - 4, self.CELL_SIZE - 4)
-            self.draw_rounded_rect(self.screen, self.SHADOW, shadow_rect, 8)
-            
-            # Main tile
-            tile_rect = pygame.Rect(x, y, self.CELL_SIZE - 4, self.CELL_SIZE - 4)
-            color = self.WHITE if (row + col) % 2 == 0 else self.GOLD
-            self.draw_rounded_rect(self.screen, color, tile_rect, 8)
-            pygame.draw.rect(self.screen, self.BLACK, tile_rect, 2, border_radius=8)
+    def get_board_cache_key(self):
+        # Everything the static board layer depends on
+        theme = (self.BEIGE, self.WHITE, self.GOLD, self.BLACK, self.SHADOW, self.RED, self.DARK_RED)
+        return (tuple(sorted(self.ladders.items())), tuple(sorted(self.snakes.items())),
+                self.snake_resolution, theme, self.layout.cell_size, self.layout.chunk_size)
+    
+    def get_tile_sprites(self):
+        # One pre-drawn tile per checkerboard color, on the board background
+        cell = self.layout.cell_size
+        key = (cell, self.BEIGE, self.WHITE, self.GOLD, self.BLACK, self.SHADOW)
+        if self.tile_sprites_key != key:
+            self.tile_sprites = resources.surface(('tiles', type(self).__name__) + key, self.build_tile_sprites)
+            self.tile_sprites_key = key
+        return self.tile_sprites
+    
+    def build_tile_sprites(self):
+        cell = self.layout.cell_size
+        tiles = []
+        for color in (self.WHITE, self.GOLD):
+            tile = pygame.Surface((cell, cell)).convert()
+            tile.fill(self.BEIGE)
+            self.draw_rounded_rect(tile, self.SHADOW, pygame.Rect(2, 2, cell - 4, cell - 4), 8)
+            tile_rect = pygame.Rect(0, 0, cell - 4, cell - 4)
+            self.draw_rounded_rect(tile, color, tile_rect, 8)
+            pygame.draw.rect(tile, self.BLACK, tile_rect, 2, border_radius=8)
+            tiles.append(tile)
+        return tiles
+    
+    def get_sprites(self):
+        # Everything the sprites depend on
+        key = (self.WHITE, self.BLACK, self.SHADOW, self.DARK_RED, self.LIGHT_BLUE, self.GOLD, self.RED,
+               self.GREEN, tuple(self.player_colors))
+        if self.sprites_key != key:
+            self.sprites = resources.surface(('sprites', type(self).__name__) + key, self.build_sprites)
+            self.sprites_key = key
+        return self.sprites
+    
+    def build_sprites(self):
+        atlas = {
+            'scoreboard': sprites.panel((140, 200), self.WHITE, 15, self.DARK_RED, 3, self.SHADOW),
+            'dice_value': sprites.panel((120, 30), self.LIGHT_BLUE, 8),
+            'row': sprites.panel((120, 20), (240, 240, 240), 5),
+            'card': sprites.panel((500, 300), self.WHITE, 20, self.GOLD, 5, self.SHADOW, shadow_offset=5),
+        }
+        for color in (self.RED, self.GREEN, self.BLACK):
+            atlas['message', color] = sprites.panel((600, 80), self.WHITE, 15, color, 3, self.SHADOW)
+        for player_id, color in enumerate(self.player_colors):
+            atlas['token', player_id] = sprites.token(15, color, self.WHITE, 3, self.SHADOW)
+            atlas['turn', player_id] = sprites.panel((120, 25), color, 8)
+            atlas['row', player_id] = sprites.panel((120, 20), color, 5)
+        for value in range(1, 7):
+            atlas['die', value] = sprites.die_face(value, self.WHITE, self.BLACK, self.BLACK, self.SHADOW)
+        return sprites.SpriteAtlas(atlas)
+    
+    def get_board_geometry(self):
+        key = (tuple(sorted(self.ladders.items())), tuple(sorted(self.snakes.items())),
+               self.snake_resolution, self.layout.cell_size)
+        if self.geometry_key != key:
+            self.board_geometry = self.build_board_geometry()
+            self.geometry_key = key
+        return self.board_geometry
+    
+    def render_board(self, surface, origin):
+        # Draw the part of the board whose top-left board pixel is origin
+        surface.fill(self.BEIGE)
+        layout = self.layout
+        cell = layout.cell_size
+        # Big numbers don't fit small cells
+        number_font = self.font if cell >= 50 else self.small_font
+        left, top = origin
+        width, height = surface.get_size()
+        
+        # Draw only the tiles inside the surface
+        tiles = self.get_tile_sprites()
+        for number in layout.squares_in(left, top, width, height):
+            x, y = layout.corner_list[number]
+            x, y = x - left, y - top
+            surface.blit(tiles[layout.parity_list[number]], (x, y))
             
             # Number
-            number = i + 1
-            text = self.font.render(str(number), True, self.BLACK)
-            text_rect = text.get_rect(center=(x + self.CELL_SIZE//2, y + self.CELL_SIZE//2))
-            self.screen.blit(text, text_rect)
-        
-        # Draw ladders and snakes
-        for start, end in self.ladders.items():
-            self.draw_ladder(self.get_board_position(start), self.get_board_position(end))
+            text = render_text(number_font, str(number), True, self.BLACK)
+            text_rect = text.get_rect(center=(x + cell//2, y + cell//2))
+            surface.blit(text, text_rect)
+        
+        # Draw ladders and snakes that reach into the surface
+        geometry = self.get_board_geometry()
+        offset = (-layout.area[0] - left, -layout.area[1] - top)
+        box = layout.board_box(left, top, width, height, margin=20)
+        for start_pos, end_pos, rungs in geometry.ladders(offset, box):
+            self.draw_ladder(start_pos, end_pos, rungs, surface)
             
-        for start, end in self.snakes.items():
-            self.draw_snake(self.get_board_position(start), self.get_board_position(end))
+        thickness = geometry.snake_thickness.tolist()
+        for start_pos, end_pos, points in geometry.snakes(offset, box):
+            self.draw_snake(start_pos, end_pos, points, thickness, surface)
+    
+    def draw_board(self):
+        # The board never changes during a game, so each chunk of it is
+        # rendered once, when it first scrolls into view. Scrolling only
+        # recomposes the board layer from cached chunks; other frames
+        # blit the layer as it is.
+        cache_key = self.get_board_cache_key()
+        size = self.screen.get_size()
+        view = (cache_key, size, self.layout.camera_x, self.layout.camera_y)
+        if view != self.board_view:
+            if self.layout.scrolls:
+                # One layer per camera position would flood the shared cache: reuse this game's
+                self.board_surface = self.compose_board(cache_key, self.board_surface)
+            else:
+                # A board that fits the view has a single layer, shared between games
+                self.board_surface = resources.surface(('board', type(self).__name__) + cache_key + (size,),
+                                                       lambda: self.compose_board(cache_key))
+            self.board_view = view
+        self.screen.blit(self.board_surface, (0, 0))
+    
+    def compose_board(self, cache_key, surface=None):
+        if surface is None or surface.get_size() != self.screen.get_size():
+            surface = pygame.Surface(self.screen.get_size()).convert()
+        surface.fill(self.BEIGE)
+        surface.set_clip(self.layout.view_rect())
+        for chunk, position in self.layout.visible_chunks():
+            # Shared between games, so a new game on the same board starts drawn
+            chunk_surface = resources.surface(('board chunk', type(self).__name__) + cache_key + (chunk,),
+                                              lambda: self.build_board_chunk(chunk))
+            surface.blit(chunk_surface, position)
+        surface.set_clip(None)
+        return surface
+    
+    def build_board_chunk(self, chunk):
+        surface = pygame.Surface(self.layout.chunk_size).convert()
+        self.render_board(surface, self.layout.chunk_origin(chunk))
+        return surface
+    
+    def get_token_center(self, player_id):
+        # Get current position: between two squares of its path while moving
+        if self.animating and player_id == self.animating_player:
+            square, next_square, fraction = self.move_tween.position()
+            x, y = self.get_board_position(square)
+            if fraction:
+                next_x, next_y = self.get_board_position(next_square)
+                x += (next_x - x) * fraction
+                y += (next_y - y) * fraction
+        else:
+            x, y = self.get_board_position(self.player_positions[player_id])
+        
+        # Offset for multiple players
+        offset_x = (player_id % 2) * 15 - 7
+        offset_y = (player_id // 2) * 15 - 7
+        return int(x + offset_x), int(y + offset_y)
     
     def draw_players(self):
+        # Tokens scrolled out of view are clipped away
+        atlas = self.get_sprites()
+        self.screen.set_clip(self.layout.view_rect())
         for player_id in range(self.num_players):
-            # Get current position (animated or static)
-            if self.animating and player_id == self.current_player and self.animation_current_step < len(self.animation_steps):
-                pos = self.animation_steps[self.animation_current_step]
-            else:
-                pos = self.player_positions[player_id]
-                
-            x, y = self.get_board_position(pos)
-            
-            # Offset for multiple players
-            offset_x = (player_id % 2) * 15 - 7
-            offset_y = (player_id // 2) * 15 - 7
-            
-            color = self.player_colors[player_id]
-            
-            # Shadow
-            pygame.draw.circle(self.screen, self.SHADOW, (int(x + offset_x + 2), int(y + offset_y + 2)), 15)
-            # Player token
-            pygame.draw.circle(self.screen, color, (int(x + offset_x), int(y + offset_y)), 15)
-            pygame.draw.circle(self.screen, self.WHITE, (int(x + offset_x), int(y + offset_y)), 15, 3)
+            x, y = self.get_token_center(player_id)
+            atlas.draw(self.screen, ('token', player_id), (x - 15, y - 15))
+        self.screen.set_clip(None)
+    
+    def get_focus_square(self):
+        # The square the view follows: the moving token, else the player to move
+        if self.animating:
+            return self.move_tween.square
+        return self.player_positions[self.current_player]
     
     def draw_scoreboard(self):
         # Scoreboard background
-        board_rect = pygame.Rect(650, 50, 140, 200)
-        shadow_rect = pygame.Rect(653, 53, 140, 200)
-        
-        self.draw_rounded_rect(self.screen, self.SHADOW, shadow_rect, 15)
-        self.draw_rounded_rect(self.screen, self.WHITE, board_rect, 15)
-        pygame.draw.rect(self.screen, self.DARK_RED, board_rect, 3, border_radius=15)
+        atlas = self.get_sprites()
+        atlas.draw(self.screen, 'scoreboard', (650, 50))
         
         # Scoreboard title
-        title = self.font.render("SCOREBOARD", True, self.DARK_RED)
+        title = render_text(self.font, "SCOREBOARD", True, self.DARK_RED)
         title_rect = title.get_rect(center=(720, 70))
         self.screen.blit(title, title_rect)
         
         # Dice value with icon
-        dice_bg = pygame.Rect(660, 90, 120, 30)
-        self.draw_rounded_rect(self.screen, self.LIGHT_BLUE, dice_bg, 8)
+        atlas.draw(self.screen, 'dice_value', (660, 90))
         dice_text = f"🎲 Dice: {self.dice_value}"
-        dice_surface = self.small_font.render(dice_text, True, self.BLACK)
+        dice_surface = render_text(self.small_font, dice_text, True, self.BLACK)
         self.screen.blit(dice_surface, (665, 97))
         
         # Current player turn
         if self.num_players > 1 and not self.game_over:
-            turn_bg = pygame.Rect(660, 125, 120, 25)
-            turn_color = self.player_colors[self.current_player]
-            self.draw_rounded_rect(self.screen, turn_color, turn_bg, 8)
+            atlas.draw(self.screen, ('turn', self.current_player), (660, 125))
             turn_text = f"{self.player_names[self.current_player]}'s Turn"
-            turn_surface = self.small_font.render(turn_text, True, self.WHITE)
+            turn_surface = render_text(self.small_font, turn_text, True, self.WHITE)
             self.screen.blit(turn_surface, (665, 130))
         
         # Player positions
         y_offset = 160
         for i in range(self.num_players):
-            # Player info background
-            player_bg = pygame.Rect(660, y_offset, 120, 20)
-            player_color = self.player_colors[i]
-            
-            # Highlight current player
+            # Player info background, highlighted for the current player
             if i == self.current_player and not self.game_over:
-                self.draw_rounded_rect(self.screen, player_color, player_bg, 5)
+                atlas.draw(self.screen, ('row', i), (660, y_offset))
                 text_color = self.WHITE
             else:
-                self.draw_rounded_rect(self.screen, (240, 240, 240), player_bg, 5)
-                text_color = player_color
+                atlas.draw(self.screen, 'row', (660, y_offset))
+                text_color = self.player_colors[i]
             
             player_text = f"{self.player_names[i]}: {self.player_positions[i]}"
-            pos_surface = self.small_font.render(player_text, True, text_color)
+            pos_surface = render_text(self.small_font, player_text, True, text_color)
             self.screen.blit(pos_surface, (665, y_offset + 2))
             y_offset += 25
     
     def draw_dice(self):
-        dice_x, dice_y = 650, 270
-        
-        # Shadow
-        pygame.draw.rect(self.screen, self.SHADOW, (dice_x + 3, dice_y + 3, 80, 80), border_radius=10)
-        # Dice
-        self.draw_rounded_rect(self.screen, self.WHITE, pygame.Rect(dice_x, dice_y, 80, 80), 10)
-        pygame.draw.rect(self.screen, self.BLACK, (dice_x, dice_y, 80, 80), 3, border_radius=10)
-        
-        display_value = random.randint(1, 6) if self.dice_rolling else self.dice_value
-        
-        # Dice dots
-        dot_positions = {
-            1: [(40, 40)],
-            2: [(20, 20), (60, 60)],
-            3: [(20, 20), (40, 40), (60, 60)],
-            4: [(20, 20), (60, 20), (20, 60), (60, 60)],
-            5: [(20, 20), (60, 20), (40, 40), (20, 60), (60, 60)],
-            6: [(20, 20), (60, 20), (20, 40), (60, 40), (20, 60), (60, 60)]
-        }
-        
-        for dot_x, dot_y in dot_positions[display_value]:
-            pygame.draw.circle(self.screen, self.BLACK, (dice_x + dot_x, dice_y + dot_y), 6)
+        self.get_sprites().draw(self.screen, ('die', self.dice_face), (650, 270))
     
     def draw_message(self):
         if self.show_message:
             # Message background
-            msg_rect = pygame.Rect(50, 600, 600, 80)
-            shadow_rect = pygame.Rect(53, 603, 600, 80)
-            
-            self.draw_rounded_rect(self.screen, self.SHADOW, shadow_rect, 15)
-            self.draw_rounded_rect(self.screen, self.WHITE, msg_rect, 15)
-            pygame.draw.rect(self.screen, self.message_color, msg_rect, 3, border_radius=15)
+            self.get_sprites().draw(self.screen, ('message', self.message_color), (50, 600))
             
             # Message text
             lines = self.wrap_text(self.message_text, 70)
             y_offset = 620
             for line in lines:
-                text = self.font.render(line, True, self.message_color)
+                text = render_text(self.font, line, True, self.message_color)
                 text_rect = text.get_rect(center=(350, y_offset))
                 self.screen.blit(text, text_rect)
                 y_offset += 25
@@ -351,49 +438,44 @@ class SnakeLadderGame:
     
     def draw_ui(self):
         # Title moved to top-right area
-        title_shadow = self.big_font.render("🐍 Snake and Ladder 🪜", True, self.SHADOW)
+        title_shadow = render_text(self.big_font, "🐍 Snake and Ladder 🪜", True, self.SHADOW)
         self.screen.blit(title_shadow, (652, 12))
-        title = self.big_font.render("🐍 Snake and Ladder 🪜", True, self.DARK_RED)
+        title = render_text(self.big_font, "🐍 Snake and Ladder 🪜", True, self.DARK_RED)
         self.screen.blit(title, (650, 10))
         
         # Instructions
         if not self.animating and not self.game_over:
-            instruction = self.font.render("SPACE: Roll | F11: Fullscreen", True, self.BLACK)
+            instruction = render_text(self.font, "SPACE: Roll | F11: Fullscreen", True, self.BLACK)
             self.screen.blit(instruction, (650, 370))
         elif self.animating:
-            instruction = self.font.render("Moving...", True, self.ORANGE)
+            instruction = render_text(self.font, "Moving...", True, self.ORANGE)
             self.screen.blit(instruction, (650, 370))
         
         # Game over with beautiful design
         if self.game_over:
-            # Celebration overlay
-            overlay = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-            overlay.set_alpha(200)
-            overlay.fill((0, 0, 50))
+            # Celebration overlay, made once and kept
+            size = (self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
+            overlay = resources.surface(('overlay', size, (0, 0, 50), 200),
+                                        lambda: sprites.overlay(size, (0, 0, 50), 200))
             self.screen.blit(overlay, (0, 0))
             
             # Winner card
-            card_rect = pygame.Rect(150, 200, 500, 300)
-            shadow_rect = pygame.Rect(155, 205, 500, 300)
-            
-            self.draw_rounded_rect(self.screen, self.SHADOW, shadow_rect, 20)
-            self.draw_rounded_rect(self.screen, self.WHITE, card_rect, 20)
-            pygame.draw.rect(self.screen, self.GOLD, card_rect, 5, border_radius=20)
+            self.get_sprites().draw(self.screen, 'card', (150, 200))
             
             # Celebration text
-            congrats = self.big_font.render("🎉 CONGRATULATIONS! 🎉", True, self.GOLD)
+            congrats = render_text(self.big_font, "🎉 CONGRATULATIONS! 🎉", True, self.GOLD)
             congrats_rect = congrats.get_rect(center=(400, 250))
             self.screen.blit(congrats, congrats_rect)
             
             # Winner announcement
             winner_text = f"🏆 {self.player_names[self.winner]} Player Wins! 🏆"
             win_color = self.player_colors[self.winner]
-            win_surface = self.big_font.render(winner_text, True, win_color)
+            win_surface = render_text(self.big_font, winner_text, True, win_color)
             win_rect = win_surface.get_rect(center=(400, 300))
             self.screen.blit(win_surface, win_rect)
             
             # Final positions
-            final_text = self.font.render("Final Positions:", True, self.BLACK)
+            final_text = render_text(self.font, "Final Positions:", True, self.BLACK)
             final_rect = final_text.get_rect(center=(400, 350))
             self.screen.blit(final_text, final_rect)
             
@@ -401,13 +483,13 @@ class SnakeLadderGame:
             for i in range(self.num_players):
                 pos_text = f"{self.player_names[i]}: {self.player_positions[i]}"
                 pos_color = self.player_colors[i]
-                pos_surface = self.font.render(pos_text, True, pos_color)
+                pos_surface = render_text(self.font, pos_text, True, pos_color)
                 pos_rect = pos_surface.get_rect(center=(400, y_pos))
                 self.screen.blit(pos_surface, pos_rect)
                 y_pos += 25
             
             # Play again instruction
-            again_text = self.small_font.render("Press ESC to return to menu", True, self.BLACK)
+            again_text = render_text(self.small_font, "Press ESC to return to menu", True, self.BLACK)
             again_rect = again_text.get_rect(center=(400, 460))
             self.screen.blit(again_text, again_rect)
     
@@ -415,88 +497,104 @@ class SnakeLadderGame:
         self.message_text = random.choice(self.snake_messages)
         self.message_color = self.RED
         self.show_message = True
-        self.message_timer = 180  # 3 seconds at 60 FPS
+        self.message_tween = Tween(self.clock, self.message_seconds)
     
     def show_ladder_message(self):
         self.message_text = random.choice(self.ladder_messages)
         self.message_color = self.GREEN
         self.show_message = True
-        self.message_timer = 180
+        self.message_tween = Tween(self.clock, self.message_seconds)
     
     def roll_dice(self):
         self.dice_rolling = True
-        self.dice_roll_timer = 0
-        self.dice_value = random.randint(1, 6)
-        return self.dice_value
+        self.dice_tween = Tween(self.clock, self.dice_roll_seconds)
+        # The faces shown while it rolls: one shuffle per roll, not a random number per frame
+        random.shuffle(self.dice_faces)
+        return self.engine.roll_dice()
     
     def move_player(self, steps):
-        current_pos = self.player_positions[self.current_player]
-        new_position = current_pos + steps
-        
-        if new_position > 100:
+        result = self.engine.move_player(steps)
+        if result is None:
             return False
         
-        # Create animation steps
-        self.animation_steps = []
-        for i in range(1, steps + 1):
-            self.animation_steps.append(current_pos + i)
-        
-        # Check for snake or ladder
-        final_position = new_position
-        if final_position in self.ladders:
-            final_position = self.ladders[final_position]
-            self.animation_steps.append(final_position)
+        if result.jump == 'ladder':
             self.show_ladder_message()
-        elif final_position in self.snakes:
-            final_position = self.snakes[final_position]
-            self.animation_steps.append(final_position)
+        elif result.jump == 'snake':
             self.show_snake_message()
         
-        # Start animation
+        # Hop square by square from the start, then along the snake or ladder.
+        # The turn may pass before the hops finish, so remember whose token moves.
         self.animating = True
-        self.animation_current_step = 0
-        self.animation_timer = 0
-        
-        # Set final position
-        self.player_positions[self.current_player] = final_position
-        
-        if final_position >= 100:
-            self.game_over = True
-            self.winner = self.current_player
+        self.animating_player = result.player
+        self.move_tween = PathTween(self.clock, [result.start] + result.path, self.step_seconds)
             
         return True
     
     def next_turn(self):
-        if self.num_players > 1:
-            self.current_player = (self.current_player + 1) % self.num_players
+        self.engine.next_turn()
     
     def update(self):
-        # Dice animation
-        if self.dice_rolling:
-            self.dice_roll_timer += 1
-            if self.dice_roll_timer >= 30:
-                self.dice_rolling = False
-        
-        # Player animation
-        if self.animating:
-            self.animation_timer += 1
-            if self.animation_timer >= self.animation_delay:
-                self.animation_timer = 0
-                self.animation_current_step += 1
-                if self.animation_current_step >= len(self.animation_steps):
-                    self.animating = False
-        
-        # Message timer
-        if self.show_message:
-            self.message_timer -= 1
-            if self.message_timer <= 0:
-                self.show_message = False
+        # End whatever animations have run their time on the clock
+        if self.dice_rolling and self.dice_tween.done:
+            self.dice_rolling = False
+        if self.animating and self.move_tween.done:
+            self.animating = False
+        if self.show_message and self.message_tween.done:
+            self.show_message = False
+    
+    def get_screen_regions(self):
+        # Every screen area that changes during play, with the state it shows
+        regions = {}
+        for player_id in range(self.num_players):
+            x, y = self.get_token_center(player_id)
+            regions['token', player_id] = (pygame.Rect(x - 16, y - 16, 34, 34), None)
+        regions['dice'] = (pygame.Rect(650, 270, 83, 83), self.dice_face)
+        regions['scoreboard'] = (pygame.Rect(650, 50, 143, 203),
+                                 (self.dice_value, self.current_player, tuple(self.player_positions), self.game_over))
+        regions['message'] = (pygame.Rect(50, 600, 603, 83),
+                              (self.show_message, self.message_text, self.message_color))
+        regions['instructions'] = (pygame.Rect(650, 370, 150, 20), (self.animating, self.game_over))
+        regions['game_over'] = (self.screen.get_rect(), (self.game_over, self.winner))
+        return regions
+    
+    def invalidate(self):
+        # Force the next draw to repaint and push the whole window
+        self.needs_full_redraw = True
     
     def draw(self):
+        # Returns the screen rectangles that changed; an empty list means
+        # the frame is identical to the previous one and nothing was drawn.
+        if self.dice_rolling:
+            # A new face dice_face_rate times a second, whatever the frame rate
+            slot = int(self.dice_tween.elapsed * self.dice_face_rate)
+            self.dice_face = self.dice_faces[slot % 6]
+        else:
+            self.dice_face = self.dice_value
+        if self.layout.follow(self.get_focus_square()):
+            self.needs_full_redraw = True  # the board scrolled
+        regions = self.get_screen_regions()
+        
+        if self.needs_full_redraw:
+            dirty = [self.screen.get_rect()]
+        else:
+            dirty = []
+            for name, region in regions.items():
+                previous = self.drawn_regions.get(name)
+                if previous != region:
+                    dirty.append(region[0])
+                    if previous:
+                        dirty.append(previous[0])
+        
+        if not dirty:
+            return []
+        
         self.draw_board()
         self.draw_players()
         self.draw_scoreboard()
         self.draw_dice()
         self.draw_message()
         self.draw_ui()
-        pygame.display.flip()
\ No newline at end of file
+        
+        self.drawn_regions = regions
+        self.needs_full_redraw = False
+        return dirty
@@ -1,17 +1,44 @@
 import pygame
+import pygame.surfarray
 import math
 import random
+import numpy as np
+from game.animation import AnimationClock
+from game.resources import resources
+from game.text_cache import render_text
+
+def vertical_gradient(size, stops):
+    """Surface filled top to bottom through evenly spaced color stops, built once per size"""
+    key = ('gradient', tuple(size), tuple(stops))
+    return resources.surface(key, lambda: build_gradient(size, stops))
+
+
+def build_gradient(size, stops):
+    width, height = size
+    stops = np.array(stops, dtype=float)
+    # Position of every row along the stops, split into segment and fraction
+    position = np.arange(height) / height * (len(stops) - 1)
+    segment = np.minimum(position.astype(int), len(stops) - 2)
+    fraction = (position - segment)[:, None]
+    rows = (stops[segment] * (1 - fraction) + stops[segment + 1] * fraction).astype(np.uint8)
+    # In the window's pixel format, so blitting it is a straight copy
+    return pygame.surfarray.make_surface(np.ascontiguousarray(np.broadcast_to(rows, (width, height, 3)))).convert()
+
 
 class SimpleMenu:
-    def __init__(self, screen, font, big_font, colors):
+    def __init__(self, screen, font, big_font, colors, clock=None):
         self.screen = screen
         self.font = font
         self.big_font = big_font
         self.colors = colors
         self.selected_option = 0
-        self.options = ["1 Player", "2 Players", "3 Players", "4 Players", "Exit Game"]
+        self.quiz_mode = False
+        self.can_resume = False  # shown over a paused game: ESC goes back to it
+        self.options = ["1 Player", "2 Players", "3 Players", "4 Players", self.quiz_label(), "Exit Game"]
         
-        # Animation variables
+        # Animation variables; time counts 60 Hz frames of clock time,
+        # the unit the decoration formulas below are written in
+        self.clock = clock or AnimationClock()
         self.time = 0
         self.floating_offset = 0
         self.sparkles = []
@@ -29,6 +56,12 @@ class SimpleMenu:
         self.current_message = 0
         self.message_timer = 0
         
+        # Background gradient from top to bottom
+        self.gradient_stops = ((245, 245, 220), (200, 220, 255))
+        
+    def quiz_label(self):
+        return "AWS Quiz: On" if self.quiz_mode else "AWS Quiz: Off"
+    
     def init_sparkles(self):
         for _ in range(15):
             self.sparkles.append({
@@ -40,19 +73,20 @@ class SimpleMenu:
             })
     
     def update(self):
-        self.time += 1
+        self.time = self.clock.now * 60
+        frames = self.clock.dt * 60
         self.floating_offset = math.sin(self.time * 0.05) * 10
         
         # Update sparkles
         for sparkle in self.sparkles:
-            sparkle['y'] -= sparkle['speed']
+            sparkle['y'] -= sparkle['speed'] * frames
             if sparkle['y'] < 0:
                 sparkle['y'] = 700
                 sparkle['x'] = random.randint(50, 750)
         
         # Update fun message
-        self.message_timer += 1
-        if self.message_timer > 180:  # Change every 3 seconds
+        self.message_timer += self.clock.dt
+        if self.message_timer > 3.0:  # Change every 3 seconds
             self.current_message = (self.current_message + 1) % len(self.fun_messages)
             self.message_timer = 0
     
@@ -136,13 +170,8 @@ class SimpleMenu:
                              (x + dot_x, y + dot_y), 4)
     
     def draw(self):
-        # Gradient background
-        for y in range(700):
-            color_ratio = y / 700
-            r = int(245 * (1 - color_ratio) + 200 * color_ratio)
-            g = int(245 * (1 - color_ratio) + 220 * color_ratio)
-            b = int(220 * (1 - color_ratio) + 255 * color_ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (800, y))
+        # Gradient background (pre-rendered once per window size)
+        self.screen.blit(vertical_gradient(self.screen.get_size(), self.gradient_stops), (0, 0))
         
         # Draw sparkles
         self.draw_sparkles()
@@ -154,30 +183,30 @@ class SimpleMenu:
         
         # Main title with shadow and animation
         title_y = 180 + self.floating_offset
-        title_shadow = self.big_font.render("🐍 SNAKE & LADDER 🪜", True, (100, 100, 100))
+        title_shadow = render_text(self.big_font, "🐍 SNAKE & LADDER 🪜", True, (100, 100, 100))
         title_rect_shadow = title_shadow.get_rect(center=(402, title_y + 2))
         self.screen.blit(title_shadow, title_rect_shadow)
         
-        title = self.big_font.render("🐍 SNAKE & LADDER 🪜", True, self.colors['DARK_RED'])
+        title = render_text(self.big_font, "🐍 SNAKE & LADDER 🪜", True, self.colors['DARK_RED'])
         title_rect = title.get_rect(center=(400, title_y))
         self.screen.blit(title, title_rect)
         
         # Fun subtitle with animation
         subtitle_colors = [self.colors['GOLD'], self.colors['RED'], self.colors['DARK_RED']]
         subtitle_color = subtitle_colors[int(self.time / 20) % len(subtitle_colors)]
-        subtitle = self.font.render("Classic Board Game Fun!", True, subtitle_color)
+        subtitle = render_text(self.font, "Classic Board Game Fun!", True, subtitle_color)
         subtitle_rect = subtitle.get_rect(center=(400, title_y + 40))
         self.screen.blit(subtitle, subtitle_rect)
         
         # Fun message rotation
-        message = self.font.render(self.fun_messages[self.current_message], True, self.colors['BLACK'])
+        message = render_text(self.font, self.fun_messages[self.current_message], True, self.colors['BLACK'])
         message_rect = message.get_rect(center=(400, 260))
         self.screen.blit(message, message_rect)
         
         # Menu options with enhanced styling
-        y_start = 320
+        y_start = 300
         for i, option in enumerate(self.options):
-            option_y = y_start + i * 60
+            option_y = y_start + i * 55
             option_rect = pygame.Rect(250, option_y, 300, 50)
             
             # Animation for selected option
@@ -213,16 +242,19 @@ class SimpleMenu:
             if option == "Exit Game":
                 text_color = self.colors['RED']
                 option_text = "❌ " + option
+            elif option == self.quiz_label():
+                option_text = "☁ " + option
             else:
                 option_text = "🎮 " + option
                 
-            text_surface = self.font.render(option_text, True, text_color)
+            text_surface = render_text(self.font, option_text, True, text_color)
             text_rect = text_surface.get_rect(center=option_rect.center)
             self.screen.blit(text_surface, text_rect)
         
         # Instructions with animation
         instruction_y = 650 + math.sin(self.time * 0.1) * 3
-        instruction = self.font.render("↑↓ Navigate • ENTER Select • ESC Exit", True, self.colors['BLACK'])
+        escape = "ESC Resume" if self.can_resume else "ESC Exit"
+        instruction = render_text(self.font, f"↑↓ Navigate • ENTER Select • {escape}", True, self.colors['BLACK'])
         instruction_rect = instruction.get_rect(center=(400, instruction_y))
         self.screen.blit(instruction, instruction_rect)
         
@@ -235,6 +267,9 @@ class SimpleMenu:
             elif event.key == pygame.K_RETURN:
                 if self.selected_option == len(self.options) - 1:  # Exit Game
                     return 'exit'
+                elif self.selected_option == len(self.options) - 2:  # Quiz toggle
+                    self.quiz_mode = not self.quiz_mode
+                    self.options[-2] = self.quiz_label()
                 else:
                     return self.selected_option + 1
         return None
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""Pre-rendered sprites for everything drawn on top of the board.
+
+Tokens, the six die faces and the rounded panels of the side bar,
+message box and winner card are drawn once per theme into a SpriteAtlas
+(one sheet surface, shelf-packed), so drawing a frame is a handful of
+blits from that sheet. Each sprite includes its drop shadow and is drawn
+exactly as the shapes were drawn straight onto the screen, so the
+picture does not change.
+
+Games build their atlas through resources.surface(), keyed on the
+colors it uses, so it is shared by every game with the same theme.
+"""
+import pygame
+
+# Pip centers on an 80 pixel die, by face value
+PIPS = {
+    1: [(40, 40)],
+    2: [(20, 20), (60, 60)],
+    3: [(20, 20), (40, 40), (60, 60)],
+    4: [(20, 20), (60, 20), (20, 60), (60, 60)],
+    5: [(20, 20), (60, 20), (40, 40), (20, 60), (60, 60)],
+    6: [(20, 20), (60, 20), (20, 40), (60, 40), (20, 60), (60, 60)],
+}
+
+SHEET_WIDTH = 1024
+
+# Sprites are drawn without antialiasing, so each pixel is either opaque
+# or empty: the sheet marks empty pixels with this color key instead of
+# per-pixel alpha, which blits at close to the cost of a plain copy.
+# (Not RLE: clipping a sprite out of an RLE sheet rescans its long rows.)
+COLORKEY = (255, 0, 254)
+
+
+def blank(size):
+    return pygame.Surface(size, pygame.SRCALPHA)
+
+
+def panel(size, fill, radius, border=None, border_width=0, shadow=None, shadow_offset=3):
+    """Rounded rectangle of size with an optional border and drop shadow below and right of it"""
+    width, height = size
+    offset = shadow_offset if shadow else 0
+    surface = blank((width + offset, height + offset))
+    rect = pygame.Rect(0, 0, width, height)
+    if shadow:
+        pygame.draw.rect(surface, shadow, rect.move(offset, offset), border_radius=radius)
+    pygame.draw.rect(surface, fill, rect, border_radius=radius)
+    if border:
+        pygame.draw.rect(surface, border, rect, border_width, border_radius=radius)
+    return surface
+
+
+def token(radius, color, ring, ring_width, shadow, inner=None, inner_radius=0, shadow_offset=2):
+    """Round player token centered at (radius, radius), with its shadow"""
+    size = 2 * radius + 1 + shadow_offset
+    surface = blank((size, size))
+    center = (radius, radius)
+    pygame.draw.circle(surface, shadow, (radius + shadow_offset, radius + shadow_offset), radius)
+    pygame.draw.circle(surface, color, center, radius)
+    pygame.draw.circle(surface, ring, center, radius, ring_width)
+    if inner:
+        pygame.draw.circle(surface, inner, center, inner_radius)
+    return surface
+
+
+def die_face(value, fill, border, pip, shadow):
+    """80 pixel die showing value, with its shadow"""
+    surface = panel((80, 80), fill, 10, border, 3, shadow)
+    for x, y in PIPS[value]:
+        pygame.draw.circle(surface, pip, (x, y), 6)
+    return surface
+
+
+def overlay(size, color, alpha):
+    """Full-window translucent wash, blended whole with surface alpha"""
+    surface = pygame.Surface(size).convert()
+    surface.fill(color)
+    surface.set_alpha(alpha)
+    return surface
+
+
+class SpriteAtlas:
+    """Named sprites packed onto one sheet; draw(target, name, pos) blits one"""
+
+    def __init__(self, sprites, width=SHEET_WIDTH):
+        # Shelf packing, tallest first: rows of sprites left to right
+        order = sorted(sprites, key=lambda name: -sprites[name].get_height())
+        self.rects = {}
+        x = y = shelf = 0
+        for name in order:
+            w, h = sprites[name].get_size()
+            if x + w > width and x:
+                x, y = 0, y + shelf
+                shelf = 0
+            self.rects[name] = pygame.Rect(x, y, w, h)
+            x += w
+            shelf = max(shelf, h)
+        used = max((rect.right for rect in self.rects.values()), default=1)
+        self.sheet = pygame.Surface((used, max(1, y + shelf))).convert()
+        self.sheet.fill(COLORKEY)
+        for name, rect in self.rects.items():
+            self.sheet.blit(sprites[name], rect)
+        self.sheet.set_colorkey(COLORKEY)
+
+    def __contains__(self, name):
+        return name in self.rects
+
+    def size(self, name):
+        return self.rects[name].size
+
+    def draw(self, target, name, pos):
+        return target.blit(self.sheet, pos, self.rects[name])
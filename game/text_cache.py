@@ -0,0 +1,83 @@
+"""Shared cache of rendered text surfaces.
+
+Most text on screen (tile numbers, titles, labels, instructions, quiz
+lines) is the same from frame to frame, so rendering it once and reusing
+the surface removes most of the per-frame font work. Entries are keyed on
+(font, text, antialias, color) and evicted least-recently-used once the
+cached pixels exceed the memory cap.
+
+Cached surfaces are shared between callers and must not be drawn on.
+Rendering and measuring are serialized by a lock, so background threads
+(such as question-card prefetching) can lay out text safely.
+"""
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+
+class TextCache:
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.surfaces = OrderedDict()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # SDL_ttf fonts are not thread-safe, so every font call holds this
+        self.lock = threading.RLock()
+
+    def render(self, font, text, antialias, color):
+        """Drop-in for font.render(text, antialias, color) that reuses surfaces"""
+        key = (font, text, antialias, tuple(color))
+        with self.lock:
+            surface = self.surfaces.get(key)
+            if surface is not None:
+                self.hits += 1
+                self.surfaces.move_to_end(key)
+                return surface
+
+            self.misses += 1
+            surface = font.render(text, antialias, color)
+            self.surfaces[key] = surface
+            self.size_bytes += surface.get_pitch() * surface.get_height()
+            while self.size_bytes > self.max_bytes and len(self.surfaces) > 1:
+                _, evicted = self.surfaces.popitem(last=False)
+                self.size_bytes -= evicted.get_pitch() * evicted.get_height()
+                self.evictions += 1
+            return surface
+
+    def size(self, font, text):
+        """font.size(text), safe to call from any thread"""
+        with self.lock:
+            return font.size(text)
+
+    def clear(self):
+        with self.lock:
+            self.surfaces.clear()
+            self.size_bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.surfaces),
+            'bytes': self.size_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Shared by every screen in the game
+text_cache = TextCache()
+
+
+def render_text(font, text, antialias, color):
+    """Render text through the shared cache"""
+    return text_cache.render(font, text, antialias, color)
+
+
+def text_size(font, text):
+    """Pixel size of text in font"""
+    return text_cache.size(font, text)
@@ -0,0 +1,137 @@
+"""Multi-process tournament runner for balance sweeps.
+
+Simulated games are split into fixed-size chunks and spread over a
+ProcessPoolExecutor. Chunk i of a run always draws from the same
+SeedSequence child, so results are reproducible no matter how many
+workers run or which worker picks up which chunk. Only a bounded number
+of chunks are in flight and each returns an aggregated BatchResult, so
+memory stays flat however many games are played.
+
+    python -m game.tournament --games 10000000 --players 4 --seed 7
+"""
+import argparse
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from game.batch import BatchResult, simulate_games
+from game.engine import Board
+
+
+def chunk_seed(seed, board_index, chunk_index):
+    """Independent, reproducible random stream for one chunk of one board"""
+    return np.random.SeedSequence(seed, spawn_key=(board_index, chunk_index))
+
+
+def run_chunk(board_key, num_players, num_games, seed_sequence):
+    """Worker entry point: simulate one chunk and report who ran it and how long it took"""
+    start = time.perf_counter()
+    result = simulate_games(num_games, num_players, Board.from_key(board_key),
+                            seed=np.random.default_rng(seed_sequence))
+    return os.getpid(), time.perf_counter() - start, result
+
+
+class WorkerStats:
+    def __init__(self):
+        self.games = 0
+        self.seconds = 0.0
+
+    @property
+    def games_per_second(self):
+        return self.games / self.seconds if self.seconds else 0.0
+
+
+def run_tournament(boards, num_games, num_players=1, seed=0, workers=None, chunk_size=250000, on_result=None):
+    """Simulate num_games per board across worker processes.
+
+    Returns (results, worker_stats): one BatchResult per board, in order,
+    and a dict of WorkerStats keyed by worker pid. on_result, if given,
+    is called as on_result(board_index, result) whenever a board's
+    aggregate changes.
+    """
+    workers = workers or os.cpu_count() or 1
+    results = [BatchResult(board, num_players) for board in boards]
+    worker_stats = {}
+
+    # (board index, chunk index, games) for every chunk, generated lazily
+    def chunks():
+        for board_index in range(len(boards)):
+            for chunk_index, start in enumerate(range(0, num_games, chunk_size)):
+                yield board_index, chunk_index, min(chunk_size, num_games - start)
+
+    pending = {}
+    todo = chunks()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        def submit_next():
+            chunk = next(todo, None)
+            if chunk is not None:
+                board_index, chunk_index, games = chunk
+                future = executor.submit(run_chunk, boards[board_index].key(), num_players, games,
+                                         chunk_seed(seed, board_index, chunk_index))
+                pending[future] = board_index
+
+        # Keep two chunks per worker in flight so no core idles between chunks
+        for _ in range(workers * 2):
+            submit_next()
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                board_index = pending.pop(future)
+                pid, seconds, chunk_result = future.result()
+                stats = worker_stats.setdefault(pid, WorkerStats())
+                stats.games += chunk_result.num_games
+                stats.seconds += seconds
+                results[board_index].merge(chunk_result)
+                if on_result:
+                    on_result(board_index, results[board_index])
+                submit_next()
+
+    return results, worker_stats
+
+
+def parse_jumps(text):
+    """Parse "4:14,9:31" into {4: 14, 9: 31}"""
+    jumps = {}
+    for pair in filter(None, text.split(',')):
+        start, end = pair.split(':')
+        jumps[int(start)] = int(end)
+    return jumps
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run simulated Snake and Ladder games on all cores")
+    parser.add_argument('--games', type=int, default=1000000, help="games per board")
+    parser.add_argument('--players', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--chunk-size', type=int, default=250000)
+    parser.add_argument('--ladders', action='append', default=[],
+                        help='candidate ladders as "start:end,..." (repeat with --snakes for several boards)')
+    parser.add_argument('--snakes', action='append', default=[])
+    args = parser.parse_args()
+
+    if len(args.ladders) != len(args.snakes):
+        parser.error("--ladders and --snakes must be given the same number of times")
+    boards = [Board(parse_jumps(ladders), parse_jumps(snakes)) for ladders, snakes in zip(args.ladders, args.snakes)]
+    boards = boards or [Board()]
+
+    start = time.perf_counter()
+    results, worker_stats = run_tournament(boards, args.games, args.players, args.seed,
+                                           args.workers, args.chunk_size)
+    elapsed = time.perf_counter() - start
+
+    for board_index, result in enumerate(results):
+        print(f"=== Board {board_index + 1} ===")
+        print(result.summary())
+    print("=== Workers ===")
+    for pid, stats in sorted(worker_stats.items()):
+        print(f"pid {pid}: {stats.games:,} games, {stats.games_per_second:,.0f} games/sec")
+    total = args.games * len(boards)
+    print(f"Total: {total:,} games in {elapsed:.2f}s ({total / elapsed:,.0f} games/sec)")
+
+
+if __name__ == '__main__':
+    main()
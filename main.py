@@ -1,77 +1,230 @@
+import os
+import random
 import pygame
 import sys
+from collections import deque
+from game import protocol
+from game.board_file import DEFAULT_BOARD_FILE, BoardFile, load_board_file
+from game.client import NetworkClient, ServerDice, play_server_move
+from game.engine import Board
 from game.simple_game import SnakeLadderGame
+from game.logic import CloudLadderGame
+from game.questions import QuestionManager, QuestionScreen
+from game.replay import REPLAYS_DIR, start_recording
+from game.resources import resources
 from game.simple_menu import SimpleMenu
+from game.text_cache import text_cache
+from game.profiler import FrameProfiler
+from game.pacing import ACTIVE, FrameScheduler
+from game.animation import AnimationClock
+from game.scenes import GameScene, MenuScene, QuestionScene, SceneStack
 
 class GameController:
     def __init__(self):
-        pygame.init()
-        self.screen = pygame.display.set_mode((800, 700))
-        pygame.display.set_caption("Snake and Ladder Game")
-        self.font = pygame.font.Font(None, 24)
-        self.big_font = pygame.font.Font(None, 36)
-        self.clock = pygame.time.Clock()
-        
-        self.colors = {
-            'RED': (220, 20, 60),
-            'GOLD': (255, 215, 0),
-            'BEIGE': (245, 245, 220),
-            'WHITE': (255, 255, 255),
-            'BLACK': (0, 0, 0),
-            'DARK_RED': (139, 0, 0)
-        }
-        
-        self.menu = SimpleMenu(self.screen, self.font, self.big_font, self.colors)
+        # One window, one set of fonts and colors for every screen and game
+        self.screen = resources.screen
+        resources.set_caption("Snake and Ladder Game")
+        self.font = resources.font(24)
+        self.big_font = resources.font(36)
+        
+        # Full frame rate only while something animates; see game/pacing.py
+        self.scheduler = FrameScheduler()
+        # Every animation is timed on this clock, ticked once per frame
+        self.clock = AnimationClock()
+        
+        # 'dirty' pushes only the changed screen regions to the display,
+        # 'full' flips the whole window every frame
+        self.render_mode = os.environ.get('SNAKE_LADDER_RENDER', 'dirty')
+        
+        # Frame-time profiler: F3 toggles the overlay
+        self.profiler = FrameProfiler.from_environment()
+        self.profile_font = resources.font(18)
+        
+        self.colors = resources.palette
+        
+        # Board file shared by every game; validated and precomputed once
+        self.board_file = load_board_file(os.environ.get('SNAKE_LADDER_BOARD', DEFAULT_BOARD_FILE))
+        
+        # Every game is logged for replay; SNAKE_LADDER_REPLAYS= (empty) turns logging off
+        self.replays_dir = os.environ.get('SNAKE_LADDER_REPLAYS', REPLAYS_DIR)
+        self.recorder = None
+        
+        # SNAKE_LADDER_SERVER=host:port plays on a game server (python -m game.server),
+        # which rolls the dice; the menu's player count picks the room size
+        self.server_address = os.environ.get('SNAKE_LADDER_SERVER')
+        self.network = None
+        self.network_moves = deque()
+        self.network_started = False
+        
+        self.menu = self.profiler.instrument(SimpleMenu(self.screen, self.font, self.big_font, self.colors, self.clock))
+        self.game = None
+        
+        # Only the scene on top of the stack runs; see game/scenes.py
+        self.scenes = SceneStack()
+        self.menu_scene = MenuScene(self, self.menu)
+        self.scenes.push(self.menu_scene)
+        
+        # Quiz mode: every move has to be earned by answering a question
+        self.questions_file = os.environ.get(
+            'SNAKE_LADDER_QUESTIONS', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'aws_questions.json'))
+        self.questions = None
+        self.question_screen = None
+        self.question_future = None
+        self.question = None
+    
+    def init_game(self, num_players, quiz=False):
+        if self.question_future:
+            self.question_future.result()  # the layout thread is still using the manager
+            self.question_future = None
+        
+        if self.recorder:
+            self.recorder.close()
+            self.recorder = None
+        if self.network:
+            self.network.close()
+            self.network = None
+        if self.server_address and not quiz:
+            self.init_network_game(num_players)
+            return
+        
+        seed = random.randrange(1 << 32)
+        game_class = CloudLadderGame if quiz else SnakeLadderGame
+        self.game = self.profiler.instrument(game_class(num_players, self.board_file, seed, self.clock))
+        if self.replays_dir:
+            self.recorder = start_recording(self.replays_dir, seed, num_players, self.board_file, quiz)
+            self.game.engine.recorder = self.recorder
+        if not quiz:
+            return
+        
+        if self.questions is None:
+            self.questions = QuestionManager(self.questions_file)
+            self.question_screen = QuestionScreen(self.game.screen, self.font, self.big_font, self.colors)
+        else:
+            self.questions.shuffle_questions()
+        self.question_screen.screen = self.game.screen
+        self.request_question()
+    
+    def init_network_game(self, seats):
+        self.network = NetworkClient(self.server_address)
+        rows, columns, ladders, snakes = self.network.join(seats, name=os.environ.get('USER', ''))
+        board = Board(ladders, snakes, rows, columns)
+        board_file = self.board_file if board.key() == self.board_file.board.key() else BoardFile(board)
+        self.game = self.profiler.instrument(SnakeLadderGame(seats, board_file, clock=self.clock))
+        # The local engine animates the server's dice, then settles on its result (play_server_move)
+        self.game.engine.rng = ServerDice()
+        self.network_moves.clear()
+        self.network_started = self.network.started
+        resources.set_caption(
+            f"Snake and Ladder Game - room {self.network.room_id}, {self.game.player_names[self.network.seat]}")
+    
+    def start_game(self, num_players, quiz=False):
+        try:
+            self.init_game(num_players, quiz)
+        except OSError as error:
+            print(f"Could not join a game on {self.server_address}: {error}")
+            if self.network:
+                self.network.close()
+                self.network = None
+            return
+        self.scenes.switch(GameScene(self, self.game))
+    
+    def end_game(self):
+        """Back to the start menu, leaving the current game behind"""
+        if self.recorder:
+            self.recorder.close()
+            self.recorder = None
+        if self.network:
+            self.leave_network_game()
         self.game = None
-        self.game_state = 'menu'
+        resources.set_caption("Snake and Ladder Game")
+        self.scenes.switch(self.menu_scene)
+    
+    def leave_network_game(self):
+        self.network.close()
+        self.network = None
+        resources.set_caption("Snake and Ladder Game")
+    
+    def poll_network(self):
+        for kind, payload in self.network.poll():
+            if kind == protocol.START:
+                self.network_started = True
+            elif kind == protocol.MOVED:
+                self.network_moves.append(protocol.MOVED_BODY.unpack(payload))
+            elif kind == protocol.CLOSED:
+                print("A player left the networked game")
+                self.end_game()
+                return
+        if not self.network.connected:
+            print("Lost the connection to the game server")
+            self.end_game()
+            return
+        
+        # Play the server's moves one at a time, each after the last has animated
+        if self.network_moves and not self.game.animating:
+            play_server_move(self.game, self.network_moves.popleft())
     
-    def init_game(self, num_players):
-        self.game = SnakeLadderGame(num_players)
+    def request_question(self):
+        # Load and lay out the next player's question in the background
+        # while the dice and move animations play
+        self.question_future = self.question_screen.request_question(self.questions, player=self.game.current_player)
     
-    def handle_events(self):
-        for event in pygame.event.get():
+    def ask_question(self):
+        self.question = self.question_screen.take_question(self.question_future)
+        self.question_future = None
+        self.question_screen.reset()
+        self.game.waiting_for_question = True
+        self.scenes.push(QuestionScene(self, self.question_screen, self.question))
+    
+    def finish_question(self):
+        if self.question is None:
+            # Every question has been used: play on without them
+            self.game.waiting_for_question = False
+            self.game.take_turn()
+        else:
+            if self.recorder:
+                self.recorder.answer(self.game.current_player, self.question_screen.result_correct)
+            self.game.answer_question(self.question_screen.result_correct)
+        if not self.game.game_over:
+            self.request_question()
+    
+    def frame_mode(self):
+        """How busy the screen is, which sets the pace of the next frame"""
+        if self.profiler.show_overlay:
+            return ACTIVE  # the frame graph scrolls
+        return self.scenes.pace()
+    
+    def handle_events(self, events):
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
             
-            if event.type == pygame.KEYDOWN:
+            if event.type == pygame.KEYDOWN and event.key in (pygame.K_F11, pygame.K_F3):
                 if event.key == pygame.K_F11:
                     pygame.display.toggle_fullscreen()
-                elif event.key == pygame.K_ESCAPE and self.game_state == 'menu':
-                    return False
-            
-            if self.game_state == 'menu':
-                result = self.menu.handle_input(event)
-                if result == 'exit':
-                    return False
-                elif result:
-                    self.init_game(result)
-                    self.game_state = 'playing'
-            
-            elif self.game_state == 'playing':
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE and not self.game.animating and not self.game.game_over:
-                        dice_roll = self.game.roll_dice()
-                        self.game.move_player(dice_roll)
-                        if not self.game.game_over:
-                            self.game.next_turn()
-                    elif event.key == pygame.K_ESCAPE:
-                        self.game_state = 'menu'
+                else:
+                    self.profiler.toggle_overlay()
+                self.scenes.top.invalidate()  # repaint the window (or what the overlay covered)
+            elif not self.scenes.handle_event(event):
+                return False
         
         return True
     
     def update(self):
-        if self.game:
-            self.game.update()
-        if self.menu:
-            self.menu.update()
+        # Scenes beneath the top one are suspended
+        self.scenes.update()
     
     def draw(self):
-        if self.game_state == 'menu':
-            self.menu.draw()
-        elif self.game_state == 'playing':
-            self.game.draw()
+        dirty_rects = self.scenes.draw()
+        
+        if self.profiler.show_overlay:
+            with self.profiler.phase('overlay'):
+                dirty_rects = dirty_rects + [self.profiler.draw_overlay(self.screen, self.profile_font)]
         
-        pygame.display.flip()
+        with self.profiler.phase('flip'):
+            if self.render_mode == 'full':
+                pygame.display.flip()
+            elif dirty_rects:
+                pygame.display.update(dirty_rects)
     
     def run(self):
         print('🐍 Snake and Ladder Game - Fun & Engaging! 🪜')
@@ -79,11 +232,31 @@ class GameController:
         
         running = True
         while running:
-            running = self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(60)
+            # Idle frames block here until input arrives; a networked game
+            # wakes up often enough to pick up the other players' moves
+            events = self.scheduler.next_frame(self.frame_mode(), 50 if self.network else 1000)
+            self.clock.tick()
+            self.profiler.begin_frame()
+            with self.profiler.phase('events'):
+                running = self.handle_events(events)
+            with self.profiler.phase('update'):
+                self.update()
+            with self.profiler.phase('draw'):
+                self.draw()
+            self.profiler.end_frame()
         
+        self.scheduler.account()
+        print("Frame pacing:")
+        for line in self.scheduler.report():
+            print("  " + line)
+        self.profiler.close()
+        if self.recorder:
+            self.recorder.close()
+        if self.question_screen:
+            self.question_screen.close()
+        stats = text_cache.stats()
+        print(f"Text cache: {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['entries']} surfaces ({stats['bytes'] // 1024} KB)")
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,77 @@
+import os
+import random
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from game import protocol
+from game.animation import AnimationClock
+from game.board_file import BoardFile
+from game.client import ServerDice, play_server_move
+from game.engine import Board
+from game.server import Room
+from game.simple_game import SnakeLadderGame
+
+
+def moved_stream(room, limit=500):
+    """Roll for whoever's turn it is until the server's game ends; yields each MOVED body"""
+    frames = protocol.FrameBuffer()
+    for _ in range(limit):
+        if room.engine.game_over:
+            return
+        for kind, payload in frames.feed(room.roll(room.engine.current_player)):
+            assert kind == protocol.MOVED
+            yield protocol.MOVED_BODY.unpack(payload)
+
+
+def local_game(seats, board):
+    now = [0.0]
+    game = SnakeLadderGame(seats, BoardFile(board), clock=AnimationClock(source=lambda: now[0]))
+    game.engine.rng = ServerDice()
+    return game, now
+
+
+def assert_matches(game, engine):
+    assert game.player_positions == engine.player_positions
+    assert game.current_player == engine.current_player
+    assert game.game_over == engine.game_over
+    assert game.winner == engine.winner
+
+
+def test_server_moves_win_over_a_different_local_board():
+    # The server plays the classic board; the local copy has no snakes or ladders
+    room = Room(1, 3, BoardFile(Board()), random.Random(7))
+    game, now = local_game(3, Board({}, {}))
+    moves = 0
+    for moved in moved_stream(room):
+        play_server_move(game, moved)
+        assert_matches(game, room.engine)
+        # Let the animation finish before the next move, as the window does
+        now[0] += 10.0
+        game.clock.tick()
+        game.update()
+        moves += 1
+    assert room.engine.game_over and moves > 3
+    assert game.game_over and game.winner == room.engine.winner
+
+
+def test_server_player_moves_even_when_the_local_turn_differs():
+    room = Room(1, 2, BoardFile(Board()), random.Random(3))
+    game, _ = local_game(2, Board({}, {}))
+    game.engine.current_player = 1
+    moved = next(moved_stream(room))
+    play_server_move(game, moved)
+    assert game.player_positions[1] == 1
+    assert_matches(game, room.engine)
+
+
+def test_server_win_ends_the_local_game():
+    # One roll from the end on the server; the local board sends that square down a snake
+    room = Room(1, 2, BoardFile(Board({}, {}, rows=2, columns=5)), random.Random(1))
+    room.engine.player_positions[0] = 9
+    room.engine.rng = ServerDice()
+    room.engine.rng.values.append(1)
+    game, _ = local_game(2, Board({}, {10: 2}, rows=2, columns=5))
+    game.engine.player_positions[0] = 9
+    play_server_move(game, next(moved_stream(room)))
+    assert game.game_over and game.winner == 0
+    assert game.player_positions[0] == 10